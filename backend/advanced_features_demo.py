@@ -4,6 +4,9 @@ Portfolio Manager - Comprehensive Advanced Features Demo
 ======================================================
 This script demonstrates advanced portfolio management capabilities using
 the portfolio-manager package methods with professional visualizations and analytics.
+
+Pass --no-show to save the figures as PNGs under ./demo_figures instead of
+displaying them.
 """
 
 import sys
@@ -20,7 +23,7 @@ if sys.platform == "win32":
 
 # Core imports
 try:
-    from portfolio_manager import Portfolio, Asset, YFinanceProvider
+    from portfolio_manager import Portfolio, Asset
     from portfolio_manager.core.asset import AssetType
     from portfolio_manager.analytics.performance import PerformanceAnalytics
     from portfolio_manager.analytics.risk import RiskAnalytics
@@ -31,10 +34,9 @@ try:
         annualize_rets,
         annualize_vol,
         sharpe_ratio,
-        drawdown,
-        semideviation,
-        var_historic,
-        cvar_historic,
+        drawdown_from_wealth,
+        var_cvar_historic,
+        percentiles,
         var_gaussian,
         portfolio_return,
         portfolio_vol,
@@ -44,8 +46,7 @@ try:
         run_cppi,
         summary_stats,
         gbm,
-        skewness,
-        kurtosis,
+        moments,
         compound,
     )
 
@@ -54,25 +55,74 @@ except ImportError as e:
     print(f"Import error: {e}")
     sys.exit(1)
 
+# Headless runs (--no-show) save figures to disk instead of opening windows
+NO_SHOW = "--no-show" in sys.argv
+FIGURE_DIR = Path("demo_figures")
+
 # Standard libraries
 import pandas as pd
 import numpy as np
+import matplotlib
+
+if NO_SHOW:
+    # Agg skips GUI event-loop setup entirely
+    matplotlib.use("Agg")
 import matplotlib.pyplot as plt
-import seaborn as sns
 from datetime import datetime, timedelta
-from scipy import stats
 import time
-import psutil
+import hashlib
+import math
+from collections import namedtuple
+import yfinance as yf
 
-# Set up plotting
+# Numba is optional; without it the Monte Carlo section uses the numpy gbm
 try:
-    plt.style.use("seaborn-v0_8")
-except:
-    plt.style.use("default")
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+_plotting_ready = False
+
 
-sns.set_palette("husl")
-plt.rcParams["figure.figsize"] = (14, 8)
-plt.rcParams["font.size"] = 11
+def setup_plotting():
+    """Apply the demo's plot styling; seaborn is only imported once a figure is needed."""
+    global _plotting_ready
+    if _plotting_ready:
+        return
+    import seaborn as sns
+
+    try:
+        plt.style.use("seaborn-v0_8")
+    except:
+        plt.style.use("default")
+
+    sns.set_palette("husl")
+    plt.rcParams["figure.figsize"] = (14, 8)
+    plt.rcParams["font.size"] = 11
+    _plotting_ready = True
+
+
+def new_figure(**kwargs):
+    setup_plotting()
+    return plt.figure(**kwargs)
+
+
+def show_figure(fig, name):
+    """Display fig (or save it under FIGURE_DIR with --no-show), then free its buffers."""
+    if NO_SHOW:
+        FIGURE_DIR.mkdir(exist_ok=True)
+        fig.savefig(FIGURE_DIR / f"{name}.png", dpi=100)
+    else:
+        plt.show()
+    plt.close(fig)
 
 print("=" * 80)
 print("PORTFOLIO MANAGER - COMPREHENSIVE ADVANCED FEATURES DEMO")
@@ -99,8 +149,6 @@ def ensure_naive_datetime(dt):
 print("SECTION 1: ADVANCED DATA INTEGRATION")
 print("=" * 50)
 
-provider = YFinanceProvider()
-
 # Define comprehensive asset universe
 asset_universe = {
     "Large Cap Tech": {
@@ -130,6 +178,12 @@ for asset_class, assets in asset_universe.items():
         all_symbols.append(symbol)
         asset_classes[symbol] = asset_class
 
+# Reverse index for O(1) name lookups in the fetch loop
+symbol_names = {
+    symbol: name for class_assets in asset_universe.values()
+    for symbol, name in class_assets.items()
+}
+
 print(
     f"Asset Universe: {len(all_symbols)} instruments across {len(asset_universe)} asset classes"
 )
@@ -157,11 +211,100 @@ print(f"\nFetching data for {len(key_symbols)} key assets:")
 asset_data = {}
 assets = {}
 
-for i, symbol in enumerate(key_symbols):
+
+PRICE_CACHE_DIR = Path.home() / ".cache" / "portfolio_manager"
+
+
+def _price_cache_paths(sym, s, e):
+    """Parquet and pickle cache locations for one (symbol, start, end) window."""
+    key = hashlib.md5(f"{sym}{s}{e}".encode()).hexdigest()
+    parquet_path = PRICE_CACHE_DIR / f"{sym}_{s}_{e}_{key[:8]}.parquet"
+    return parquet_path, parquet_path.with_suffix(".pkl")
+
+
+def _read_cached_prices(sym, s, e):
+    parquet_path, pickle_path = _price_cache_paths(sym, s, e)
+    try:
+        if parquet_path.exists():
+            return pd.read_parquet(parquet_path)
+        if pickle_path.exists():
+            return pd.read_pickle(pickle_path)
+    except Exception:
+        pass  # Corrupt cache entry, treat as a miss and re-download
+    return None
+
+
+def _write_cached_prices(sym, s, e, df):
+    parquet_path, pickle_path = _price_cache_paths(sym, s, e)
+    try:
+        df.to_parquet(parquet_path, engine="pyarrow", compression="zstd")
+    except ImportError:
+        df.to_pickle(pickle_path)
+
+
+def fetch_prices(symbols, s, e):
+    """Return {symbol: OHLCV frame or exception} for every symbol.
+
+    History for a fixed (symbol, start, end) window does not change, so hits
+    come from the on-disk cache (zstd parquet when pyarrow is available, a
+    pickle otherwise). All misses are fetched in a single yf.download call
+    rather than one Ticker.history request per symbol.
+    """
+    PRICE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    results = {}
+    missing = []
+    for sym in symbols:
+        cached = _read_cached_prices(sym, s, e)
+        if cached is None:
+            missing.append(sym)
+        else:
+            results[sym] = cached
+
+    if missing:
+        try:
+            prices = yf.download(
+                missing,
+                start=s,
+                end=e,
+                group_by="ticker",
+                auto_adjust=True,
+                threads=True,
+                progress=False,
+            )
+        except Exception as exc:
+            prices = None
+            for sym in missing:
+                results[sym] = exc
+
+        if prices is not None:
+            downloaded = set(prices.columns.get_level_values(0))
+            for sym in missing:
+                if sym not in downloaded:
+                    results[sym] = ValueError(f"No data found for symbol {sym}")
+                    continue
+                df = prices[sym].dropna(how="all")
+                # Match YFinanceProvider.get_price_data's column layout
+                df = df.reindex(columns=["Open", "High", "Low", "Close", "Volume"])
+                if not df.empty:
+                    _write_cached_prices(sym, s, e, df)
+                results[sym] = df
+
+    for sym, df in results.items():
+        # Cached frames may come from Ticker.history (tz-aware) or yf.download
+        if not isinstance(df, Exception) and getattr(df.index, "tz", None) is not None:
+            df.index = df.index.tz_localize(None)
+    return results
+
+
+price_frames = fetch_prices(key_symbols, start_date.date(), end_date.date())
+fetch_results = [(symbol, price_frames[symbol]) for symbol in key_symbols]
+
+for i, (symbol, data) in enumerate(fetch_results):
     try:
         print(f"  {i+1:2d}. {symbol:6s}...", end=" ")
 
-        data = provider.get_price_data(symbol, start_date.date(), end_date.date())
+        if isinstance(data, Exception):
+            raise data
 
         if not data.empty and len(data) > 100:
             asset_data[symbol] = data
@@ -173,11 +316,7 @@ for i, symbol in enumerate(key_symbols):
             else:
                 asset_type = AssetType.ETF
 
-            asset_name = None
-            for class_assets in asset_universe.values():
-                if symbol in class_assets:
-                    asset_name = class_assets[symbol]
-                    break
+            asset_name = symbol_names.get(symbol)
 
             asset = Asset(
                 symbol=symbol,
@@ -230,6 +369,18 @@ for symbol, weight in strategic_weights.items():
 print(f"Portfolio: {strategic_portfolio.name}")
 print(f"Assets: {len(strategic_portfolio.assets)}")
 
+# Canonical asset order and aligned weight vector for the numeric sections
+weight_order = list(strategic_portfolio.weights)
+weight_index = {symbol: i for i, symbol in enumerate(weight_order)}
+w_vec = np.fromiter(
+    (strategic_portfolio.weights[s] for s in weight_order),
+    dtype=np.float64,
+    count=len(weight_order),
+)
+
+# Daily returns are reused by the efficient frontier and attribution sections
+returns_cache = {symbol: assets[symbol].get_returns() for symbol in assets}
+
 # Asset class allocation
 class_weights = {}
 for symbol, weight in strategic_portfolio.weights.items():
@@ -252,6 +403,19 @@ for asset_class, weight in sorted(
 print(f"\nSECTION 3: PERFORMANCE ANALYTICS")
 print("=" * 50)
 
+ReturnStats = namedtuple("ReturnStats", "mean std ann_ret ann_vol")
+
+
+def compute_stats(series, periods_per_year=252):
+    """Summarize a return series once so later sections reuse the scalars."""
+    return ReturnStats(
+        mean=series.mean(),
+        std=series.std(),
+        ann_ret=annualize_rets(series, periods_per_year),
+        ann_vol=annualize_vol(series, periods_per_year),
+    )
+
+
 # Initialize performance analytics
 perf_analytics = PerformanceAnalytics(strategic_portfolio)
 print("[OK] PerformanceAnalytics initialized")
@@ -261,6 +425,7 @@ portfolio_returns = strategic_portfolio.get_portfolio_returns()
 
 if not portfolio_returns.empty:
     print(f"Portfolio return series: {len(portfolio_returns)} observations")
+    portfolio_stats = compute_stats(portfolio_returns)
 
     # Use package methods for performance metrics
     try:
@@ -271,16 +436,13 @@ if not portfolio_returns.empty:
         max_dd_info = perf_analytics.max_drawdown()
         calmar = perf_analytics.calmar_ratio()
 
-        # Use risk functions from the package for additional metrics
-        skew = skewness(portfolio_returns)
-        kurt = kurtosis(portfolio_returns)
+        # Use risk functions from the package for additional metrics;
+        # skewness, kurtosis and semideviation come from one fused pass
+        skew, kurt, semi_dev = moments(portfolio_returns)
 
         # NEW: Use compound returns function
         total_compound_return = compound(portfolio_returns)
 
-        # NEW: Use semideviation function
-        semi_dev = semideviation(portfolio_returns)
-
         print(f"\nPERFORMANCE METRICS (Using Portfolio Manager Package):")
         print(f"  Annual Return:       {annual_return:8.2%}")
         print(f"  Annual Volatility:   {annual_vol:8.2%}")
@@ -314,8 +476,9 @@ try:
             print(f"[OK] Correlation matrix: {correlation_matrix.shape}")
 
             corr_values = correlation_matrix.values
-            mask = ~np.eye(corr_values.shape[0], dtype=bool)
-            corr_flat = corr_values[mask]
+            # Each unique pair once: the matrix is symmetric with a unit diagonal
+            iu = np.triu_indices(corr_values.shape[0], k=1)
+            corr_flat = corr_values[iu]
 
             print(f"  Highest correlation: {corr_flat.max():.3f}")
             print(f"  Lowest correlation:  {corr_flat.min():.3f}")
@@ -351,9 +514,13 @@ if "portfolio_returns" in locals() and not portfolio_returns.empty:
     print(f"{'Confidence':<12} {'Hist VaR':>10} {'Hist CVaR':>10} {'Gauss VaR':>12}")
     print("-" * 50)
 
+    # One partition of the return series serves every confidence level
+    hist_tail = var_cvar_historic(
+        portfolio_returns, levels=[(1 - conf) * 100 for conf in confidence_levels]
+    )
+
     for conf in confidence_levels:
-        hist_var = var_historic(portfolio_returns, level=(1 - conf) * 100)
-        hist_cvar = cvar_historic(portfolio_returns, level=(1 - conf) * 100)
+        hist_var, hist_cvar = hist_tail[(1 - conf) * 100]
         # NEW: Use var_gaussian function
         gauss_var = var_gaussian(portfolio_returns, level=(1 - conf) * 100)
 
@@ -374,19 +541,23 @@ returns_data = {}
 for symbol in optimization_symbols:
     if symbol in assets:
         try:
-            returns = assets[symbol].get_returns()
+            returns = returns_cache[symbol]
             if not returns.empty:
                 returns_data[symbol] = returns
         except Exception:
             continue
 
 if len(returns_data) >= 4:  # Need at least 4 assets for meaningful efficient frontier
-    returns_df = pd.DataFrame(returns_data).dropna()
+    # Inner join aligns dates without materializing the NaN-padded outer frame
+    returns_df = pd.concat(returns_data, axis=1, join="inner")
 
     if not returns_df.empty:
         # Calculate expected returns and covariance matrix
         expected_returns = returns_df.mean() * 252  # Annualized
         cov_matrix = returns_df.cov() * 252  # Annualized
+        # Materialize contiguous float64 buffers once for every BLAS call below
+        mu_arr = np.ascontiguousarray(expected_returns.values, dtype=np.float64)
+        cov_arr = np.ascontiguousarray(cov_matrix.values, dtype=np.float64)
 
         print(f"Efficient Frontier Analysis for {len(returns_df.columns)} assets:")
 
@@ -394,32 +565,23 @@ if len(returns_data) >= 4:  # Need at least 4 assets for meaningful efficient fr
         try:
             # Generate efficient frontier using package functions
             n_points = 50
-            weights_list = optimal_weights(
-                n_points, expected_returns.values, cov_matrix.values
-            )
+            weights_list = optimal_weights(n_points, mu_arr, cov_arr)
 
-            # Calculate portfolio metrics for each point on frontier
-            frontier_returns = []
-            frontier_vols = []
-
-            for weights in weights_list:
-                # NEW: Use portfolio_return and portfolio_vol functions
-                port_ret = portfolio_return(weights, expected_returns.values)
-                port_vol = portfolio_vol(weights, cov_matrix.values)
-                frontier_returns.append(port_ret)
-                frontier_vols.append(port_vol)
+            # Calculate portfolio metrics for every frontier point at once:
+            # R = W @ mu and sigma^2 = diag(W C W^T)
+            W = np.vstack(weights_list)
+            frontier_returns = W @ mu_arr
+            frontier_vols = np.sqrt(np.einsum("ij,jk,ik->i", W, cov_arr, W))
 
             # NEW: Calculate special portfolios using package functions
-            msr_weights = msr(
-                0.02, expected_returns.values, cov_matrix.values
-            )  # 2% risk-free rate
-            gmv_weights = gmv(cov_matrix.values)
+            msr_weights = msr(0.02, mu_arr, cov_arr)  # 2% risk-free rate
+            gmv_weights = gmv(cov_arr)
 
-            msr_return = portfolio_return(msr_weights, expected_returns.values)
-            msr_vol = portfolio_vol(msr_weights, cov_matrix.values)
+            msr_return = portfolio_return(msr_weights, mu_arr)
+            msr_vol = portfolio_vol(msr_weights, cov_arr)
 
-            gmv_return = portfolio_return(gmv_weights, expected_returns.values)
-            gmv_vol = portfolio_vol(gmv_weights, cov_matrix.values)
+            gmv_return = portfolio_return(gmv_weights, mu_arr)
+            gmv_vol = portfolio_vol(gmv_weights, cov_arr)
 
             print(f"\nSpecial Portfolios (using package functions):")
             print(f"Maximum Sharpe Ratio Portfolio:")
@@ -432,7 +594,7 @@ if len(returns_data) >= 4:  # Need at least 4 assets for meaningful efficient fr
             print(f"  Volatility:      {gmv_vol:.2%}")
 
             # Visualize efficient frontier
-            plt.figure(figsize=(12, 8))
+            fig = new_figure(figsize=(12, 8))
             plt.plot(
                 frontier_vols,
                 frontier_returns,
@@ -475,7 +637,7 @@ if len(returns_data) >= 4:  # Need at least 4 assets for meaningful efficient fr
             plt.legend(bbox_to_anchor=(1.05, 1), loc="upper left")
             plt.grid(True, alpha=0.3)
             plt.tight_layout()
-            plt.show()
+            show_figure(fig, "efficient_frontier")
 
             print("[OK] Efficient frontier visualization completed!")
 
@@ -533,44 +695,74 @@ if optimization_assets:
 print(f"\nSECTION 7: MONTE CARLO SIMULATION")
 print("=" * 50)
 
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _gbm_kernel(z, mu, sigma, s0, dt, out):
+    """Fill out[t, j] with GBM price paths from pre-drawn normals z, same discretization as package gbm."""
+    loc = (1 + mu) ** dt
+    scale = sigma * math.sqrt(dt)
+    for j in prange(z.shape[1]):
+        s = s0
+        out[0, j] = s
+        for t in range(1, z.shape[0]):
+            s *= loc + scale * z[t, j]
+            out[t, j] = s
+
+
 if "portfolio_returns" in locals() and not portfolio_returns.empty:
     # Use package GBM function
     print("Running Monte Carlo simulation using package GBM function...")
 
-    # Calculate parameters from portfolio returns
-    annual_ret = annualize_rets(portfolio_returns, 252)
-    annual_vol_sim = annualize_vol(portfolio_returns, 252)
-
-    # Run simulation using package function
-    mc_results = gbm(
-        n_years=1,
-        n_scenarios=1000,
-        mu=annual_ret,
-        sigma=annual_vol_sim,
-        steps_per_year=252,
-        s_0=100,
-        prices=False,
-    )
-
-    # Get final returns
-    mc_results_df = pd.DataFrame(mc_results)
+    # Parameters come from the Section 3 summary of the portfolio returns
+    annual_ret = portfolio_stats.ann_ret
+    annual_vol_sim = portfolio_stats.ann_vol
+
+    # Simulate price paths; the numba kernel fuses the compounding loop.
+    # Both branches draw from the same seeded PCG64 stream in one batch, so
+    # they produce the same paths
+    n_steps, n_scenarios, s_0 = 252, 1000, 100.0
+    # The paths only feed summary statistics and plots, so float32 is plenty
+    if NUMBA_AVAILABLE:
+        z = np.random.default_rng(0).standard_normal((n_steps + 1, n_scenarios), dtype=np.float32)
+        mc_paths = np.empty_like(z)
+        _gbm_kernel(z, annual_ret, annual_vol_sim, s_0, 1 / 252, mc_paths)
+    else:
+        mc_paths = gbm(
+            n_years=1,
+            n_scenarios=n_scenarios,
+            mu=annual_ret,
+            sigma=annual_vol_sim,
+            steps_per_year=252,
+            s_0=s_0,
+            prices=True,
+            dtype=np.float32,
+            rng=np.random.default_rng(0),
+        ).values
+
+    # Cumulative returns relative to the starting value
+    mc_results_df = pd.DataFrame(mc_paths / s_0 - 1)
     final_returns = mc_results_df.iloc[-1]
+    p5_return, p95_return = percentiles(final_returns, [5, 95])
 
     print(f"\nMonte Carlo Results (using package gbm function):")
     print(f"  Mean return:     {final_returns.mean():.4f}")
     print(f"  Std deviation:   {final_returns.std():.4f}")
-    print(f"  5th percentile:  {np.percentile(final_returns, 5):.4f}")
-    print(f"  95th percentile: {np.percentile(final_returns, 95):.4f}")
+    print(f"  5th percentile:  {p5_return:.4f}")
+    print(f"  95th percentile: {p95_return:.4f}")
 
     # Visualize Monte Carlo results
-    plt.figure(figsize=(12, 6))
+    fig = new_figure(figsize=(12, 6))
 
     plt.subplot(1, 2, 1)
-    # Plot some simulation paths
-    for i in range(min(50, mc_results_df.shape[1])):
-        plt.plot(
-            mc_results_df.index, mc_results_df.iloc[:, i], alpha=0.3, linewidth=0.5
-        )
+    # Plot some simulation paths; a 2-D y array draws every column in one call
+    plt.plot(
+        mc_results_df.index.values,
+        mc_results_df.iloc[:, :50].values,
+        alpha=0.3,
+        linewidth=0.5,
+        color="C0",
+        rasterized=True,
+    )
     plt.plot(
         mc_results_df.index,
         mc_results_df.mean(axis=1),
@@ -590,13 +782,13 @@ if "portfolio_returns" in locals() and not portfolio_returns.empty:
         final_returns.mean(), color="red", linestyle="--", linewidth=2, label="Mean"
     )
     plt.axvline(
-        np.percentile(final_returns, 5),
+        p5_return,
         color="orange",
         linestyle="--",
         label="5th %ile",
     )
     plt.axvline(
-        np.percentile(final_returns, 95),
+        p95_return,
         color="orange",
         linestyle="--",
         label="95th %ile",
@@ -608,7 +800,7 @@ if "portfolio_returns" in locals() and not portfolio_returns.empty:
     plt.grid(True, alpha=0.3)
 
     plt.tight_layout()
-    plt.show()
+    show_figure(fig, "monte_carlo")
 
     print("[OK] Monte Carlo visualization completed!")
 
@@ -627,8 +819,8 @@ if "portfolio_returns" in locals() and not portfolio_returns.empty:
         risky_r=portfolio_returns, m=3, start=1000, floor=0.8, riskfree_rate=0.03
     )
 
-    final_wealth = cppi_results["Wealth"].iloc[-1].iloc[0]
-    risky_final = cppi_results["Risky Wealth"].iloc[-1].iloc[0]
+    final_wealth = cppi_results["Wealth"].iat[-1, 0]
+    risky_final = cppi_results["Risky Wealth"].iat[-1, 0]
 
     print(f"\nCPPI Results (using package run_cppi function):")
     print(f"  CPPI Final Wealth:  ${final_wealth:,.2f}")
@@ -636,7 +828,7 @@ if "portfolio_returns" in locals() and not portfolio_returns.empty:
     print(f"  CPPI Outperformance: {(final_wealth/risky_final - 1):+.2%}")
 
     # Visualize CPPI strategy
-    plt.figure(figsize=(14, 10))
+    fig = new_figure(figsize=(14, 10))
 
     plt.subplot(2, 2, 1)
     plt.plot(
@@ -681,8 +873,8 @@ if "portfolio_returns" in locals() and not portfolio_returns.empty:
     plt.grid(True, alpha=0.3)
 
     plt.subplot(2, 2, 4)
-    drawdown_cppi = drawdown(cppi_results["Wealth"].iloc[:, 0])
-    drawdown_risky = drawdown(cppi_results["Risky Wealth"].iloc[:, 0])
+    drawdown_cppi = drawdown_from_wealth(cppi_results["Wealth"].iloc[:, 0])
+    drawdown_risky = drawdown_from_wealth(cppi_results["Risky Wealth"].iloc[:, 0])
     plt.plot(
         drawdown_cppi.index,
         drawdown_cppi["Drawdown"] * 100,
@@ -701,7 +893,7 @@ if "portfolio_returns" in locals() and not portfolio_returns.empty:
     plt.grid(True, alpha=0.3)
 
     plt.tight_layout()
-    plt.show()
+    show_figure(fig, "cppi")
 
     print("[OK] CPPI visualization completed!")
 
@@ -734,31 +926,34 @@ asset_returns = {}
 for symbol in strategic_portfolio.weights.keys():
     if symbol in assets:
         try:
-            returns = assets[symbol].get_returns()
+            returns = returns_cache[symbol]
             if not returns.empty:
                 asset_returns[symbol] = returns
         except Exception as e:
             continue
 
 if asset_returns:
-    returns_df = pd.DataFrame(asset_returns).dropna()
+    returns_df = pd.concat(asset_returns, axis=1, join="inner")
 
     if not returns_df.empty:
-        # Calculate individual performance using package functions
-        individual_stats = {}
-
-        for symbol in returns_df.columns:
-            if symbol in strategic_portfolio.weights:
-                weight = strategic_portfolio.weights[symbol]
-                series = returns_df[symbol]
-
-                individual_stats[symbol] = {
-                    "weight": weight,
-                    "ann_return": annualize_rets(series, 252),
-                    "ann_vol": annualize_vol(series, 252),
-                    "sharpe": sharpe_ratio(series, 0.03, 252),
-                    "contribution": weight * annualize_rets(series, 252),
-                }
+        # Calculate individual performance using package functions; they
+        # operate column-wise, so one call covers every asset at once
+        asset_weights = w_vec[[weight_index[s] for s in returns_df.columns]]
+        ann_rets = annualize_rets(returns_df, 252).values
+        ann_vols = annualize_vol(returns_df, 252).values
+        ann_sharpes = sharpe_ratio(returns_df, 0.03, 252).values
+        ann_contribs = asset_weights * ann_rets
+
+        individual_stats = {
+            symbol: {
+                "weight": asset_weights[i],
+                "ann_return": ann_rets[i],
+                "ann_vol": ann_vols[i],
+                "sharpe": ann_sharpes[i],
+                "contribution": ann_contribs[i],
+            }
+            for i, symbol in enumerate(returns_df.columns)
+        }
 
         print(f"INDIVIDUAL ASSET PERFORMANCE (using package functions):")
         print(
@@ -775,7 +970,7 @@ if asset_returns:
             )
 
         # Create visualization of performance attribution
-        plt.figure(figsize=(14, 8))
+        fig = new_figure(figsize=(14, 8))
 
         # Performance attribution chart
         plt.subplot(2, 2, 1)
@@ -821,7 +1016,7 @@ if asset_returns:
         plt.grid(True, alpha=0.3)
 
         plt.tight_layout()
-        plt.show()
+        show_figure(fig, "performance_attribution")
 
         print("[OK] Performance attribution visualization completed!")
 
@@ -832,32 +1027,35 @@ if asset_returns:
 print(f"\nSECTION 11: FINAL VALIDATION")
 print("=" * 50)
 
+# Snapshot the module namespace once; set lookups replace per-check locals() copies
+defined = set(globals())
+
 # Validation summary
 features = {
     "Performance Analytics": {
-        "Returns": "portfolio_returns" in locals(),
-        "Package Sharpe": "sharpe" in locals(),
-        "Package Compound": "total_compound_return" in locals(),
-        "Package Semideviation": "semi_dev" in locals(),
+        "Returns": "portfolio_returns" in defined,
+        "Package Sharpe": "sharpe" in defined,
+        "Package Compound": "total_compound_return" in defined,
+        "Package Semideviation": "semi_dev" in defined,
     },
     "Risk Analytics": {
-        "Package VaR Historic": "hist_var" in locals(),
-        "Package VaR Gaussian": "gauss_var" in locals(),
-        "Package CVaR": "hist_cvar" in locals(),
+        "Package VaR Historic": "hist_var" in defined,
+        "Package VaR Gaussian": "gauss_var" in defined,
+        "Package CVaR": "hist_cvar" in defined,
     },
     "Efficient Frontier": {
-        "Package Optimal Weights": "weights_list" in locals(),
-        "Package Portfolio Vol/Return": "frontier_returns" in locals(),
-        "Package MSR": "msr_weights" in locals(),
-        "Package GMV": "gmv_weights" in locals(),
+        "Package Optimal Weights": "weights_list" in defined,
+        "Package Portfolio Vol/Return": "frontier_returns" in defined,
+        "Package MSR": "msr_weights" in defined,
+        "Package GMV": "gmv_weights" in defined,
     },
     "Optimization": {
-        "Package Mean-Variance": "optimal_result" in locals(),
-        "Package Risk Parity": "rp_result" in locals(),
+        "Package Mean-Variance": "optimal_result" in defined,
+        "Package Risk Parity": "rp_result" in defined,
     },
-    "Monte Carlo": {"Package GBM": "mc_results" in locals()},
-    "CPPI Strategy": {"Package CPPI": "cppi_results" in locals()},
-    "Summary": {"Package Summary Stats": "summary" in locals()},
+    "Monte Carlo": {"Package GBM": "mc_results_df" in defined},
+    "CPPI Strategy": {"Package CPPI": "cppi_results" in defined},
+    "Summary": {"Package Summary Stats": "summary" in defined},
     "Visualizations": {
         "Efficient Frontier Plot": True,
         "Monte Carlo Plots": True,
@@ -898,7 +1096,7 @@ else:
 print(f"STATUS: {status}")
 
 # Performance highlights
-if "annual_return" in locals():
+if "annual_return" in defined:
     print(f"\nFINAL PERFORMANCE HIGHLIGHTS:")
     print(f"  Annual return:       {annual_return:.2%}")
     print(f"  Sharpe ratio:        {sharpe:.3f}")
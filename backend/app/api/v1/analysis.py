@@ -9,10 +9,24 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from app.services.portfolio_analysis import AdvancedPortfolioAnalytics
 from app.core.redis_client import get_redis_client
+from app.core.responses import ORJSONResponse
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+# Analytics payloads are large float-heavy dicts; orjson serializes them (and
+# any numpy scalars/arrays) straight to bytes, skipping jsonable_encoder
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+async def _analysis_cache_key(redis_client, portfolio_id: int, name: str, *params) -> str:
+    """
+    Build a cache key for an analysis result.
+
+    The key embeds the portfolio version counter, which holding changes bump,
+    so stale results stop matching without deleting every parameter variant.
+    """
+    version = await redis_client.get(f"portfolio:{portfolio_id}:version") or 0
+    return ":".join([f"portfolio:{portfolio_id}:{name}:v{version}", *map(str, params)])
 
 
 @router.get("/portfolios/{portfolio_id}/metrics")
@@ -21,8 +35,8 @@ async def get_portfolio_metrics(
     db: AsyncSession = Depends(get_db),
 ):
     """Get portfolio metrics with Redis caching for faster response."""
-    cache_key = f"portfolio:{portfolio_id}:metrics"
     redis_client = await get_redis_client()
+    cache_key = await _analysis_cache_key(redis_client, portfolio_id, "metrics")
 
     # Try cache first
     cached_metrics = await redis_client.get(cache_key)
@@ -48,8 +62,8 @@ async def get_sector_allocation(
 ):
     """Get portfolio sector allocation with currency conversion and caching."""
     # Include currency in cache key
-    cache_key = f"portfolio:{portfolio_id}:sector-allocation:{currency or 'default'}"
     redis_client = await get_redis_client()
+    cache_key = await _analysis_cache_key(redis_client, portfolio_id, "sector-allocation", currency or "default")
 
     # Try cache first
     cached_allocation = await redis_client.get(cache_key)
@@ -74,8 +88,8 @@ async def get_efficient_frontier(
     db: AsyncSession = Depends(get_db),
 ):
     """Get efficient frontier data with currency conversion and caching."""
-    cache_key = f"portfolio:{portfolio_id}:efficient-frontier:{currency or 'default'}"
     redis_client = await get_redis_client()
+    cache_key = await _analysis_cache_key(redis_client, portfolio_id, "efficient-frontier", currency or "default")
 
     # Try cache first
     cached_data = await redis_client.get(cache_key)
@@ -102,8 +116,10 @@ async def run_monte_carlo_simulation(
     time_horizon: int = 252,
 ):
     """Run a Monte Carlo simulation with currency conversion and caching."""
-    cache_key = f"portfolio:{portfolio_id}:monte-carlo:{currency or 'default'}:{scenarios}:{time_horizon}"
     redis_client = await get_redis_client()
+    cache_key = await _analysis_cache_key(
+        redis_client, portfolio_id, "monte-carlo", currency or "default", scenarios, time_horizon
+    )
 
     # Try cache first
     cached_data = await redis_client.get(cache_key)
@@ -133,8 +149,10 @@ async def run_cppi_simulation(
     time_horizon: int = 252,
 ):
     """Run a CPPI simulation with currency conversion and caching."""
-    cache_key = f"portfolio:{portfolio_id}:cppi:{currency or 'default'}:{multiplier}:{floor}:{time_horizon}"
     redis_client = await get_redis_client()
+    cache_key = await _analysis_cache_key(
+        redis_client, portfolio_id, "cppi", currency or "default", multiplier, floor, time_horizon
+    )
 
     # Try cache first
     cached_data = await redis_client.get(cache_key)
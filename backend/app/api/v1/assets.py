@@ -4,49 +4,46 @@ API endpoints for asset onboarding (ticker, quantity, unit cost).
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Body, Request, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, update, insert
+from sqlalchemy.orm import selectinload, joinedload
 from app.core.database import get_db
+from app.core.responses import ORJSONResponse
+from app.core.cache import invalidate_portfolio_transaction_caches
 from app.models.asset import Asset
 from app.models.holding import Holding
 from app.models.transaction import Transaction, TransactionType
 from app.schemas.holding_extended import AssetSellRequest
 from app.services.finance_service import FinanceService
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from typing import List, Optional, Dict, Tuple
-from datetime import datetime
+from datetime import datetime, timezone
 import logging
-import csv
-import io
+from functools import lru_cache
 import asyncio
+import pandas as pd
 
 from app.utils.dependencies import get_current_active_user # Import current user dependency
 from app.models import User # Import User model
-from app.crud import get_user_portfolio, create_portfolio # Import portfolio CRUD operations
+from app.crud import get_user_portfolio, create_portfolio, upsert_holdings, create_assets, get_assets_by_tickers # Import portfolio CRUD operations
 from app.schemas import PortfolioCreate # Import schema for creating portfolio
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Cap on concurrent market-data requests per onboarding call, so a large CSV
+# does not fire hundreds of upstream requests at once
+MAX_CONCURRENT_FETCHES = 10
 
-async def invalidate_portfolio_transaction_caches(portfolio_id: int):
-    """Invalidate cached portfolio data after buy/sell cash mutations."""
-    try:
-        from app.core.redis_client import get_redis_client
-
-        redis_client = await get_redis_client()
-        for currency in ["USD", "CAD"]:
-            await redis_client.delete(f"dashboard:overview:{portfolio_id}:{currency}")
-            await redis_client.delete(f"portfolio:{portfolio_id}:holdings:{currency}")
-            await redis_client.delete(f"portfolio:{portfolio_id}:live_market:{currency}")
-            await redis_client.delete(f"portfolio:{portfolio_id}:live_market:v2:{currency}")
-            await redis_client.delete(f"portfolio:{portfolio_id}:live_market:v3:{currency}")
-        await redis_client.delete(f"portfolio:{portfolio_id}:returns_cache")
-        await redis_client.delete(f"portfolio:{portfolio_id}:analytics_cache")
-        await redis_client.delete(f"portfolio:{portfolio_id}:ytd:v5")
-        await redis_client.delete(f"portfolio:{portfolio_id}:ytd:v5:backup")
-    except Exception as e:
-        logger.warning(f"Failed to invalidate portfolio caches for {portfolio_id}: {e}")
+
+async def _gather_limited(*aws, limit: int = MAX_CONCURRENT_FETCHES, return_exceptions: bool = False) -> list:
+    """asyncio.gather with at most `limit` of the awaitables running at a time."""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw):
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(run(aw) for aw in aws), return_exceptions=return_exceptions)
 
 
 async def convert_amount_to_portfolio_currency(
@@ -69,6 +66,8 @@ async def convert_amount_to_portfolio_currency(
 
 
 class AssetOnboardingRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     ticker: str
     quantity: float
     average_cost: float  # Changed from unit_cost to match update route
@@ -76,6 +75,11 @@ class AssetOnboardingRequest(BaseModel):
     currency: Optional[str] = "USD"  # USD, CAD, EUR, etc.
 
 
+# Built once so JSON onboarding payloads are parsed and validated in a single
+# pass by pydantic-core, without an intermediate list of dicts
+_onboarding_payload_adapter = TypeAdapter(List[AssetOnboardingRequest])
+
+
 class AssetOnboardingResponse(BaseModel):
     ticker: str
     name: str
@@ -87,58 +91,87 @@ class AssetOnboardingResponse(BaseModel):
     holding_id: int
 
 
+# Common spellings of the CSV asset types, keyed case-folded
+ASSET_TYPE_MAPPING = {
+    'stock': 'stock',
+    'mutual fund': 'mutual_fund',
+    'mutualfund': 'mutual_fund',
+    'mutual_fund': 'mutual_fund',
+    'crypto': 'crypto',
+    'cryptocurrency': 'crypto',
+    'etf': 'etf',
+    'bond': 'bond'
+}
+
+
+@lru_cache(maxsize=64)
 def normalize_asset_type(asset_type: str) -> str:
     """
     Normalize asset type from CSV format to internal format.
     Maps: "Stock" -> "stock", "Mutual Fund" -> "mutual_fund", "Crypto" -> "crypto"
     """
-    normalized = asset_type.lower().strip()
-
-    # Map common variations
-    type_mapping = {
-        'stock': 'stock',
-        'mutual fund': 'mutual_fund',
-        'mutualfund': 'mutual_fund',
-        'mutual_fund': 'mutual_fund',
-        'crypto': 'crypto',
-        'cryptocurrency': 'crypto',
-        'etf': 'etf',
-        'bond': 'bond'
-    }
+    return ASSET_TYPE_MAPPING.get(asset_type.casefold().strip(), 'stock')  # Default to stock
 
-    return type_mapping.get(normalized, 'stock')  # Default to stock
 
+def _csv_column(df: pd.DataFrame, names: Tuple[str, ...], default: str) -> pd.Series:
+    """First of the (lower-cased) header names present in the CSV, else a constant column."""
+    for name in names:
+        if name in df.columns:
+            return df[name]
+    return pd.Series(default, index=df.index, dtype=object)
 
-async def parse_csv_file(file: UploadFile) -> List[AssetOnboardingRequest]:
-    """Parse CSV file and return list of AssetOnboardingRequest objects."""
-    contents = await file.read()
-    decoded = contents.decode('utf-8-sig')  # Handle BOM
-    csv_reader = csv.DictReader(io.StringIO(decoded))
 
-    assets = []
-    for row in csv_reader:
-        # Map CSV headers (case-insensitive) to expected fields
-        ticker = row.get('TICKER', row.get('ticker', '')).strip()
-        quantity = float(row.get('Quantity', row.get('quantity', 0)))
-        average_cost = float(row.get('Cost', row.get('cost', row.get('average_cost', 0))))
-        asset_type_raw = row.get('ASSET_TYPE', row.get('asset_type', 'Stock')).strip()
-        currency = row.get('CURRENCY', row.get('currency', 'USD')).strip()
-
-        # Normalize asset_type to match FinanceService expectations
-        asset_type = normalize_asset_type(asset_type_raw)
-
-        if ticker and quantity > 0 and average_cost > 0:
-            assets.append(AssetOnboardingRequest(
-                ticker=ticker,
-                quantity=quantity,
-                average_cost=average_cost,
-                asset_type=asset_type,
-                currency=currency
-            ))
+# Rows parsed per pandas chunk when reading an uploaded CSV
+CSV_CHUNK_ROWS = 10_000
+
+
+def _parse_csv_chunk(df: pd.DataFrame) -> List[AssetOnboardingRequest]:
+    """Normalize one chunk of CSV rows into onboarding requests."""
+    # Map CSV headers (case-insensitive) to expected fields
+    df.columns = df.columns.str.strip().str.lower()
+
+    ticker = _csv_column(df, ('ticker',), '').str.strip()
+    quantity = pd.to_numeric(_csv_column(df, ('quantity',), '0'))
+    average_cost = pd.to_numeric(_csv_column(df, ('cost', 'average_cost'), '0'))
+    currency = _csv_column(df, ('currency',), 'USD').str.strip()
+
+    # Normalize asset_type to match FinanceService expectations, once per distinct value
+    asset_type_raw = _csv_column(df, ('asset_type',), 'Stock')
+    asset_type = asset_type_raw.map({raw: normalize_asset_type(raw) for raw in asset_type_raw.unique()})
+
+    rows = pd.DataFrame({
+        'ticker': ticker,
+        'quantity': quantity.astype(float),
+        'average_cost': average_cost.astype(float),
+        'asset_type': asset_type,
+        'currency': currency,
+    })
+    rows = rows[(rows['ticker'] != '') & (rows['quantity'] > 0) & (rows['average_cost'] > 0)]
+
+    # Fields are already typed and filtered, so skip per-row validation
+    return [AssetOnboardingRequest.model_construct(**row) for row in rows.to_dict('records')]
 
+
+def _read_csv(stream) -> List[AssetOnboardingRequest]:
+    """Parse a binary CSV stream chunk by chunk."""
+    assets = []
+    # Read every cell as text (so tickers like "NA" survive) and normalize
+    # whole columns at once instead of row by row
+    with pd.read_csv(stream, encoding='utf-8-sig', dtype=str, keep_default_na=False,
+                     chunksize=CSV_CHUNK_ROWS) as reader:
+        for chunk in reader:
+            assets.extend(_parse_csv_chunk(chunk))
     return assets
 
 
+async def parse_csv_file(file: UploadFile) -> List[AssetOnboardingRequest]:
+    """Parse CSV file and return list of AssetOnboardingRequest objects."""
+    # Starlette spools uploads to a temporary file, so pandas reads that file
+    # directly in a worker thread instead of buffering the whole body
+    await file.seek(0)
+    return await asyncio.to_thread(_read_csv, file.file)
+
+
 async def batch_fetch_asset_data(
     items: List[AssetOnboardingRequest],
     existing_assets: Dict[str, Asset]
@@ -169,14 +202,19 @@ async def batch_fetch_asset_data(
             logger.error(f"Error fetching data for {ticker}: {e}")
             return (ticker, None)
 
-    # Fetch all asset data in parallel
-    results = await asyncio.gather(*[fetch_single_asset(item) for item in items])
+    # One request per distinct ticker; the first item supplies asset_type/currency
+    unique_items = {}
+    for item in items:
+        unique_items.setdefault(item.ticker.upper().strip(), item)
+
+    # Fetch all asset data concurrently, a bounded number at a time
+    results = await _gather_limited(*[fetch_single_asset(item) for item in unique_items.values()])
 
     # Convert to dictionary
     return dict(results)
 
 
-@router.post("/onboard", status_code=201, response_model=dict)
+@router.post("/onboard", status_code=201, response_model=None)
 async def onboard_asset(
     request: Request,
     affect_cash: bool = Query(False, description="When true, treat this as a real buy and debit portfolio cash."),
@@ -217,11 +255,7 @@ async def onboard_asset(
     elif 'application/json' in content_type:
         # Handle JSON body
         try:
-            json_data = await request.json()
-            if isinstance(json_data, list):
-                data = [AssetOnboardingRequest(**item) for item in json_data]
-            else:
-                raise HTTPException(status_code=400, detail="JSON data must be an array")
+            data = _onboarding_payload_adapter.validate_json(await request.body())
         except Exception as e:
             logger.error(f"Error parsing JSON data: {str(e)}")
             raise HTTPException(status_code=400, detail=f"Invalid JSON data: {str(e)}")
@@ -252,106 +286,89 @@ async def onboard_asset(
 
     # Pre-fetch existing assets from database
     tickers = [item.ticker.upper().strip() for item in data]
-    stmt = select(Asset).where(Asset.ticker.in_(tickers))
-    result = await db.execute(stmt)
-    existing_assets_list = result.scalars().all()
-    existing_assets = {asset.ticker: asset for asset in existing_assets_list}
+    existing_assets = await get_assets_by_tickers(db, tickers)
 
     # Batch fetch asset data for new tickers in parallel
     logger.info(f"Batch fetching data for {len(data)} assets in parallel...")
     asset_data_map = await batch_fetch_asset_data(data, existing_assets)
     logger.info(f"Batch fetch complete. Processing assets...")
 
+    # Existing assets without a stored price are priced concurrently as well,
+    # so the processing loop below never waits on the network
+    unpriced = {}
+    for item in data:
+        ticker = item.ticker.upper().strip()
+        asset_obj = existing_assets.get(ticker)
+        if asset_obj and not asset_obj.current_price and ticker not in unpriced:
+            unpriced[ticker] = asset_obj.asset_type or item.asset_type
+    if unpriced:
+        prices = await _gather_limited(
+            *[FinanceService.get_current_price(ticker, asset_type) for ticker, asset_type in unpriced.items()],
+            return_exceptions=True
+        )
+        for ticker, current_price in zip(unpriced, prices):
+            if isinstance(current_price, Exception):
+                logger.error(f"Error fetching current price for {ticker}: {current_price}")
+            elif current_price:
+                existing_assets[ticker].current_price = current_price
+
+    # Filter out fields that are not part of the Asset model
+    # (e.g., change_percent, change, previous_close from mutual fund data)
+    asset_model_fields = {
+        'ticker', 'name', 'asset_type', 'sector', 'industry', 'description',
+        'currency', 'exchange', 'current_price', 'market_cap', 'dividend_yield',
+        'pe_ratio', 'beta', 'last_price_update'
+    }
+
+    # First pass: collect the missing assets, then insert them in one
+    # INSERT ... RETURNING so they all get IDs in a single round trip
+    new_asset_rows = {}
+    failed_tickers = set()
+    for item in data:
+        ticker = item.ticker.upper().strip()
+        if ticker in existing_assets:
+            continue
+        try:
+            # Use pre-fetched asset data
+            asset_data = asset_data_map.get(ticker)
+            if not asset_data:
+                continue  # Reported per item in the second pass
+
+            filtered_asset_data = {k: v for k, v in asset_data.items() if k in asset_model_fields}
+
+            # Repeated tickers are inserted once
+            new_asset_rows.setdefault(ticker, filtered_asset_data)
+        except Exception as e:
+            logger.error(f"Error processing {item.ticker}: {str(e)}")
+            errors.append(f"Error processing {item.ticker}: {str(e)}")
+            failed_tickers.add(ticker)
+
+    if new_asset_rows:
+        new_assets = await create_assets(db, list(new_asset_rows.values()))
+        existing_assets.update(zip(new_asset_rows, new_assets))
+        logger.info(f"Created {len(new_assets)} new assets")
+
+    # Second pass: positions are merged per ticker and upserted in one
+    # INSERT ... ON CONFLICT, and the buy transactions go in as one multi-row
+    # INSERT ... RETURNING
+    pending = []
+    holding_rows = {}
+    tx_rows = []
+    # One timestamp for the whole batch
+    now = datetime.now(timezone.utc)
     for item in data:
         try:
             ticker = item.ticker.upper().strip()
 
-            # Get asset from existing assets or create new one
             asset_obj = existing_assets.get(ticker)
-
             if not asset_obj:
-                # Use pre-fetched asset data
-                asset_data = asset_data_map.get(ticker)
-
-                if not asset_data:
+                if ticker not in failed_tickers:
                     errors.append(f"Could not fetch data for ticker: {ticker}")
-                    continue
-
-                # Filter out fields that are not part of the Asset model
-                # (e.g., change_percent, change, previous_close from mutual fund data)
-                asset_model_fields = {
-                    'ticker', 'name', 'asset_type', 'sector', 'industry', 'description',
-                    'currency', 'exchange', 'current_price', 'market_cap', 'dividend_yield',
-                    'pe_ratio', 'beta', 'last_price_update'
-                }
-                filtered_asset_data = {k: v for k, v in asset_data.items() if k in asset_model_fields}
-
-                # Create Asset object with filtered data
-                asset_obj = Asset(**filtered_asset_data)
-                db.add(asset_obj)
-                await db.flush()  # Get the ID
-                logger.info(f"Created new asset: {ticker} with ID: {asset_obj.id}")
-            else:
-                # Update existing asset with fresh data if needed
-                if not asset_obj.current_price:
-                    current_price = await FinanceService.get_current_price(ticker, asset_obj.asset_type or item.asset_type)
-                    if current_price:
-                        asset_obj.current_price = current_price
-            # Check if holding already exists for this portfolio and ticker
-            existing_holding_stmt = select(Holding).where(
-                Holding.portfolio_id == portfolio_id,
-                Holding.ticker == ticker
-            )
-            existing_holding = (await db.execute(existing_holding_stmt)).scalar_one_or_none()
-
-            if existing_holding:
-                # Update existing holding
-                new_total_quantity = existing_holding.quantity + item.quantity
-                new_total_cost = (existing_holding.quantity * existing_holding.average_cost) + \
-                                 (item.quantity * item.average_cost)
-                new_average_cost = new_total_cost / new_total_quantity
-
-                existing_holding.quantity = new_total_quantity
-                existing_holding.average_cost = new_average_cost
-                existing_holding.cost_basis = new_total_quantity * new_average_cost
-                existing_holding.market_value = new_total_quantity * (asset_obj.current_price or new_average_cost)
-                existing_holding.current_price = asset_obj.current_price # Update current price
-
-                holding_to_use = existing_holding
-                logger.info(f"Updated existing holding for {ticker}. New quantity: {new_total_quantity}")
-            else:
-                # Create new holding
-                holding = Holding(
-                    asset_id=asset_obj.id,
-                    ticker=asset_obj.ticker,
-                    quantity=item.quantity,
-                    average_cost=item.average_cost,
-                    portfolio_id=portfolio_id,
-                    cost_basis=item.quantity * item.average_cost,
-                    market_value=item.quantity * (asset_obj.current_price or item.average_cost),
-                    current_price=asset_obj.current_price,
-                )
-                db.add(holding)
-                holding_to_use = holding
-                logger.info(f"Created new holding for {ticker}.")
-
-            await db.flush()  # Ensure holding_to_use has an ID if new, or is updated
+                continue
 
             # Calculate purchase cost
             purchase_cost = item.quantity * item.average_cost
 
-            # Create transaction (buy)
-            transaction = Transaction(
-                portfolio_id=holding_to_use.portfolio_id,
-                asset_id=asset_obj.id,
-                transaction_type=TransactionType.BUY,
-                quantity=item.quantity,
-                price=item.average_cost,
-                transaction_date=datetime.utcnow(),
-            )
-            db.add(transaction)
-            await db.flush()
-
             purchase_cost_portfolio_currency = purchase_cost
             exchange_rate = 1.0
             if affect_cash:
@@ -360,39 +377,99 @@ async def onboard_asset(
                     item.currency,
                     portfolio.currency
                 )
-                portfolio.cash_balance -= purchase_cost_portfolio_currency
-                portfolio.updated_at = datetime.utcnow()
-
-            created_assets.append(
-                {
-                    "ticker": ticker,
-                    "name": asset_obj.name or ticker,
-                    "quantity": item.quantity, # This quantity is for the current transaction
+
+            # Repeated tickers are merged at a weighted average cost, since
+            # one upsert cannot touch the same holding twice
+            row = holding_rows.get(ticker)
+            if row:
+                total_quantity = row["quantity"] + item.quantity
+                holding_row = {
+                    **row,
+                    "quantity": total_quantity,
+                    "average_cost": (
+                        row["quantity"] * row["average_cost"] + item.quantity * item.average_cost
+                    ) / total_quantity,
+                }
+            else:
+                holding_row = {
+                    "portfolio_id": portfolio_id,
+                    "asset_id": asset_obj.id,
+                    "ticker": asset_obj.ticker,
+                    "quantity": item.quantity,
                     "average_cost": item.average_cost,
-                    "purchase_cost": purchase_cost,
-                    "purchase_cost_portfolio_currency": purchase_cost_portfolio_currency,
-                    "purchase_cost_currency": portfolio.currency,
-                    "cash_affected": affect_cash,
-                    "exchange_rate": exchange_rate,
-                    "new_cash_balance": portfolio.cash_balance if affect_cash else None,
                     "current_price": asset_obj.current_price,
-                    "market_value": holding_to_use.market_value,
-                    "asset_id": asset_obj.id,
-                    "holding_id": holding_to_use.id,
-                    "transaction_id": transaction.id,
                 }
-            )
+
+            # Create transaction (buy)
+            tx_row = {
+                "portfolio_id": portfolio_id,
+                "asset_id": asset_obj.id,
+                "transaction_type": TransactionType.BUY,
+                "quantity": item.quantity,
+                "price": item.average_cost,
+                "transaction_date": now,
+            }
+
+            new_cash_balance = None
+            if affect_cash:
+                new_cash_balance = portfolio.cash_balance - purchase_cost_portfolio_currency
+
+            # holding/transaction IDs are filled in after the final flush
+            entry = {
+                "ticker": ticker,
+                "name": asset_obj.name or ticker,
+                "quantity": item.quantity, # This quantity is for the current transaction
+                "average_cost": item.average_cost,
+                "purchase_cost": purchase_cost,
+                "purchase_cost_portfolio_currency": purchase_cost_portfolio_currency,
+                "purchase_cost_currency": portfolio.currency,
+                "cash_affected": affect_cash,
+                "exchange_rate": exchange_rate,
+                "new_cash_balance": new_cash_balance,
+                "current_price": asset_obj.current_price,
+                "asset_id": asset_obj.id,
+            }
+
+            # Record the item only once all of it was built, so a failure
+            # above leaves holding_rows, tx_rows and pending in step
+            holding_rows[ticker] = holding_row
+            tx_rows.append(tx_row)
+            pending.append((entry, asset_obj.ticker))
+            if affect_cash:
+                portfolio.cash_balance = new_cash_balance
+                portfolio.updated_at = now
             logger.info(
                 f"Successfully processed {ticker}: {item.quantity} shares at ${item.average_cost}"
             )
         except Exception as e:
             logger.error(f"Error processing {item.ticker}: {str(e)}")
             errors.append(f"Error processing {item.ticker}: {str(e)}")
+
+    if pending:
+        holdings = {
+            holding.ticker: holding
+            for holding in await upsert_holdings(db, list(holding_rows.values()))
+        }
+        result = await db.execute(
+            insert(Transaction).returning(Transaction.id, sort_by_parameter_order=True),
+            tx_rows
+        )
+        transaction_ids = result.scalars().all()
+        for (entry, holding_ticker), transaction_id in zip(pending, transaction_ids):
+            holding = holdings[holding_ticker]
+            entry["holding_id"] = holding.id
+            entry["market_value"] = holding.market_value
+            entry["transaction_id"] = transaction_id
+            created_assets.append(entry)
+        logger.info(f"Upserted {len(holdings)} holdings")
+
     if created_assets:
         await db.commit()
-        if affect_cash:
-            await invalidate_portfolio_transaction_caches(portfolio_id)
-    return {"assets": created_assets, "errors": errors}
+        # Holdings changed either way, so cached analytics are stale too
+        await invalidate_portfolio_transaction_caches(portfolio_id)
+    # Returned as a response so FastAPI skips validating and re-encoding the
+    # float-heavy per-asset payload
+    return ORJSONResponse({"assets": created_assets, "errors": errors}, status_code=201)
 
 
 @router.post("/sell", status_code=201, response_model=dict)
@@ -405,13 +482,14 @@ async def sell_asset(
     Sell an asset from the authenticated user's portfolio and credit cash.
     """
     try:
+        now = datetime.now(timezone.utc)
         ticker = data.ticker.upper().strip()
         portfolio = await get_user_portfolio(db, current_user.id)
         if not portfolio:
             raise HTTPException(status_code=404, detail="Portfolio not found")
 
-        # Find holding
-        stmt = select(Holding).where(
+        # Find holding, with its asset joined in the same round-trip
+        stmt = select(Holding).options(joinedload(Holding.asset)).where(
             Holding.ticker == ticker,
             Holding.portfolio_id == portfolio.id
         )
@@ -420,7 +498,7 @@ async def sell_asset(
         if not holding or holding.quantity < data.quantity:
             raise HTTPException(status_code=400, detail="Not enough quantity to sell")
 
-        asset_obj = await db.get(Asset, holding.asset_id)
+        asset_obj = holding.asset
 
         from app.crud.transaction import calculate_realized_gain_loss_fifo
 
@@ -458,13 +536,13 @@ async def sell_asset(
             transaction_type=TransactionType.SELL,
             quantity=data.quantity,
             price=data.price,
-            transaction_date=datetime.utcnow(),
+            transaction_date=now,
             realized_gain_loss=realized_gain_loss,
         )
         db.add(transaction)
 
         portfolio.cash_balance += sale_proceeds
-        portfolio.updated_at = datetime.utcnow()
+        portfolio.updated_at = now
 
         await db.commit()
         await invalidate_portfolio_transaction_caches(portfolio.id)
@@ -496,37 +574,37 @@ async def sell_asset(
 async def refresh_asset_data(ticker: str, db: AsyncSession = Depends(get_db)):
     """Refresh asset data from Yahoo Finance."""
     try:
-        # Find the asset
-        stmt = select(Asset).where(Asset.ticker == ticker.upper())
-        result = await db.execute(stmt)
-        asset_obj = result.scalar_one_or_none()
-
-        if not asset_obj:
-            raise HTTPException(status_code=404, detail=f"Asset {ticker} not found")
-
-        # Fetch fresh data
+        # Fetch fresh data, bypassing the short-lived asset info cache
+        FinanceService.invalidate_asset_info(ticker)
         asset_data = await FinanceService.get_asset_info(ticker)
         if not asset_data:
             raise HTTPException(
                 status_code=400, detail=f"Could not fetch data for {ticker}"
             )
 
-        # Update asset fields
-        for key, value in asset_data.items():
-            if key != "ticker" and hasattr(asset_obj, key):
-                setattr(asset_obj, key, value)
+        # Update asset fields in one UPDATE ... RETURNING round-trip
+        asset_columns = set(Asset.__table__.columns.keys())
+        values = {
+            key: value for key, value in asset_data.items()
+            if key != "ticker" and key in asset_columns
+        }
+        stmt = (
+            update(Asset)
+            .where(Asset.ticker == ticker.upper())
+            .values(**values)
+            .returning(Asset.ticker, Asset.name, Asset.current_price, Asset.market_cap)
+        )
+        row = (await db.execute(stmt)).one_or_none()
+
+        if row is None:
+            raise HTTPException(status_code=404, detail=f"Asset {ticker} not found")
 
         await db.commit()
 
         return {
             "success": True,
             "message": f"Successfully refreshed data for {ticker}",
-            "asset": {
-                "ticker": asset_obj.ticker,
-                "name": asset_obj.name,
-                "current_price": asset_obj.current_price,
-                "market_cap": asset_obj.market_cap,
-            },
+            "asset": dict(row._mapping),
         }
 
     except HTTPException:
@@ -1,6 +1,7 @@
 """
 Authentication API routes continued - Refresh, Password Management.
 """
+import asyncio
 from datetime import timedelta
 from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -9,6 +10,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from app.core.security import create_access_token, create_refresh_token, verify_token, verify_password
 from app.core.config import settings
+from app.core.redis_client import get_redis_client
+from app.core.cache import REFRESH_USER_CACHE_TTL, refresh_user_cache_key
 from app.schemas import Token, RefreshTokenRequest, ChangePasswordRequest
 from app.crud import get_user_by_username, update_user_password
 from app.utils.dependencies import get_current_active_user
@@ -38,25 +41,30 @@ async def refresh_token(
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        # Get user
-        user = await get_user_by_username(db, username)
-        if not user or not user.is_active:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found or inactive",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        # Get user, unless it was seen active within the last minute
+        redis_client = await get_redis_client()
+        cache_key = refresh_user_cache_key(username)
+        if not await redis_client.get(cache_key):
+            user = await get_user_by_username(db, username)
+            if not user or not user.is_active:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="User not found or inactive",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            username = user.username
+            await redis_client.set(cache_key, True, ttl=REFRESH_USER_CACHE_TTL)
         
         # Create new tokens
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         refresh_token_expires = timedelta(minutes=settings.REFRESH_TOKEN_EXPIRE_MINUTES)
         
         access_token = create_access_token(
-            data={"sub": user.username}, 
+            data={"sub": username}, 
             expires_delta=access_token_expires
         )
         new_refresh_token = create_refresh_token(
-            data={"sub": user.username}, 
+            data={"sub": username}, 
             expires_delta=refresh_token_expires
         )
         
@@ -85,7 +93,9 @@ async def change_password(
     Change user password.
     """
     # Verify current password
-    if not verify_password(password_data.current_password, current_user.hashed_password):
+    if not await asyncio.to_thread(
+        verify_password, password_data.current_password, current_user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect current password"
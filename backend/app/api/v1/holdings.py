@@ -5,7 +5,8 @@ from typing import Any, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from datetime import datetime
+from sqlalchemy.orm import joinedload
+from datetime import datetime, timezone
 
 from app.core.database import get_db
 from app.schemas import HoldingInDB, HoldingCreate, HoldingUpdate, HoldingPerformance, BatchHoldingPerformance
@@ -24,33 +25,15 @@ from app.schemas.transaction import TransactionCreate
 from app.utils.dependencies import get_current_active_user
 from app.models import User
 from app.models.holding import Holding as HoldingModel
-from app.models.asset import Asset
 from app.services.exchange_rate_service import get_exchange_rate_service
 from app.services.finance_service import FinanceService
 from app.core.redis_client import get_redis_client
+from app.core.cache import invalidate_portfolio_analysis_caches, invalidate_portfolio_transaction_caches
 import json
 
 router = APIRouter()
 
 
-async def invalidate_portfolio_transaction_caches(portfolio_id: int):
-    """Invalidate cached portfolio data after buy/sell cash mutations."""
-    try:
-        redis_client = await get_redis_client()
-        for currency_code in ["USD", "CAD"]:
-            await redis_client.delete(f"dashboard:overview:{portfolio_id}:{currency_code}")
-            await redis_client.delete(f"portfolio:{portfolio_id}:holdings:{currency_code}")
-            await redis_client.delete(f"portfolio:{portfolio_id}:live_market:{currency_code}")
-            await redis_client.delete(f"portfolio:{portfolio_id}:live_market:v2:{currency_code}")
-            await redis_client.delete(f"portfolio:{portfolio_id}:live_market:v3:{currency_code}")
-        await redis_client.delete(f"portfolio:{portfolio_id}:returns_cache")
-        await redis_client.delete(f"portfolio:{portfolio_id}:analytics_cache")
-        await redis_client.delete(f"portfolio:{portfolio_id}:ytd:v5")
-        await redis_client.delete(f"portfolio:{portfolio_id}:ytd:v5:backup")
-    except Exception:
-        pass
-
-
 @router.get("/")
 async def get_holdings(
     current_user: User = Depends(get_current_active_user),
@@ -178,12 +161,7 @@ async def create_user_holding(
     holding = await create_holding(db, portfolio.id, holding_create)
 
     # Invalidate returns cache so CPPI/Monte Carlo use fresh data
-    try:
-        redis_client = await get_redis_client()
-        await redis_client.delete(f"portfolio:{portfolio.id}:returns_cache")
-        await redis_client.delete(f"portfolio:{portfolio.id}:analytics_cache")
-    except Exception:
-        pass
+    await invalidate_portfolio_analysis_caches(portfolio.id)
 
     return holding
 
@@ -255,12 +233,7 @@ async def update_user_holding(
         )
 
     # Invalidate returns cache so CPPI/Monte Carlo use fresh data
-    try:
-        redis_client = await get_redis_client()
-        await redis_client.delete(f"portfolio:{portfolio.id}:returns_cache")
-        await redis_client.delete(f"portfolio:{portfolio.id}:analytics_cache")
-    except Exception:
-        pass
+    await invalidate_portfolio_analysis_caches(portfolio.id)
 
     return updated_holding
 
@@ -297,12 +270,7 @@ async def delete_user_holding(
         )
 
     # Invalidate returns cache so CPPI/Monte Carlo use fresh data
-    try:
-        redis_client = await get_redis_client()
-        await redis_client.delete(f"portfolio:{portfolio.id}:returns_cache")
-        await redis_client.delete(f"portfolio:{portfolio.id}:analytics_cache")
-    except Exception:
-        pass
+    await invalidate_portfolio_analysis_caches(portfolio.id)
 
     return {"message": "Holding deleted successfully"}
 
@@ -335,12 +303,7 @@ async def edit_holding_details(
     await db.refresh(holding)
 
     # Invalidate returns cache so CPPI/Monte Carlo use fresh data
-    try:
-        redis_client = await get_redis_client()
-        await redis_client.delete(f"portfolio:{portfolio.id}:returns_cache")
-        await redis_client.delete(f"portfolio:{portfolio.id}:analytics_cache")
-    except Exception:
-        pass
+    await invalidate_portfolio_analysis_caches(portfolio.id)
 
     return holding
 
@@ -360,13 +323,14 @@ async def sell_asset(
     3. Update holding quantity
     4. Credit the sale proceeds to portfolio cash balance
     """
+    now = datetime.now(timezone.utc)
     portfolio = await get_user_portfolio(db, current_user.id)
     if not portfolio:
         raise HTTPException(status_code=404, detail="Portfolio not found")
 
-    # Find the holding to sell from
+    # Find the holding to sell from, with its asset joined in the same round-trip
     result = await db.execute(
-        select(HoldingModel).where(
+        select(HoldingModel).options(joinedload(HoldingModel.asset)).where(
             HoldingModel.portfolio_id == portfolio.id,
             HoldingModel.ticker == sell_request.ticker.upper().strip()
         )
@@ -386,7 +350,7 @@ async def sell_asset(
         sell_price=sell_request.price
     )
 
-    asset = await db.get(Asset, holding.asset_id)
+    asset = holding.asset
 
     # Calculate sale proceeds in asset's currency
     sale_proceeds_original = sell_request.quantity * sell_request.price
@@ -418,7 +382,7 @@ async def sell_asset(
         transaction_type="SELL",
         quantity=sell_request.quantity,
         price=sell_request.price,
-        transaction_date=datetime.utcnow(),
+        transaction_date=now,
         realized_gain_loss=realized_gain_loss
     )
     await create_transaction(db, portfolio_id=portfolio.id, obj_in=transaction_in)
@@ -433,16 +397,9 @@ async def sell_asset(
     )
 
     await db.commit()
+    # Also drops the returns cache so CPPI/Monte Carlo use fresh data
     await invalidate_portfolio_transaction_caches(portfolio.id)
 
-    # Invalidate returns cache so CPPI/Monte Carlo use fresh data
-    try:
-        redis_client = await get_redis_client()
-        await redis_client.delete(f"portfolio:{portfolio.id}:returns_cache")
-        await redis_client.delete(f"portfolio:{portfolio.id}:analytics_cache")
-    except Exception:
-        pass
-
     return {
         "message": "Asset sold successfully",
         "quantity_sold": sell_request.quantity,
@@ -607,9 +564,9 @@ async def get_holding_performance(
     except Exception:
         pass
     
-    # Find the holding
+    # Find the holding (joined with its asset, which is read below)
     result = await db.execute(
-        select(HoldingModel).where(
+        select(HoldingModel).options(joinedload(HoldingModel.asset)).where(
             HoldingModel.portfolio_id == portfolio.id,
             HoldingModel.ticker == ticker
         )
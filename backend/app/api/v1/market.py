@@ -5,9 +5,10 @@ from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, WebSocket, WebSocketDisconnect, Query
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import datetime
+from datetime import datetime, timezone
 import asyncio
 import logging
+import yfinance as yf
 
 from app.core.database import get_db
 from app.crud import get_user_portfolio, get_portfolio_holdings
@@ -301,6 +302,9 @@ async def get_live_market_data(
         return data
 
     # ── Fetch mutual fund / crypto / OHLC data in parallel ───────────────────
+    # One refresh timestamp shared by every asset updated below
+    price_update_time = datetime.now(timezone.utc)
+
     async def fetch_mf(holding):
         try:
             data = await get_cached_asset_info(holding.ticker, 'mutual_fund')
@@ -310,7 +314,7 @@ async def get_live_market_data(
                 holding._temp_change = data.get('change', 0)
                 if holding.asset:
                     holding.asset.current_price = data['current_price']
-                    holding.asset.last_price_update = datetime.utcnow()
+                    holding.asset.last_price_update = price_update_time
             else:
                 holding._temp_change_percent = 0
                 holding._temp_change = 0
@@ -331,7 +335,7 @@ async def get_live_market_data(
                     holding._temp_change_percent = 0
                 if holding.asset:
                     holding.asset.current_price = data['current_price']
-                    holding.asset.last_price_update = datetime.utcnow()
+                    holding.asset.last_price_update = price_update_time
             else:
                 holding._temp_change_percent = 0
         except Exception as e:
@@ -347,7 +351,7 @@ async def get_live_market_data(
                 holding._temp_change = data.get('change', 0)
                 if holding.asset:
                     holding.asset.current_price = data['current_price']
-                    holding.asset.last_price_update = datetime.utcnow()
+                    holding.asset.last_price_update = price_update_time
             else:
                 holding._temp_change_percent = 0
                 holding._temp_change = 0
@@ -610,7 +614,6 @@ async def get_ytd_data(
     # ── Stocks / ETFs / Crypto: per-ticker parallel history(end=yesterday) ────
     holdings_needing_history = [h for h in other_holdings if h.ticker not in ytd_map]
     if holdings_needing_history:
-        import yfinance as yf
         from datetime import datetime as _dt, date as _date, timedelta as _td
 
         year_start = _dt(_dt.now().year, 1, 1)
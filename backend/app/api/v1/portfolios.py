@@ -4,12 +4,14 @@ Portfolio management API routes.
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional, List, Literal
 import logging
+import numpy as np
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
 from sqlalchemy.orm import selectinload
 
 from app.core.database import get_db
+from app.core.cache import invalidate_portfolio_transaction_caches
 from app.schemas import PortfolioInDB, PortfolioUpdate, PortfolioSummary, PortfolioAnalysisResponse, HoldingSummary
 from app.crud import (
     get_user_portfolio,
@@ -489,23 +491,29 @@ async def analyze_portfolio(
         message = f"Summary of all {len(holdings_data)} holdings"
         
     elif query_type == "sector_breakdown":
-        # Group by sector
-        sector_breakdown = {}
-        for h in holdings_data:
-            asset = next((holding.asset for holding in active_holdings if holding.ticker == h["ticker"]), None)
-            sector = asset.sector if asset and asset.sector else "Unknown"
-            
-            if sector not in sector_breakdown:
-                sector_breakdown[sector] = {
-                    "sector": sector,
-                    "market_value": 0,
-                    "holdings_count": 0,
-                    "tickers": []
-                }
-            
-            sector_breakdown[sector]["market_value"] += h["market_value"]
-            sector_breakdown[sector]["holdings_count"] += 1
-            sector_breakdown[sector]["tickers"].append(h["ticker"])
+        # Group by sector: holdings_data is built 1:1 from active_holdings, so
+        # sectors map to integer ids once and values reduce with bincount
+        sectors = [
+            holding.asset.sector if holding.asset and holding.asset.sector else "Unknown"
+            for holding in active_holdings
+        ]
+        unique_sectors, sector_idx = np.unique(sectors, return_inverse=True)
+        market_values = np.fromiter((h["market_value"] for h in holdings_data), dtype=float, count=len(holdings_data))
+        sector_values = np.bincount(sector_idx, weights=market_values, minlength=len(unique_sectors))
+        sector_counts = np.bincount(sector_idx, minlength=len(unique_sectors))
+        sector_tickers = [[] for _ in unique_sectors]
+        for i, h in zip(sector_idx, holdings_data):
+            sector_tickers[i].append(h["ticker"])
+
+        sector_breakdown = {
+            str(sector): {
+                "sector": str(sector),
+                "market_value": float(sector_values[i]),
+                "holdings_count": int(sector_counts[i]),
+                "tickers": sector_tickers[i],
+            }
+            for i, sector in enumerate(unique_sectors)
+        }
         
         # Calculate percentages and sort by value
         for sector_data in sector_breakdown.values():
@@ -605,21 +613,9 @@ async def recalculate_cash_from_buys(
     portfolio.updated_at = datetime.utcnow()
     await db.commit()
 
-    try:
-        from app.core.redis_client import get_redis_client
-        redis_client = await get_redis_client()
-        for currency in ["USD", "CAD"]:
-            await redis_client.delete(f"dashboard:overview:{portfolio.id}:{currency}")
-            await redis_client.delete(f"portfolio:{portfolio.id}:holdings:{currency}")
-            await redis_client.delete(f"portfolio:{portfolio.id}:live_market:{currency}")
-            await redis_client.delete(f"portfolio:{portfolio.id}:live_market:v2:{currency}")
-            await redis_client.delete(f"portfolio:{portfolio.id}:live_market:v3:{currency}")
-        await redis_client.delete(f"portfolio:{portfolio.id}:returns_cache")
-        await redis_client.delete(f"portfolio:{portfolio.id}:analytics_cache")
-        await redis_client.delete(f"portfolio:{portfolio.id}:ytd:v5")
-        await redis_client.delete(f"portfolio:{portfolio.id}:ytd:v5:backup")
-    except Exception as e:
-        logger.warning(f"Cache invalidation failed: {e}")
+    # Cash feeds the sector allocation, so versioned analysis results are
+    # retired along with the dashboard and holdings caches
+    await invalidate_portfolio_transaction_caches(portfolio.id)
 
     return {
         "adjusted": True,
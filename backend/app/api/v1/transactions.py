@@ -30,9 +30,12 @@ async def invalidate_dashboard_cache(portfolio_id: int):
     redis_client = await get_redis_client()
     try:
         # Invalidate cache for both USD and CAD views
-        for currency in ["USD", "CAD"]:
-            cache_key = f"dashboard:overview:{portfolio_id}:{currency}"
-            await redis_client.delete(cache_key)
+        # The cash balance feeds sector allocation, so versioned analysis
+        # results are retired in the same round trip
+        await redis_client.delete_and_incr(
+            [f"dashboard:overview:{portfolio_id}:{currency}" for currency in ["USD", "CAD"]],
+            f"portfolio:{portfolio_id}:version",
+        )
         print(f"[CACHE] Invalidated dashboard cache for portfolio {portfolio_id}")
     except Exception as e:
         print(f"[CACHE] Failed to invalidate cache: {e}")
@@ -0,0 +1,63 @@
+"""
+Cache keys and invalidation helpers shared by the API routes and CRUD layer.
+"""
+import logging
+
+from app.core.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Refresh only needs to know the user still exists and is active; remember
+# that briefly so clients refreshing on a timer skip the user lookup
+REFRESH_USER_CACHE_TTL = 60
+
+
+def refresh_user_cache_key(username: str) -> str:
+    """Key marking a user as recently seen active by /auth/refresh."""
+    return f"user:{username.lower()}:active"
+
+
+async def invalidate_refresh_user(username: str):
+    """Make the next token refresh for this user re-read it from the database."""
+    redis_client = await get_redis_client()
+    await redis_client.delete(refresh_user_cache_key(username))
+
+
+async def invalidate_portfolio_analysis_caches(portfolio_id: int):
+    """Retire cached returns and analysis results after a holding changes."""
+    try:
+        redis_client = await get_redis_client()
+        # Cached analysis results are keyed on the version counter; bumping it retires them
+        await redis_client.delete_and_incr(
+            [f"portfolio:{portfolio_id}:returns_cache", f"portfolio:{portfolio_id}:analytics_cache"],
+            f"portfolio:{portfolio_id}:version",
+        )
+    except Exception as e:
+        logger.warning(f"Failed to invalidate analysis caches for {portfolio_id}: {e}")
+
+
+async def invalidate_portfolio_transaction_caches(portfolio_id: int):
+    """Invalidate cached portfolio data and analysis results after holdings or cash change."""
+    try:
+        redis_client = await get_redis_client()
+        keys = []
+        for currency in ["USD", "CAD"]:
+            keys += [
+                f"dashboard:overview:{portfolio_id}:{currency}",
+                f"portfolio:{portfolio_id}:holdings:{currency}",
+                f"portfolio:{portfolio_id}:live_market:{currency}",
+                f"portfolio:{portfolio_id}:live_market:v2:{currency}",
+                f"portfolio:{portfolio_id}:live_market:v3:{currency}",
+            ]
+        keys += [
+            f"portfolio:{portfolio_id}:returns_cache",
+            f"portfolio:{portfolio_id}:analytics_cache",
+            f"portfolio:{portfolio_id}:ytd:v5",
+            f"portfolio:{portfolio_id}:ytd:v5:backup",
+        ]
+        # Analysis results are keyed on the version counter, so bumping it
+        # retires every parameter combination at once without scanning keys;
+        # both go out in one pipelined round trip
+        await redis_client.delete_and_incr(keys, f"portfolio:{portfolio_id}:version")
+    except Exception as e:
+        logger.warning(f"Failed to invalidate portfolio caches for {portfolio_id}: {e}")
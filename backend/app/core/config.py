@@ -142,6 +142,14 @@ class Settings:
     SUPABASE_ANON_KEY: Optional[str] = None
     DATABASE_URL: str = "sqlite+aiosqlite:///./portfolio.db"
     DATABASE_ECHO: bool = False
+    # asyncpg prepared-statement cache; must stay 0 behind PgBouncer transaction
+    # pooling (Supabase port 6543), can be raised for direct/session-mode connections
+    DATABASE_STATEMENT_CACHE_SIZE: int = 0
+    # Postgres connection pool; 0 keeps NullPool, which the transaction pooler
+    # needs, while direct connections can hold a persistent pool
+    DATABASE_POOL_SIZE: int = 0
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_RECYCLE: int = 1800
     BACKEND_CORS_ORIGINS: List[str] | str = "*"
     ENVIRONMENT: str = "development"
     DEBUG: bool = True
@@ -182,6 +190,10 @@ class Settings:
         self.SUPABASE_ANON_KEY = os.getenv("SUPABASE_ANON_KEY")
         self.DATABASE_URL = build_database_url()
         self.DATABASE_ECHO = _parse_bool(os.getenv("DATABASE_ECHO"), self.DATABASE_ECHO)
+        self.DATABASE_STATEMENT_CACHE_SIZE = _parse_int(os.getenv("DATABASE_STATEMENT_CACHE_SIZE"), self.DATABASE_STATEMENT_CACHE_SIZE)
+        self.DATABASE_POOL_SIZE = _parse_int(os.getenv("DATABASE_POOL_SIZE"), self.DATABASE_POOL_SIZE)
+        self.DATABASE_MAX_OVERFLOW = _parse_int(os.getenv("DATABASE_MAX_OVERFLOW"), self.DATABASE_MAX_OVERFLOW)
+        self.DATABASE_POOL_RECYCLE = _parse_int(os.getenv("DATABASE_POOL_RECYCLE"), self.DATABASE_POOL_RECYCLE)
         self.BACKEND_CORS_ORIGINS = _parse_cors_origins(os.getenv("BACKEND_CORS_ORIGINS", self.BACKEND_CORS_ORIGINS))
         self.ENVIRONMENT = os.getenv("ENVIRONMENT", self.ENVIRONMENT)
         self.DEBUG = _parse_bool(os.getenv("DEBUG"), self.DEBUG)
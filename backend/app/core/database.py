@@ -46,12 +46,20 @@ engine_kwargs = {
 
 # PostgreSQL-specific settings for Supabase pooler compatibility
 if is_postgres:
-    # Use NullPool for serverless/pooler connections (Supabase uses PgBouncer)
-    engine_kwargs["poolclass"] = NullPool
-    # Disable prepared statements for transaction pooling mode (asyncpg specific)
+    if settings.DATABASE_POOL_SIZE > 0:
+        # Direct connections keep a pool so requests reuse warm connections
+        # instead of paying connection setup and type introspection each time
+        engine_kwargs["pool_size"] = settings.DATABASE_POOL_SIZE
+        engine_kwargs["max_overflow"] = settings.DATABASE_MAX_OVERFLOW
+        engine_kwargs["pool_recycle"] = settings.DATABASE_POOL_RECYCLE
+    else:
+        # Use NullPool for serverless/pooler connections (Supabase uses PgBouncer)
+        engine_kwargs["poolclass"] = NullPool
+    # Prepared statements are disabled by default for transaction pooling mode;
+    # direct connections can enable the asyncpg statement cache (asyncpg specific)
     engine_kwargs["connect_args"] = {
-        "statement_cache_size": 0,
-        "prepared_statement_cache_size": 0,
+        "statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
         "server_settings": {"jit": "off"}
     }
 
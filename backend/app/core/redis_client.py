@@ -9,6 +9,21 @@ from datetime import datetime
 import redis.asyncio as redis
 from app.core.config import settings
 
+# orjson is several times faster than stdlib json for float-heavy analytics
+# payloads and understands numpy types; fall back to json when it is missing
+try:
+    import orjson
+
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(value: Any) -> bytes:
+        return orjson.dumps(value, option=_ORJSON_OPTIONS)
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,7 +65,7 @@ class RedisClient:
         try:
             value = await self.redis.get(key)
             if value:
-                return json.loads(value)
+                return _loads(value)
             return None
         except Exception as e:
             logger.error(f"Redis GET error for key {key}: {e}")
@@ -61,7 +76,7 @@ class RedisClient:
         if not self.connected or not self.redis:
             return
         try:
-            serialized = json.dumps(value)
+            serialized = _dumps(value)
             if ttl:
                 await self.redis.setex(key, ttl, serialized)
             else:
@@ -78,9 +93,12 @@ class RedisClient:
         if not self.connected or not self.redis:
             return
         try:
-            serialized = json.dumps(value)
-            await self.redis.lpush(key, serialized)
-            await self.redis.ltrim(key, 0, max_length - 1)
+            serialized = _dumps(value)
+            # Push and trim in one round trip
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.lpush(key, serialized)
+                pipe.ltrim(key, 0, max_length - 1)
+                await pipe.execute()
         except Exception as e:
             logger.error(f"Redis LPUSH error for key {key}: {e}")
 
@@ -90,19 +108,44 @@ class RedisClient:
             return []
         try:
             values = await self.redis.lrange(key, start, end)
-            return [json.loads(v) for v in values]
+            return [_loads(v) for v in values]
         except Exception as e:
             logger.error(f"Redis LRANGE error for key {key}: {e}")
             return []
 
-    async def delete(self, key: str):
-        """Delete key from Redis."""
-        if not self.connected or not self.redis:
+    async def delete(self, *keys: str):
+        """Delete one or more keys from Redis in a single round trip."""
+        if not self.connected or not self.redis or not keys:
             return
         try:
-            await self.redis.delete(key)
+            await self.redis.delete(*keys)
         except Exception as e:
-            logger.error(f"Redis DELETE error for key {key}: {e}")
+            logger.error(f"Redis DELETE error for keys {keys}: {e}")
+
+    async def incr(self, key: str) -> Optional[int]:
+        """Atomically increment an integer counter, creating it at 1."""
+        if not self.connected or not self.redis:
+            return None
+        try:
+            return await self.redis.incr(key)
+        except Exception as e:
+            logger.error(f"Redis INCR error for key {key}: {e}")
+            return None
+
+    async def delete_and_incr(self, keys: List[str], counter_key: str) -> Optional[int]:
+        """Delete keys and bump a version counter in one pipelined round trip."""
+        if not self.connected or not self.redis:
+            return None
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                if keys:
+                    pipe.delete(*keys)
+                pipe.incr(counter_key)
+                results = await pipe.execute()
+            return results[-1]
+        except Exception as e:
+            logger.error(f"Redis DELETE+INCR error for keys {keys}, {counter_key}: {e}")
+            return None
 
     async def exists(self, key: str) -> bool:
         """Check if key exists."""
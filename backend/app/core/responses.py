@@ -0,0 +1,27 @@
+"""
+JSON response classes shared by the API routers.
+"""
+
+from typing import Any
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    orjson = None
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Analytics payloads are large, float-heavy dicts; orjson serializes them (and
+    any numpy scalars/arrays) several times faster than the stdlib encoder and
+    writes NaN/inf as null instead of failing. Falls back to JSONResponse
+    rendering when orjson is not installed.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
@@ -30,7 +30,9 @@ from app.crud.asset import (
     get_asset,
     get_asset_by_ticker,
     get_assets,
+    get_assets_by_tickers,
     create_asset,
+    create_assets,
     get_or_create_asset,
     update_asset,
 )
@@ -42,6 +44,7 @@ from app.crud.holding import (
 )
 from app.crud.holding_extended import (
     create_holding,
+    upsert_holdings,
     update_holding,
     delete_holding,
 )
@@ -80,7 +83,9 @@ __all__ = [
     "get_asset",
     "get_asset_by_ticker",
     "get_assets",
+    "get_assets_by_tickers",
     "create_asset",
+    "create_assets",
     "get_or_create_asset",
     "update_asset",
     # Holding CRUD
@@ -89,6 +94,7 @@ __all__ = [
     "get_portfolio_holdings_count",
     "get_holding_by_asset",
     "create_holding",
+    "upsert_holdings",
     "update_holding",
     "delete_holding",
     # MCP API key CRUD
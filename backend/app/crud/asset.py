@@ -1,15 +1,20 @@
 """
 CRUD operations for asset management.
 """
-from typing import Optional, List
+from typing import Optional, List, Dict
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, or_
+from sqlalchemy import select, update, delete, insert, or_, bindparam
 from datetime import datetime
 
 from app.models import Asset
 from app.schemas import AssetCreate, AssetUpdate
 
 
+# Built once with an expanding parameter, so every batch lookup reuses the
+# same statement and its cached compiled SQL
+_ASSETS_BY_TICKERS = select(Asset).where(Asset.ticker.in_(bindparam("tickers", expanding=True)))
+
+
 async def get_asset(db: AsyncSession, asset_id: int) -> Optional[Asset]:
     """Get asset by ID."""
     stmt = select(Asset).where(Asset.id == asset_id)
@@ -24,6 +29,12 @@ async def get_asset_by_ticker(db: AsyncSession, ticker: str) -> Optional[Asset]:
     return result.scalar_one_or_none()
 
 
+async def get_assets_by_tickers(db: AsyncSession, tickers: List[str]) -> Dict[str, Asset]:
+    """Get the assets for several (already normalized) tickers, keyed by ticker."""
+    result = await db.scalars(_ASSETS_BY_TICKERS, {"tickers": list(tickers)})
+    return {asset.ticker: asset for asset in result.all()}
+
+
 async def get_assets(db: AsyncSession, skip: int = 0, limit: int = 100, search: str = None) -> List[Asset]:
     """Get multiple assets with optional search."""
     stmt = select(Asset).where(Asset.is_active == True)
@@ -62,6 +73,17 @@ async def create_asset(db: AsyncSession, asset_create: AssetCreate) -> Asset:
     return db_asset
 
 
+async def create_assets(db: AsyncSession, rows: List[dict]) -> List[Asset]:
+    """
+    Insert several assets in one INSERT ... RETURNING.
+
+    Returns the new assets in the order of rows, with their IDs populated,
+    without a unit-of-work flush.
+    """
+    result = await db.scalars(insert(Asset).returning(Asset, sort_by_parameter_order=True), rows)
+    return list(result.all())
+
+
 async def get_or_create_asset(db: AsyncSession, ticker: str, asset_data: Optional[AssetCreate] = None) -> Asset:
     """Get existing asset or create new one."""
     asset = await get_asset_by_ticker(db, ticker)
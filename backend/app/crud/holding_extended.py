@@ -3,7 +3,8 @@ Holding CRUD operations continued - Create, Update, Delete.
 """
 from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, update, delete, func
+from sqlalchemy.dialects import postgresql, sqlite
 from datetime import datetime
 
 from app.models import Holding, Portfolio, Asset
@@ -33,7 +34,8 @@ async def create_holding(db: AsyncSession, portfolio_id: int, holding_create: Ho
 
         existing_holding.quantity = new_total_quantity
         existing_holding.average_cost = new_average_cost
-        existing_holding.cost_basis = new_total_quantity * new_average_cost  # CRITICAL FIX: Recalculate cost_basis
+        # quantity * average_cost is new_total_cost; reuse it rather than round-tripping through the division
+        existing_holding.cost_basis = new_total_cost
         existing_holding.market_value = new_total_quantity * (existing_holding.current_price or new_average_cost)  # Update market_value
         existing_holding.updated_at = datetime.utcnow()
 
@@ -66,6 +68,48 @@ async def create_holding(db: AsyncSession, portfolio_id: int, holding_create: Ho
     return db_holding
 
 
+async def upsert_holdings(db: AsyncSession, rows: List[dict]) -> List[Holding]:
+    """
+    Add positions to a portfolio in one INSERT ... ON CONFLICT DO UPDATE.
+
+    Each row holds portfolio_id, asset_id, ticker, quantity, average_cost and
+    current_price, with at most one row per (portfolio_id, ticker). Existing
+    holdings are merged at a quantity-weighted average cost, as in
+    create_holding. Returns the resulting holdings (in no particular order).
+    """
+    dialect = db.get_bind().dialect.name
+    insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+
+    values = [
+        {
+            **row,
+            "cost_basis": row["quantity"] * row["average_cost"],
+            "market_value": row["quantity"] * (row["current_price"] or row["average_cost"]),
+        }
+        for row in rows
+    ]
+    stmt = insert(Holding).values(values)
+    excluded = stmt.excluded
+    new_quantity = Holding.quantity + excluded.quantity
+    new_cost = Holding.quantity * Holding.average_cost + excluded.cost_basis
+    new_average_cost = new_cost / new_quantity
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Holding.portfolio_id, Holding.ticker],
+        set_={
+            "quantity": new_quantity,
+            "average_cost": new_average_cost,
+            "cost_basis": new_cost,
+            "market_value": new_quantity * func.coalesce(excluded.current_price, new_average_cost),
+            "current_price": excluded.current_price,
+            "updated_at": func.now(),
+        },
+    ).returning(Holding)
+
+    # populate_existing refreshes holdings already loaded in this session
+    result = await db.scalars(stmt, execution_options={"populate_existing": True})
+    return list(result.all())
+
+
 async def update_holding(db: AsyncSession, holding_id: int, holding_update: HoldingUpdate) -> Optional[Holding]:
     """Update holding information."""
     db_holding = await get_holding(db, holding_id)
@@ -2,6 +2,7 @@
 User CRUD operations continued - Create, Update, Delete, Authentication.
 """
 
+import asyncio
 from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete
@@ -11,6 +12,7 @@ from datetime import datetime
 from app.models import User, Portfolio
 from app.schemas import UserCreate, UserUpdate
 from app.core.security import get_password_hash, verify_password
+from app.core.cache import invalidate_refresh_user
 
 
 async def create_user(db: AsyncSession, user_create: UserCreate) -> User:
@@ -68,19 +70,26 @@ async def update_user_password(
     db: AsyncSession, user_id: int, new_password: str
 ) -> bool:
     """Update user password."""
+    # bcrypt is deliberately slow; hash off the event loop
+    hashed_password = await asyncio.to_thread(get_password_hash, new_password)
     stmt = (
         update(User)
         .where(User.id == user_id)
         .values(
-            hashed_password=get_password_hash(new_password),
+            hashed_password=hashed_password,
             updated_at=datetime.utcnow(),
         )
+        .returning(User.username)
     )
 
-    result = await db.execute(stmt)
+    username = (await db.execute(stmt)).scalar_one_or_none()
     await db.commit()
 
-    return result.rowcount > 0
+    if username is None:
+        return False
+    # Token refresh caches that the user is active; make it look again
+    await invalidate_refresh_user(username)
+    return True
 
 
 async def update_last_login(db: AsyncSession, user_id: int) -> bool:
@@ -99,12 +108,17 @@ async def deactivate_user(db: AsyncSession, user_id: int) -> bool:
         update(User)
         .where(User.id == user_id)
         .values(is_active=False, updated_at=datetime.utcnow())
+        .returning(User.username)
     )
 
-    result = await db.execute(stmt)
+    username = (await db.execute(stmt)).scalar_one_or_none()
     await db.commit()
 
-    return result.rowcount > 0
+    if username is None:
+        return False
+    # Stop /auth/refresh from trusting its cached "active" flag
+    await invalidate_refresh_user(username)
+    return True
 
 
 async def authenticate_user(
@@ -119,7 +133,9 @@ async def authenticate_user(
     if not user.is_active:
         return None
 
-    if not verify_password(password, user.hashed_password):
+    # bcrypt verification takes tens of ms; run it in a worker thread so
+    # concurrent requests are not serialized behind it
+    if not await asyncio.to_thread(verify_password, password, user.hashed_password):
         return None
 
     # Update last login
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import csv
 import io
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, datetime, timezone
 from typing import Any, Callable, Dict, Iterable
 
 from fastapi import HTTPException
@@ -112,12 +113,11 @@ async def _build_onboarding_status(ctx: HandlerContext) -> dict[str, Any]:
 
 
 async def _onboard_assets(ctx: HandlerContext, asset_items: list[dict[str, Any]]) -> dict[str, Any]:
-    from sqlalchemy import select
+    from sqlalchemy import insert
 
     from app.api.v1.assets import AssetOnboardingRequest, batch_fetch_asset_data
-    from app.models.asset import Asset
-    from app.models.holding import Holding
-    from app.models.transaction import Transaction
+    from app.crud import create_assets, get_assets_by_tickers, upsert_holdings
+    from app.models.transaction import Transaction, TransactionType
 
     user, portfolio = await _ensure_current_portfolio(ctx)
     data = [AssetOnboardingRequest.model_validate(item) for item in asset_items]
@@ -126,10 +126,7 @@ async def _onboard_assets(ctx: HandlerContext, asset_items: list[dict[str, Any]]
     errors: list[str] = []
 
     tickers = [item.ticker.upper().strip() for item in data]
-    stmt = select(Asset).where(Asset.ticker.in_(tickers))
-    result = await ctx.db.execute(stmt)
-    existing_assets_list = result.scalars().all()
-    existing_assets = {asset.ticker: asset for asset in existing_assets_list}
+    existing_assets = await get_assets_by_tickers(ctx.db, tickers)
     asset_data_map = await batch_fetch_asset_data(data, existing_assets)
 
     asset_model_fields = {
@@ -149,76 +146,95 @@ async def _onboard_assets(ctx: HandlerContext, asset_items: list[dict[str, Any]]
         "last_price_update",
     }
 
+    # Create the missing assets first in one INSERT ... RETURNING so they all get IDs
+    new_asset_rows: dict[str, dict[str, Any]] = {}
+    failed_tickers: set[str] = set()
+    for item in data:
+        ticker = item.ticker.upper().strip()
+        try:
+            asset_data = asset_data_map.get(ticker)
+            if ticker in existing_assets or not asset_data:
+                continue
+            new_asset_rows.setdefault(
+                ticker, {key: value for key, value in asset_data.items() if key in asset_model_fields}
+            )
+        except Exception as exc:
+            errors.append(f"Error processing {item.ticker}: {str(exc)}")
+            failed_tickers.add(ticker)
+    if new_asset_rows:
+        new_assets = await create_assets(ctx.db, list(new_asset_rows.values()))
+        existing_assets.update(zip(new_asset_rows, new_assets))
+
+    # Positions are merged per ticker into one holding upsert and the buys go
+    # in as one multi-row INSERT ... RETURNING, as in onboard_asset
+    pending: list[tuple[dict[str, Any], str]] = []
+    holding_rows: dict[str, dict[str, Any]] = {}
+    tx_rows: list[dict[str, Any]] = []
+    now = datetime.now(timezone.utc)
     for item in data:
         try:
             ticker = item.ticker.upper().strip()
             asset_obj = existing_assets.get(ticker)
-
             if not asset_obj:
-                asset_data = asset_data_map.get(ticker)
-                if not asset_data:
+                if ticker not in failed_tickers:
                     errors.append(f"Could not fetch data for ticker: {ticker}")
-                    continue
-                filtered_asset_data = {key: value for key, value in asset_data.items() if key in asset_model_fields}
-                asset_obj = Asset(**filtered_asset_data)
-                ctx.db.add(asset_obj)
-                await ctx.db.flush()
-
-            existing_holding_stmt = select(Holding).where(Holding.portfolio_id == portfolio.id, Holding.ticker == ticker)
-            existing_holding = (await ctx.db.execute(existing_holding_stmt)).scalar_one_or_none()
-
-            if existing_holding:
-                new_total_quantity = existing_holding.quantity + item.quantity
-                new_total_cost = (existing_holding.quantity * existing_holding.average_cost) + (item.quantity * item.average_cost)
-                new_average_cost = new_total_cost / new_total_quantity
-                existing_holding.quantity = new_total_quantity
-                existing_holding.average_cost = new_average_cost
-                existing_holding.cost_basis = new_total_quantity * new_average_cost
-                existing_holding.market_value = new_total_quantity * (asset_obj.current_price or new_average_cost)
-                existing_holding.current_price = asset_obj.current_price
-                holding_to_use = existing_holding
+                continue
+
+            row = holding_rows.get(ticker)
+            if row:
+                total_quantity = row["quantity"] + item.quantity
+                holding_row = {
+                    **row,
+                    "quantity": total_quantity,
+                    "average_cost": (row["quantity"] * row["average_cost"] + item.quantity * item.average_cost) / total_quantity,
+                }
             else:
-                holding_to_use = Holding(
-                    asset_id=asset_obj.id,
-                    ticker=asset_obj.ticker,
-                    quantity=item.quantity,
-                    average_cost=item.average_cost,
-                    portfolio_id=portfolio.id,
-                    cost_basis=item.quantity * item.average_cost,
-                    market_value=item.quantity * (asset_obj.current_price or item.average_cost),
-                    current_price=asset_obj.current_price,
-                )
-                ctx.db.add(holding_to_use)
-
-            await ctx.db.flush()
-
-            transaction = Transaction(
-                portfolio_id=holding_to_use.portfolio_id,
-                asset_id=asset_obj.id,
-                transaction_type="BUY",
-                quantity=item.quantity,
-                price=item.average_cost,
-            )
-            ctx.db.add(transaction)
-            await ctx.db.flush()
-
-            created_assets.append(
-                {
-                    "ticker": ticker,
-                    "name": asset_obj.name or ticker,
+                holding_row = {
+                    "portfolio_id": portfolio.id,
+                    "asset_id": asset_obj.id,
+                    "ticker": asset_obj.ticker,
                     "quantity": item.quantity,
                     "average_cost": item.average_cost,
-                    "purchase_cost": item.quantity * item.average_cost,
                     "current_price": asset_obj.current_price,
-                    "market_value": holding_to_use.market_value,
-                    "asset_id": asset_obj.id,
-                    "holding_id": holding_to_use.id,
-                    "transaction_id": transaction.id,
                 }
-            )
+            tx_row = {
+                "portfolio_id": portfolio.id,
+                "asset_id": asset_obj.id,
+                "transaction_type": TransactionType.BUY,
+                "quantity": item.quantity,
+                "price": item.average_cost,
+                "transaction_date": now,
+            }
+            entry = {
+                "ticker": ticker,
+                "name": asset_obj.name or ticker,
+                "quantity": item.quantity,
+                "average_cost": item.average_cost,
+                "purchase_cost": item.quantity * item.average_cost,
+                "current_price": asset_obj.current_price,
+                "asset_id": asset_obj.id,
+            }
+
+            # Recorded together so holding_rows, tx_rows and pending stay in step
+            holding_rows[ticker] = holding_row
+            tx_rows.append(tx_row)
+            pending.append((entry, asset_obj.ticker))
         except Exception as exc:
             errors.append(f"Error processing {item.ticker}: {str(exc)}")
 
+    if pending:
+        holdings = {holding.ticker: holding for holding in await upsert_holdings(ctx.db, list(holding_rows.values()))}
+        result = await ctx.db.execute(
+            insert(Transaction).returning(Transaction.id, sort_by_parameter_order=True),
+            tx_rows,
+        )
+        for (entry, holding_ticker), transaction_id in zip(pending, result.scalars().all()):
+            holding = holdings[holding_ticker]
+            entry["market_value"] = holding.market_value
+            entry["holding_id"] = holding.id
+            entry["transaction_id"] = transaction_id
+            created_assets.append(entry)
+
     if created_assets:
         await ctx.db.commit()
         await notify_resource_updated("portfolio://current/holdings")
@@ -926,11 +942,7 @@ async def tool_onboarding_import_assets(ctx: HandlerContext, arguments: Dict[str
     )
 
 
-async def tool_onboarding_import_csv(ctx: HandlerContext, arguments: Dict[str, Any]) -> ToolResult:
-    csv_content = str(arguments.get("csv_content") or "")
-    if not csv_content.strip():
-        raise invalid_params(message="csv_content is required")
-
+def _parse_onboarding_csv(csv_content: str) -> list[dict[str, Any]]:
     reader = csv.DictReader(io.StringIO(csv_content))
     assets: list[dict[str, Any]] = []
     for row in reader:
@@ -947,7 +959,16 @@ async def tool_onboarding_import_csv(ctx: HandlerContext, arguments: Dict[str, A
                     "currency": row.get("CURRENCY", row.get("currency", "USD")),
                 }
             )
+    return assets
+
+
+async def tool_onboarding_import_csv(ctx: HandlerContext, arguments: Dict[str, Any]) -> ToolResult:
+    csv_content = str(arguments.get("csv_content") or "")
+    if not csv_content.strip():
+        raise invalid_params(message="csv_content is required")
 
+    # Large pastes take a while to parse; keep that off the event loop
+    assets = await asyncio.to_thread(_parse_onboarding_csv, csv_content)
     if not assets:
         raise invalid_params(message="No valid assets found in csv_content")
 
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import time
 import asyncio
 from typing import Any, Iterable
 from uuid import uuid4
 
+import orjson
+
 from fastapi.encoders import jsonable_encoder
 from fastapi import APIRouter, Depends, Header, Request, Response
 from fastapi.responses import JSONResponse, StreamingResponse
@@ -147,15 +148,34 @@ async def _dispatch_rpc(request_model: JSONRPCRequest, context: HandlerContext)
         return _to_error_response(request_model.id, internal_error(data={"error": str(exc)}))
 
 
+_SSE_DONE = b"event: done\ndata: {}\n\n"
+
+
+def _sse_frame(data: Any, event: str = "message", event_id: Any = None) -> bytes:
+    """
+    Encode one SSE frame as bytes.
+
+    Dicts are serialized with orjson and JSON-RPC models with pydantic-core,
+    so frames skip both the stdlib encoder and str -> bytes re-encoding
+    in StreamingResponse.
+    """
+    if isinstance(data, JSONRPCResponse):
+        body = data.__pydantic_serializer__.to_json(data, exclude_none=True)
+    else:
+        body = orjson.dumps(data)
+    head = f"id: {event_id}\nevent: {event}\ndata: " if event_id is not None else f"event: {event}\ndata: "
+    return head.encode() + body + b"\n\n"
+
+
 async def _iter_sse(response_payloads: Iterable[JSONRPCResponse], request_id: str):
-    yield f"event: ready\ndata: {json.dumps({'requestId': request_id})}\n\n"
+    yield _sse_frame({"requestId": request_id}, event="ready")
     for payload in response_payloads:
-        yield f"event: message\ndata: {payload.model_dump_json(exclude_none=True)}\n\n"
-    yield "event: done\ndata: {}\n\n"
+        yield _sse_frame(payload)
+    yield _SSE_DONE
 
 
 async def _iter_sse_with_logs(response_payloads: Iterable[JSONRPCResponse], request_id: str, rpc_method: str, duration_ms: float, failed: bool):
-    yield f"event: ready\ndata: {json.dumps({'requestId': request_id})}\n\n"
+    yield _sse_frame({"requestId": request_id}, event="ready")
     level = "warning" if failed else "info"
     if should_emit_client_log(level):
         notification = {
@@ -172,10 +192,10 @@ async def _iter_sse_with_logs(response_payloads: Iterable[JSONRPCResponse], requ
                 },
             },
         }
-        yield f"event: message\ndata: {json.dumps(notification)}\n\n"
+        yield _sse_frame(notification)
     for payload in response_payloads:
-        yield f"event: message\ndata: {payload.model_dump_json(exclude_none=True)}\n\n"
-    yield "event: done\ndata: {}\n\n"
+        yield _sse_frame(payload)
+    yield _SSE_DONE
 
 
 async def _iter_session_sse(session_id: str):
@@ -190,7 +210,7 @@ async def _iter_session_sse(session_id: str):
             except asyncio.TimeoutError:
                 yield ": keepalive\n\n"
                 continue
-            yield f"id: {event['event_id']}\nevent: message\ndata: {json.dumps(event['payload'])}\n\n"
+            yield _sse_frame(event["payload"], event_id=event["event_id"])
     except asyncio.CancelledError:
         raise
     finally:
@@ -87,11 +87,15 @@ class Holding(Base):
     @property
     def gain_loss(self) -> float:
         """Calculate unrealized gain/loss."""
-        return self.current_value - self.total_cost
+        total_cost = self.quantity * self.average_cost
+        if self.current_price is None:
+            return 0.0  # current value falls back to cost
+        return self.quantity * self.current_price - total_cost
 
     @property
     def gain_loss_percentage(self) -> float:
         """Calculate unrealized gain/loss percentage."""
-        if self.total_cost == 0:
+        total_cost = self.quantity * self.average_cost
+        if total_cost == 0 or self.current_price is None:
             return 0.0
-        return (self.gain_loss / self.total_cost) * 100
+        return (self.quantity * self.current_price - total_cost) / total_cost * 100
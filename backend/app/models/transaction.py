@@ -9,6 +9,7 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     Enum,
+    Index,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -35,6 +36,10 @@ class Transaction(Base):
     """Transaction model for recording buy/sell activities."""
 
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Covers per-portfolio history and the FIFO lot lookup on every sell
+        Index("ix_transactions_portfolio_asset_date", "portfolio_id", "asset_id", "transaction_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     portfolio_id = Column(Integer, ForeignKey("portfolios.id"), nullable=False)
@@ -6,8 +6,9 @@ import asyncio
 import logging
 import ast
 import re
+import time
 from bs4 import BeautifulSoup
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import date, datetime, timedelta
 from urllib.parse import unquote
 
@@ -32,6 +33,11 @@ except ImportError:
     session = requests.Session()
     logger.warning("curl_cffi not available; Barchart may be blocked on VPS IPs")
 
+# In-process cache for get_asset_info, so bursts of onboarding/refresh calls for
+# the same ticker share one upstream fetch
+ASSET_INFO_CACHE_TTL = 60  # seconds
+ASSET_INFO_CACHE_MAX_SIZE = 4096
+
 
 class FinanceService:
     """Service for fetching financial data from Yahoo Finance and other sources."""
@@ -45,6 +51,19 @@ class FinanceService:
         "priceChange,percentChange,volume,symbolCode,symbolType"
     )
 
+    # (TICKER, asset_type) -> (expiry on the monotonic clock, asset info)
+    _asset_info_cache: Dict[Tuple[str, Optional[str]], Tuple[float, Dict[str, Any]]] = {}
+    # (event loop, TICKER, asset_type) -> fetch task that concurrent callers share
+    _asset_info_inflight: Dict[Tuple[Any, str, Optional[str]], "asyncio.Task"] = {}
+
+    @staticmethod
+    def invalidate_asset_info(ticker: str) -> None:
+        """Drop cached asset info for a ticker (all asset types)."""
+        ticker = ticker.upper()
+        cache = FinanceService._asset_info_cache
+        for key in [key for key in cache if key[0] == ticker]:
+            cache.pop(key, None)
+
     @staticmethod
     async def _session_get(*args, **kwargs):
         return await asyncio.to_thread(session.get, *args, **kwargs)
@@ -127,14 +146,52 @@ class FinanceService:
         Returns:
             Dictionary with asset information or None if not found
         """
+        cache = FinanceService._asset_info_cache
+        cache_key = (ticker.upper(), asset_type)
+        cached = cache.get(cache_key)
+        if cached is not None and cached[0] > time.monotonic():
+            # Callers may annotate the dict (e.g. currency overrides), so hand out copies
+            return dict(cached[1])
+
+        # Concurrent misses for the same ticker await one upstream fetch. Tasks
+        # are bound to their event loop, and some callers run this coroutine in
+        # a worker thread via asyncio.run, so the loop is part of the key.
+        loop = asyncio.get_running_loop()
+        inflight = FinanceService._asset_info_inflight
+        inflight_key = (loop, *cache_key)
+        task = inflight.get(inflight_key)
+        if task is None:
+            task = loop.create_task(FinanceService._load_asset_info(ticker, asset_type))
+            inflight[inflight_key] = task
+            task.add_done_callback(lambda _: inflight.pop(inflight_key, None))
+
+        # shield: one caller being cancelled must not cancel the shared fetch
+        asset_info = await asyncio.shield(task)
+        return dict(asset_info) if asset_info else asset_info
+
+    @staticmethod
+    async def _load_asset_info(ticker: str, asset_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Fetch asset information upstream and store successful results in the cache."""
         # Route to appropriate fetcher based on asset_type
         if asset_type == 'mutual_fund':
-            return await FinanceService._get_mutual_fund_info(ticker)
+            asset_info = await FinanceService._get_mutual_fund_info(ticker)
         elif asset_type == 'crypto':
-            return await FinanceService._get_crypto_info(ticker)
+            asset_info = await FinanceService._get_crypto_info(ticker)
         else:
             # Default to stock/ETF via Yahoo Finance
-            return await FinanceService._get_stock_info(ticker, asset_type)
+            asset_info = await FinanceService._get_stock_info(ticker, asset_type)
+
+        # Failed lookups are not cached so a transient error can be retried at once
+        if asset_info:
+            cache = FinanceService._asset_info_cache
+            if len(cache) >= ASSET_INFO_CACHE_MAX_SIZE:
+                now = time.monotonic()
+                for key in [key for key, (expiry, _) in cache.items() if expiry <= now]:
+                    del cache[key]
+                if len(cache) >= ASSET_INFO_CACHE_MAX_SIZE:
+                    cache.pop(next(iter(cache)))
+            cache[(ticker.upper(), asset_type)] = (time.monotonic() + ASSET_INFO_CACHE_TTL, dict(asset_info))
+        return asset_info
 
     @staticmethod
     async def _get_stock_info(ticker: str, asset_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
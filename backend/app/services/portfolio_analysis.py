@@ -2,6 +2,9 @@
 Portfolio analysis service - Production implementation using real market data.
 """
 
+import functools
+import logging
+import os
 import numpy as np
 import pandas as pd
 import asyncio
@@ -9,7 +12,8 @@ from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import and_
+from sqlalchemy.orm import contains_eager
 from concurrent.futures import ThreadPoolExecutor
 
 # Core imports from portfolio_manager
@@ -20,16 +24,15 @@ from portfolio_manager.analytics.risk import RiskAnalytics
 from portfolio_manager.analytics import (
     annualize_rets,
     annualize_vol,
-    sharpe_ratio,
-    drawdown,
-    semideviation,
-    var_historic,
-    cvar_historic,
-    portfolio_return,
-    portfolio_vol,
+    drawdown_from_wealth,
+    max_drawdown,
+    var_cvar_historic,
+    percentiles,
     msr,
     gmv,
     optimal_weights,
+    cov_cholesky,
+    ledoit_wolf_cov,
     run_cppi,
     gbm,
 )
@@ -37,6 +40,19 @@ from portfolio_manager.analytics import (
 from app.models.holding import Holding
 from app.models.portfolio import Portfolio as DBPortfolio
 from app.services.exchange_rate_service import get_exchange_rate_service
+from app.core.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# CPU-bound analytics (optimizers, simulations, metric reductions) run on this
+# bounded pool so the event loop keeps serving other requests meanwhile
+_compute_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="analytics")
+
+
+async def _run_in_compute_pool(fn, *args, **kwargs):
+    """Run a blocking analytics function on the compute pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_compute_executor, functools.partial(fn, *args, **kwargs))
 
 
 def map_asset_type(asset_type_str: Optional[str]) -> AssetType:
@@ -81,6 +97,37 @@ class AdvancedPortfolioAnalytics:
         self._cached_portfolio = None
         self._cached_portfolio_value = None  # Store the actual market value
         self._building_portfolio = False  # Prevent concurrent builds
+        self._holdings_snapshot = None  # (db_portfolio, holdings) loaded once per instance
+
+    async def _load_holdings(self):
+        """
+        Load the portfolio row and its open holdings (with assets) in one query.
+
+        Every analysis method needs the same rows, so they are fetched with a
+        single outer JOIN and reused for the lifetime of this instance.
+
+        Returns:
+            Tuple of (db_portfolio or None, list of holdings)
+        """
+        if self._holdings_snapshot is not None:
+            return self._holdings_snapshot
+
+        result = await self.db.execute(
+            select(DBPortfolio, Holding)
+            .outerjoin(
+                Holding,
+                and_(Holding.portfolio_id == DBPortfolio.id, Holding.quantity > 0),
+            )
+            .outerjoin(Holding.asset)
+            .options(contains_eager(Holding.asset))
+            .where(DBPortfolio.id == self.portfolio_id)
+        )
+        rows = result.unique().all()
+
+        db_portfolio = rows[0][0] if rows else None
+        holdings = [holding for _, holding in rows if holding is not None]
+        self._holdings_snapshot = (db_portfolio, holdings)
+        return self._holdings_snapshot
 
     async def _build_portfolio(self) -> Optional[Portfolio]:
         """
@@ -94,23 +141,11 @@ class AdvancedPortfolioAnalytics:
             print(f"[INFO] Returning cached portfolio (value: ${self._cached_portfolio_value:.2f})")
             return self._cached_portfolio
 
-        result = await self.db.execute(
-            select(Holding)
-            .where(Holding.portfolio_id == self.portfolio_id)
-            .where(Holding.quantity > 0)
-            .options(selectinload(Holding.asset))
-        )
-        holdings = result.scalars().all()
+        db_portfolio, holdings = await self._load_holdings()
 
         if not holdings:
             return None
 
-        # Get portfolio currency
-        portfolio_result = await self.db.execute(
-            select(DBPortfolio).where(DBPortfolio.id == self.portfolio_id)
-        )
-        db_portfolio = portfolio_result.scalar_one_or_none()
-
         # Use display currency or portfolio's base currency
         display_currency = self.display_currency or (db_portfolio.currency if db_portfolio else "USD")
         exchange_service = get_exchange_rate_service()
@@ -162,11 +197,13 @@ class AdvancedPortfolioAnalytics:
                     realtime_market_value = realtime_market_value * rate
 
                 result['realtime_value'] = realtime_market_value
-                print(f"Adding {asset_model.ticker} to real-time total: qty={holding.quantity}, price=${realtime_price:.2f}, value=${realtime_market_value:.2f} {display_currency}")
+                logger.debug("Adding %s to real-time total: qty=%s, price=$%.2f, value=$%.2f %s",
+                             asset_model.ticker, holding.quantity, realtime_price, realtime_market_value, display_currency)
 
             # CRITICAL FIX: Skip yfinance for crypto and mutual_fund
             if asset_model.asset_type in ['crypto', 'mutual_fund']:
-                print(f"[INFO] Skipping yfinance for {asset_model.ticker} (asset_type={asset_model.asset_type}), using DB price only")
+                logger.debug("Skipping yfinance for %s (asset_type=%s), using DB price only",
+                             asset_model.ticker, asset_model.asset_type)
                 return result
 
             # Fetch yfinance data in thread pool (yfinance is blocking/sync)
@@ -205,10 +242,11 @@ class AdvancedPortfolioAnalytics:
                         'current_price': yfinance_price
                     }
 
-                    print(f"Asset {asset_model.ticker}: qty={holding.quantity}, yfinance=${yfinance_price:.2f}, value=${market_value:.2f} {display_currency}")
+                    logger.debug("Asset %s: qty=%s, yfinance=$%.2f, value=$%.2f %s",
+                                 asset_model.ticker, holding.quantity, yfinance_price, market_value, display_currency)
 
             except Exception as e:
-                print(f"[ERROR] Could not fetch data for {asset_model.ticker}: {e}")
+                logger.warning("Could not fetch data for %s: %s", asset_model.ticker, e)
 
             return result
 
@@ -247,10 +285,10 @@ class AdvancedPortfolioAnalytics:
                 price_data=data['price_data']
             )
             
-            print(f"Added {ticker}: weight={weight:.4f} ({weight*100:.2f}%)")
+            logger.debug("Added %s: weight=%.4f (%.2f%%)", ticker, weight, weight * 100)
         
         # Validation: ensure weights sum to 1.0 (100%)
-        print(f"Total weight: {total_weight:.6f} (should be 1.0)")
+        print(f"[INFO] Portfolio built: {len(assets_data)} assets, total weight {total_weight:.6f}")
         if abs(total_weight - 1.0) > 0.01:  # Allow small floating point errors
             print(f"[WARNING] Weights don't sum to 1.0: {total_weight}")
 
@@ -296,7 +334,6 @@ class AdvancedPortfolioAnalytics:
         Retrieve cached (returns, total_value) from Redis.
         Returns (pd.Series, float) on hit, (None, None) on miss.
         """
-        from app.core.redis_client import get_redis_client
         cache_key = f"portfolio:{self.portfolio_id}:returns_cache"
         redis_client = await get_redis_client()
         cached = await redis_client.get(cache_key)
@@ -314,7 +351,6 @@ class AdvancedPortfolioAnalytics:
 
     async def _cache_returns(self, returns: pd.Series, total_value: float) -> None:
         """Store portfolio returns + value in Redis for 15 minutes."""
-        from app.core.redis_client import get_redis_client
         cache_key = f"portfolio:{self.portfolio_id}:returns_cache"
         redis_client = await get_redis_client()
         try:
@@ -336,7 +372,6 @@ class AdvancedPortfolioAnalytics:
         Retrieve full analytics cache: (portfolio_returns, asset_returns_dict, weights, total_value).
         Returns a 4-tuple on hit, None on miss.
         """
-        from app.core.redis_client import get_redis_client
         cache_key = f"portfolio:{self.portfolio_id}:analytics_cache"
         redis_client = await get_redis_client()
         cached = await redis_client.get(cache_key)
@@ -367,7 +402,6 @@ class AdvancedPortfolioAnalytics:
         total_value: float,
     ) -> None:
         """Store full analytics dataset in Redis for 15 minutes."""
-        from app.core.redis_client import get_redis_client
         cache_key = f"portfolio:{self.portfolio_id}:analytics_cache"
         redis_client = await get_redis_client()
         try:
@@ -412,43 +446,50 @@ class AdvancedPortfolioAnalytics:
             return value
 
         try:
-            # Portfolio-level metrics (all use portfolio_returns directly)
-            annual_return = float(annualize_rets(portfolio_returns, 252))
-            annual_vol = float(annualize_vol(portfolio_returns, 252))
-            sharp = float(sharpe_ratio(portfolio_returns, self.risk_free_rate, 252))
+            # Portfolio-level metrics from one ndarray: the same formulas as
+            # annualize_rets/annualize_vol/sharpe_ratio/semideviation without
+            # re-walking the Series once per helper
+            r = portfolio_returns.to_numpy(dtype=float)
+            periods_scale = 252 / r.size
+            daily_rf = (1 + self.risk_free_rate) ** (1 / 252) - 1
+            annual_return = float(np.expm1(np.log1p(r).sum() * periods_scale))
+            annual_vol = float(r.std(ddof=1) * np.sqrt(252))
+            sharp = float(np.expm1(np.log1p(r - daily_rf).sum() * periods_scale) / annual_vol)
 
             # Sortino ratio
-            daily_rf = (1 + self.risk_free_rate) ** (1 / 252) - 1
-            downside_returns = portfolio_returns[portfolio_returns < daily_rf]
-            if len(downside_returns) > 0:
-                downside_std = float(downside_returns.std() * np.sqrt(252))
+            downside_returns = r[r < daily_rf]
+            if downside_returns.size > 0:
+                downside_std = float(downside_returns.std(ddof=1) * np.sqrt(252)) if downside_returns.size > 1 else np.nan
                 sortino = (annual_return - self.risk_free_rate) / downside_std if downside_std > 0 else np.inf
             else:
                 sortino = np.inf if annual_return > self.risk_free_rate else 0.0
 
             # Max drawdown + Calmar
-            dd_df = drawdown(portfolio_returns)
-            max_dd_val = float(dd_df["Drawdown"].min())
+            max_dd_val = float(max_drawdown(portfolio_returns))
             calmar = annual_return / abs(max_dd_val) if abs(max_dd_val) > 1e-9 else np.inf
 
             # Risk metrics
-            hist_var_95 = float(var_historic(portfolio_returns, level=5))
-            hist_var_99 = float(var_historic(portfolio_returns, level=1))
-            hist_cvar_95 = float(cvar_historic(portfolio_returns, level=5))
-            semi_dev = float(semideviation(portfolio_returns))
+            hist_tail = var_cvar_historic(portfolio_returns, levels=(5, 1))
+            hist_var_95 = float(hist_tail[5][0])
+            hist_var_99 = float(hist_tail[1][0])
+            hist_cvar_95 = float(hist_tail[5][1])
+            losses = r[r < 0]
+            semi_dev = float(losses.std(ddof=0)) if losses.size > 0 else np.nan
 
             # Individual asset performance
             individual_performance = {}
             if asset_returns_dict:
                 returns_df = pd.DataFrame(asset_returns_dict).dropna()
                 if not returns_df.empty:
-                    for symbol in returns_df.columns:
-                        s = returns_df[symbol]
-                        if not s.empty:
-                            individual_performance[symbol] = {
-                                "return": float(annualize_rets(s, 252)),
-                                "volatility": float(annualize_vol(s, 252)),
-                            }
+                    # The frame is only needed to align dates; reduce the
+                    # (T, n) array column-wise for every asset at once
+                    R = returns_df.to_numpy(dtype=float)
+                    asset_rets = np.expm1(np.log1p(R).sum(axis=0) * (252 / R.shape[0]))
+                    asset_vols = R.std(axis=0, ddof=1) * np.sqrt(252)
+                    individual_performance = {
+                        symbol: {"return": float(ret), "volatility": float(vol)}
+                        for symbol, ret, vol in zip(returns_df.columns, asset_rets, asset_vols)
+                    }
 
             concentration_risk = max(weights.values()) if weights else 0.0
 
@@ -488,8 +529,8 @@ class AdvancedPortfolioAnalytics:
             portfolio_returns = portfolio_returns.dropna().copy()
             if len(portfolio_returns) >= 50:
                 print(f"[INFO] Metrics: using analytics cache ({len(portfolio_returns)} days)")
-                return self._compute_metrics_from_returns(
-                    portfolio_returns, asset_returns_dict, weights, total_value
+                return await _run_in_compute_pool(
+                    self._compute_metrics_from_returns, portfolio_returns, asset_returns_dict, weights, total_value
                 )
 
         # Slow path: build portfolio from yfinance (populates cache as side effect)
@@ -498,7 +539,7 @@ class AdvancedPortfolioAnalytics:
             return {}
 
         portfolio_returns = portfolio.get_portfolio_returns()
-        print(f"Metrics: portfolio_returns shape: {portfolio_returns.shape}")
+        logger.debug("Metrics: portfolio_returns shape: %s", portfolio_returns.shape)
 
         if portfolio_returns.empty:
             return {}
@@ -519,9 +560,11 @@ class AdvancedPortfolioAnalytics:
 
         total_value = self._cached_portfolio_value or portfolio.get_total_value()
         weights = dict(portfolio.weights)
-        return self._compute_metrics_from_returns(portfolio_returns, asset_returns_dict, weights, total_value)
+        return await _run_in_compute_pool(
+            self._compute_metrics_from_returns, portfolio_returns, asset_returns_dict, weights, total_value
+        )
 
-    async def _compute_efficient_frontier(
+    def _compute_efficient_frontier(
         self,
         asset_returns_dict: Dict[str, pd.Series],
         weights_map: Dict[str, float],
@@ -538,21 +581,24 @@ class AdvancedPortfolioAnalytics:
 
         print(f"Efficient Frontier: {len(returns_df)} days, {len(returns_df.columns)} assets")
         try:
-            expected_returns = annualize_rets(returns_df, 252)
-            cov_matrix = returns_df.cov() * 252
+            # Statistics come straight from the aligned (T, n) array
+            R = returns_df.to_numpy(dtype=float)
+            er = np.expm1(np.log1p(R).sum(axis=0) * (252 / R.shape[0]))
+            # Shrunk covariance: PD and well conditioned for large universes
+            cov = ledoit_wolf_cov(R) * 252
+
+            # Factor the covariance once; the frontier, MSR and GMV solves and
+            # the batch volatility below all reuse it
+            try:
+                cov_factor = cov_cholesky(cov)
+            except np.linalg.LinAlgError:
+                cov_factor = None
 
             n_points = 20
-            weights_list = optimal_weights(n_points, expected_returns.values, cov_matrix.values)
+            weights_list = optimal_weights(n_points, er, cov, cov_factor=cov_factor)
 
-            frontier_points = []
-            for w in weights_list:
-                frontier_points.append({
-                    "risk": portfolio_vol(w, cov_matrix.values),
-                    "return": portfolio_return(w, expected_returns.values),
-                })
-
-            msr_w = msr(self.risk_free_rate, expected_returns.values, cov_matrix.values)
-            gmv_w = gmv(cov_matrix.values)
+            msr_w = msr(self.risk_free_rate, er, cov, cov_factor=cov_factor)
+            gmv_w = gmv(cov, cov_factor=cov_factor)
 
             # Current portfolio point — use only assets present in the frontier
             ef_symbols = list(returns_df.columns)
@@ -562,23 +608,33 @@ class AdvancedPortfolioAnalytics:
             else:
                 cur_weights = np.ones(len(ef_symbols)) / len(ef_symbols)
 
-            special_portfolios = {
-                "current": {
-                    "name": "Current Portfolio",
-                    "risk": portfolio_vol(cur_weights, cov_matrix.values),
-                    "return": portfolio_return(cur_weights, expected_returns.values),
-                },
-                "msr": {
-                    "name": "Max Sharpe Ratio",
-                    "risk": portfolio_vol(msr_w, cov_matrix.values),
-                    "return": portfolio_return(msr_w, expected_returns.values),
-                },
-                "gmv": {
-                    "name": "Global Minimum Volatility",
-                    "risk": portfolio_vol(gmv_w, cov_matrix.values),
-                    "return": portfolio_return(gmv_w, expected_returns.values),
-                },
-            }
+            # Risk/return of every frontier and special portfolio in one batch:
+            # returns = W @ er, vols = sqrt(diag(W cov W^T)) = row norms of W @ L
+            W = np.vstack(weights_list + [cur_weights, msr_w, gmv_w])
+            rets = W @ er
+            if cov_factor is not None:
+                vols = np.linalg.norm(W @ cov_factor, axis=1)
+            else:
+                vols = np.sqrt(np.einsum("ij,jk,ik->i", W, cov, W))
+
+            frontier_points = [
+                {"risk": float(vols[i]), "return": float(rets[i])}
+                for i in range(len(weights_list))
+            ]
+
+            special_portfolios = {}
+            names = [
+                ("current", "Current Portfolio"),
+                ("msr", "Max Sharpe Ratio"),
+                ("gmv", "Global Minimum Volatility"),
+            ]
+            for offset, (key, name) in enumerate(names):
+                i = len(weights_list) + offset
+                special_portfolios[key] = {
+                    "name": name,
+                    "risk": float(vols[i]),
+                    "return": float(rets[i]),
+                }
 
             print(f"[SUCCESS] Efficient frontier: {len(frontier_points)} points")
             return {"frontier_points": frontier_points, "special_portfolios": special_portfolios}
@@ -596,7 +652,7 @@ class AdvancedPortfolioAnalytics:
             _, asset_returns_dict, weights, _ = cache_result
             if len(asset_returns_dict) >= 2:
                 print("[INFO] Efficient Frontier: using analytics cache")
-                return await self._compute_efficient_frontier(asset_returns_dict, weights)
+                return await _run_in_compute_pool(self._compute_efficient_frontier, asset_returns_dict, weights)
 
         # Slow path: build portfolio
         portfolio = await self._build_portfolio()
@@ -613,10 +669,13 @@ class AdvancedPortfolioAnalytics:
             except Exception as e:
                 print(f"[WARNING] Efficient Frontier: no returns for {symbol}: {e}")
 
-        return await self._compute_efficient_frontier(asset_returns_dict, dict(portfolio.weights))
+        return await _run_in_compute_pool(
+            self._compute_efficient_frontier, asset_returns_dict, dict(portfolio.weights)
+        )
 
-    async def run_monte_carlo_simulation(self, scenarios: int = 1000, time_horizon: int = 252) -> Dict:
-        """Run a Monte Carlo simulation for the portfolio."""
+    async def run_monte_carlo_simulation(self, scenarios: int = 1000, time_horizon: int = 252,
+                                         seed: Optional[int] = None) -> Dict:
+        """Run a Monte Carlo simulation for the portfolio; pass ``seed`` for reproducible paths."""
         # Try cached returns first
         portfolio_returns, total_value = await self._get_cached_returns()
 
@@ -647,14 +706,15 @@ class AdvancedPortfolioAnalytics:
             print(f"[ERROR] Monte Carlo: Insufficient clean data ({len(portfolio_returns)} days)")
             return {}
         
-        print(f"Monte Carlo: Clean returns count: {len(portfolio_returns)}")
+        logger.debug("Monte Carlo: clean returns count: %d", len(portfolio_returns))
 
         try:
             annual_ret = annualize_rets(portfolio_returns, 252)
             annual_vol_sim = annualize_vol(portfolio_returns, 252)
             print(f"[INFO] Monte Carlo using portfolio value: ${total_value:.2f}")
 
-            mc_results = gbm(
+            mc_results = await _run_in_compute_pool(
+                gbm,
                 n_years=time_horizon / 252,
                 n_scenarios=scenarios,
                 mu=annual_ret,
@@ -662,6 +722,10 @@ class AdvancedPortfolioAnalytics:
                 steps_per_year=252,
                 s_0=total_value,
                 prices=True,
+                # Paths feed charts and summary stats only; float32 halves the
+                # scenarios x horizon buffer
+                dtype=np.float32,
+                rng=np.random.default_rng(seed),
             )
             # Ensure mc_results is a numpy array before indexing
             if isinstance(mc_results, pd.DataFrame):
@@ -669,21 +733,25 @@ class AdvancedPortfolioAnalytics:
             elif isinstance(mc_results, pd.Series):
                 mc_results = mc_results.values
 
-            final_values = mc_results[-1, :]
+            # Aggregates are taken in float64
+            final_values = mc_results[-1, :].astype(np.float64)
 
             final_mean = np.mean(final_values)
             final_std = np.std(final_values)
-            percentile_5 = np.percentile(final_values, 5)
-            percentile_95 = np.percentile(final_values, 95)
-            success_probability = np.mean([1 if fv > total_value else 0 for fv in final_values])
-
-            # Data for charts
+            percentile_5, percentile_95 = percentiles(final_values, [5, 95])
+            success_probability = np.mean(final_values > total_value)
+
+            # Data for charts: slice the sample paths and row means once, then
+            # emit plain floats instead of indexing the array per cell
+            n_paths = min(5, scenarios)
+            sample_paths = mc_results[:time_horizon, :n_paths].tolist()
+            mean_path = mc_results[:time_horizon].mean(axis=1, dtype=np.float64).tolist()
+            path_names = [f"path_{j+1}" for j in range(n_paths)]
             path_data = []
-            for i in range(time_horizon):
+            for i, (row, mean_value) in enumerate(zip(sample_paths, mean_path)):
                 day_data = {"day": i}
-                for j in range(min(5, scenarios)):
-                    day_data[f"path_{j+1}"] = mc_results[i, j]
-                day_data["mean_path"] = np.mean(mc_results[i, :])
+                day_data.update(zip(path_names, row))
+                day_data["mean_path"] = mean_value
                 path_data.append(day_data)
 
             hist, bin_edges = np.histogram(final_values, bins=20)
@@ -732,9 +800,9 @@ class AdvancedPortfolioAnalytics:
             await self._cache_returns(portfolio_returns, total_value)
         else:
             print(f"[INFO] CPPI: Using cached returns ({len(portfolio_returns)} days)")
-        print(f"CPPI: portfolio_returns shape: {portfolio_returns.shape}")
-        print(f"CPPI: portfolio_returns empty: {portfolio_returns.empty}")
-        print(f"CPPI: portfolio_returns has NaN: {portfolio_returns.isnull().any()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("CPPI: portfolio_returns shape=%s, empty=%s, has NaN=%s",
+                         portfolio_returns.shape, portfolio_returns.empty, portfolio_returns.isnull().any())
         
         if portfolio_returns.empty:
             print("[ERROR] CPPI: Portfolio returns are empty")
@@ -754,48 +822,61 @@ class AdvancedPortfolioAnalytics:
             print(f"[ERROR] CPPI: Insufficient clean data ({len(portfolio_returns)} days)")
             return {"error": True, "reason": f"Insufficient data: only {len(portfolio_returns)} trading days available (need 50+)", "multiplier": multiplier, "floor": floor}
         
-        print(f"CPPI: Clean returns count: {len(portfolio_returns)}")
-        print(f"CPPI: Returns sample (first 5): {portfolio_returns.head()}")
-        print(f"CPPI: Using actual portfolio value: ${total_value:.2f}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("CPPI: clean returns count: %d", len(portfolio_returns))
+            logger.debug("CPPI: returns sample (first 5):\n%s", portfolio_returns.head())
+            logger.debug("CPPI: using actual portfolio value: $%.2f", total_value)
 
         try:
-            cppi_results = run_cppi(
+            cppi_results = await _run_in_compute_pool(
+                run_cppi,
                 risky_r=portfolio_returns,
                 m=multiplier,
                 start=total_value,
                 floor=floor,
                 riskfree_rate=self.risk_free_rate,
             )
-            print(f"CPPI: cppi_results keys: {cppi_results.keys()}")
-            print(f"CPPI: cppi_results Wealth shape: {cppi_results['Wealth'].shape}")
-            print(f"CPPI: cppi_results Wealth head:\n{cppi_results['Wealth'].head()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("CPPI: cppi_results keys: %s", list(cppi_results.keys()))
+                logger.debug("CPPI: Wealth shape: %s", cppi_results['Wealth'].shape)
+                logger.debug("CPPI: Wealth head:\n%s", cppi_results['Wealth'].head())
             
-            final_cppi_wealth = cppi_results["Wealth"].iloc[-1].iloc[0]
-            final_buyhold_wealth = cppi_results["Risky Wealth"].iloc[-1].iloc[0]
+            final_cppi_wealth = cppi_results["Wealth"].iat[-1, 0]
+            final_buyhold_wealth = cppi_results["Risky Wealth"].iat[-1, 0]
             outperformance = (final_cppi_wealth - final_buyhold_wealth) / final_buyhold_wealth
 
             # Data for charts
-            performance_data = []
-            for i in range(len(cppi_results["Wealth"])):
-                floor_val = float(cppi_results["floor"].iloc[i].squeeze())
-                performance_data.append({
-                    "day": i,
-                    "cppi_wealth": float(cppi_results["Wealth"].iloc[i, 0]),
-                    "buyhold_wealth": float(cppi_results["Risky Wealth"].iloc[i, 0]),
-                    "floor_value": float(floor_val),
-                    "risky_allocation": float(cppi_results["Risky Allocation"].iloc[i, 0]) * 100,
-                    "risk_budget": float(cppi_results["Risk Budget"].iloc[i, 0]) * 100,
-                })
+            # Pull each history column out once instead of .iloc per row
+            def column(frame, scale=1.0):
+                return (frame.iloc[:, 0].to_numpy(dtype=float) * scale).tolist()
 
-            drawdown_cppi = drawdown(cppi_results["Wealth"].iloc[:, 0])
-            drawdown_risky = drawdown(cppi_results["Risky Wealth"].iloc[:, 0])
-            drawdown_data = []
-            for i in range(len(drawdown_cppi)):
-                drawdown_data.append({
+            performance_data = [
+                {
                     "day": i,
-                    "cppi_drawdown": drawdown_cppi['Drawdown'].iloc[i] * 100,
-                    "buyhold_drawdown": drawdown_risky['Drawdown'].iloc[i] * 100,
-                })
+                    "cppi_wealth": cppi_wealth,
+                    "buyhold_wealth": buyhold_wealth,
+                    "floor_value": floor_val,
+                    "risky_allocation": risky_allocation,
+                    "risk_budget": risk_budget,
+                }
+                for i, (cppi_wealth, buyhold_wealth, floor_val, risky_allocation, risk_budget) in enumerate(zip(
+                    column(cppi_results["Wealth"]),
+                    column(cppi_results["Risky Wealth"]),
+                    column(cppi_results["floor"]),
+                    column(cppi_results["Risky Allocation"], 100),
+                    column(cppi_results["Risk Budget"], 100),
+                ))
+            ]
+
+            drawdown_cppi = drawdown_from_wealth(cppi_results["Wealth"].iloc[:, 0])
+            drawdown_risky = drawdown_from_wealth(cppi_results["Risky Wealth"].iloc[:, 0])
+            drawdown_data = [
+                {"day": i, "cppi_drawdown": cppi_dd, "buyhold_drawdown": buyhold_dd}
+                for i, (cppi_dd, buyhold_dd) in enumerate(zip(
+                    (drawdown_cppi["Drawdown"] * 100).tolist(),
+                    (drawdown_risky["Drawdown"] * 100).tolist(),
+                ))
+            ]
 
             # Handle potential NaN or inf values before returning
             def clean_value(value):
@@ -830,24 +911,8 @@ class AdvancedPortfolioAnalytics:
 
     async def sector_analysis(self, display_currency: Optional[str] = None) -> Dict:
         """Analyze portfolio by sector with currency conversion, including cash balance."""
-        import logging
-        logger = logging.getLogger(__name__)
-        from app.services.exchange_rate_service import get_exchange_rate_service
-        from app.models.portfolio import Portfolio as PortfolioModel
-
-        result = await self.db.execute(
-            select(Holding)
-            .where(Holding.portfolio_id == self.portfolio_id)
-            .where(Holding.quantity > 0)
-            .options(selectinload(Holding.asset))
-        )
-        holdings = result.scalars().all()
-
-        # Get portfolio to determine base currency and cash balance
-        portfolio_result = await self.db.execute(
-            select(PortfolioModel).where(PortfolioModel.id == self.portfolio_id)
-        )
-        portfolio_obj = portfolio_result.scalar_one_or_none()
+        # Portfolio (base currency, cash balance) and holdings share one query
+        portfolio_obj, holdings = await self._load_holdings()
         
         if not portfolio_obj:
             return {}
@@ -875,8 +940,12 @@ class AdvancedPortfolioAnalytics:
                 exchange_rates[currency] = rate
                 logger.info(f"[SECTOR_ANALYSIS] Exchange rate {currency} -> {display_currency}: {rate}")
 
-        sector_data = {}
-        total_value = 0
+        # Positions are gathered column-wise (quantity, price, FX rate, sector
+        # label) and valued/aggregated in one vectorized pass below
+        quantities: List[float] = []
+        prices: List[float] = []
+        fx_rates: List[float] = []
+        sectors: List[str] = []
 
         # We need to fetch current prices to get market values
         portfolio = await self._build_portfolio()
@@ -884,7 +953,8 @@ class AdvancedPortfolioAnalytics:
         for holding in holdings:
             asset_symbol = holding.asset.ticker
             asset_currency = holding.asset.currency
-            print(f"[SECTOR_ANALYSIS] Processing {asset_symbol}, asset_type={holding.asset.asset_type}, currency={asset_currency}")
+            logger.debug("[SECTOR_ANALYSIS] Processing %s, asset_type=%s, currency=%s",
+                         asset_symbol, holding.asset.asset_type, asset_currency)
 
             # Check if asset exists in portfolio (stocks with historical data)
             # For mutual funds and crypto, use holding's current_price from database
@@ -899,14 +969,10 @@ class AdvancedPortfolioAnalytics:
                 if current_price is None:
                     continue
 
-            market_value = holding.quantity * current_price
-
             # Convert to display currency if different
+            rate = 1.0
             if asset_currency != display_currency and asset_currency in exchange_rates:
                 rate = exchange_rates[asset_currency]
-                original_value = market_value
-                market_value = market_value * rate
-                logger.info(f"[SECTOR_ANALYSIS] {asset_symbol}: {original_value:.2f} {asset_currency} -> {market_value:.2f} {display_currency} (rate: {rate})")
 
             # Assign sector based on asset type if not available
             if holding.asset.sector:
@@ -920,17 +986,27 @@ class AdvancedPortfolioAnalytics:
             else:
                 sector = "Other"
 
-            logger.info(f"[SECTOR_ANALYSIS] {asset_symbol}: qty={holding.quantity}, price={current_price}, market_value={market_value}, sector={sector}")
+            logger.debug("[SECTOR_ANALYSIS] %s: qty=%s, price=%s, rate=%s, sector=%s",
+                         asset_symbol, holding.quantity, current_price, rate, sector)
 
-            if sector not in sector_data:
-                sector_data[sector] = {
-                    "value": 0,
-                    "positions": 0,
-                }
+            quantities.append(holding.quantity)
+            prices.append(current_price)
+            fx_rates.append(rate)
+            sectors.append(sector)
 
-            sector_data[sector]["value"] += market_value
-            sector_data[sector]["positions"] += 1
-            total_value += market_value
+        market_values = (
+            np.asarray(quantities, dtype=float) * np.asarray(prices, dtype=float) * np.asarray(fx_rates, dtype=float)
+        )
+        # Integer sector ids replace per-position dict lookups in the reduction;
+        # factorize keeps sectors in first-appearance order, as before
+        idx, unique_sectors = pd.factorize(pd.Series(sectors, dtype=object), sort=False)
+        sector_values = np.bincount(idx, weights=market_values, minlength=len(unique_sectors))
+        sector_counts = np.bincount(idx, minlength=len(unique_sectors))
+        sector_data = {
+            str(sector): {"value": float(sector_values[i]), "positions": int(sector_counts[i])}
+            for i, sector in enumerate(unique_sectors)
+        }
+        total_value = float(market_values.sum())
 
         # Add cash balance as a separate "sector"
         cash_balance = portfolio_obj.cash_balance or 0.0
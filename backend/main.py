@@ -33,6 +33,7 @@ if str(BACKEND_DIR) not in sys.path:
 from app.api import api_router
 from app.core.config import settings
 from app.core.database import create_tables, get_db
+from app.core.responses import ORJSONResponse
 from app.core.security import verify_token
 from app.crud import get_user_by_username
 from app.mcp.router import router as mcp_router
@@ -107,6 +108,7 @@ def create_application() -> FastAPI:
         docs_url="/docs" if settings.DEBUG else None,
         redoc_url="/redoc" if settings.DEBUG else None,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     cors_origins, allow_credentials = _build_cors_config()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Database migration script to add lookup indexes.
+
+This script adds the following indexes (create_all does not add indexes to
+tables that already exist):
+- transactions(portfolio_id, asset_id, transaction_date)
+
+holdings(portfolio_id, ticker) and assets(ticker) are already covered by the
+unique constraints on those tables.
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+INDEXES = {
+    "ix_transactions_portfolio_asset_date": (
+        "CREATE INDEX IF NOT EXISTS ix_transactions_portfolio_asset_date "
+        "ON transactions (portfolio_id, asset_id, transaction_date)"
+    ),
+}
+
+def migrate_database(db_path: str = "portfolio.db"):
+    """Run the migration to add lookup indexes."""
+
+    db_file = Path(db_path)
+    if not db_file.exists():
+        print(f"[ERROR] Database file not found: {db_path}")
+        sys.exit(1)
+
+    print(f"[INFO] Migrating database: {db_path}")
+
+    try:
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        existing = {row[0] for row in cursor.fetchall()}
+
+        for name, ddl in INDEXES.items():
+            if name in existing:
+                print(f"    [INFO] {name} already exists")
+                continue
+            print(f"[+] Creating index {name}...")
+            cursor.execute(ddl)
+            print(f"    [OK] {name} created")
+
+        cursor.execute("ANALYZE")
+        conn.commit()
+        print("\n[SUCCESS] Migration completed successfully!")
+
+    except sqlite3.Error as e:
+        print(f"\n[ERROR] Migration failed: {e}")
+        sys.exit(1)
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    # Run migration
+    migrate_database("portfolio.db")
@@ -14,18 +14,18 @@ from .risk_metrics import (
     
     # Basic statistical functions
     skewness, kurtosis, compound, annualize_rets, annualize_vol, 
-    sharpe_ratio, is_normal, drawdown, semideviation, var_historic, 
-    cvar_historic, var_gaussian,
+    sharpe_ratio, is_normal, drawdown, drawdown_from_wealth, max_drawdown, semideviation, moments, var_historic, 
+    cvar_historic, var_cvar_historic, var_gaussian, percentiles,
     
     # Portfolio functions  
     portfolio_return, portfolio_vol, plot_ef2, minimize_vol, msr, gmv, 
-    optimal_weights, plot_ef,
+    optimal_weights, plot_ef, cov_cholesky, ledoit_wolf_cov,
     
     # CPPI and dynamic strategies
     run_cppi, summary_stats,
     
     # Monte Carlo simulation
-    gbm,
+    gbm, gbm_correlated,
     
     # Fixed income functions
     discount, pv, funding_ratio, inst_to_ann, ann_to_inst, cir,
@@ -46,18 +46,18 @@ __all__ = [
     
     # Basic statistical functions
     "skewness", "kurtosis", "compound", "annualize_rets", "annualize_vol", 
-    "sharpe_ratio", "is_normal", "drawdown", "semideviation", "var_historic", 
-    "cvar_historic", "var_gaussian",
+    "sharpe_ratio", "is_normal", "drawdown", "drawdown_from_wealth", "max_drawdown", "semideviation", "moments", "var_historic", 
+    "cvar_historic", "var_cvar_historic", "var_gaussian", "percentiles",
     
     # Portfolio functions  
     "portfolio_return", "portfolio_vol", "plot_ef2", "minimize_vol", "msr", "gmv", 
-    "optimal_weights", "plot_ef",
+    "optimal_weights", "plot_ef", "cov_cholesky", "ledoit_wolf_cov",
     
     # CPPI and dynamic strategies
     "run_cppi", "summary_stats",
     
     # Monte Carlo simulation
-    "gbm",
+    "gbm", "gbm_correlated",
     
     # Fixed income functions
     "discount", "pv", "funding_ratio", "inst_to_ann", "ann_to_inst", "cir",
@@ -3,7 +3,9 @@ Portfolio optimization module using modern portfolio theory.
 """
 
 from typing import Dict, List, Optional, Tuple, Callable
+from collections import OrderedDict
 from datetime import date
+import hashlib
 import pandas as pd
 import numpy as np
 from scipy.optimize import minimize
@@ -11,6 +13,27 @@ import warnings
 
 from ..core.portfolio import Portfolio
 from ..core.asset import Asset
+from .risk_metrics import _tangency_weights, ledoit_wolf_cov
+
+
+# Mean-variance results keyed by a digest of the optimizer inputs, so repeated
+# requests on unchanged data (e.g. frontier refreshes) skip the SLSQP run
+_RESULT_CACHE_SIZE = 128
+_result_cache: "OrderedDict[str, Dict]" = OrderedDict()
+
+
+def _optimization_key(mu: np.ndarray, cov: np.ndarray, symbols: Tuple[str, ...], *params) -> str:
+    """Digest of the statistics, asset order and scalar parameters of one optimization."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(mu, dtype=float).tobytes())
+    digest.update(np.ascontiguousarray(cov, dtype=float).tobytes())
+    digest.update(repr((symbols, params)).encode())
+    return digest.hexdigest()
+
+
+def _copy_result(result: Dict) -> Dict:
+    """Copy a cached result so callers cannot mutate the cache entry."""
+    return {key: dict(value) if isinstance(value, dict) else value for key, value in result.items()}
 
 
 class PortfolioOptimizer:
@@ -38,10 +61,20 @@ class PortfolioOptimizer:
         self._returns_data = None
         self._expected_returns = None
         self._cov_matrix = None
+        # ndarray views of the statistics for the optimizer objectives
+        self._mu = None
+        self._cov = None
+        self._data_key = None
     
     def _prepare_data(self) -> None:
-        """Prepare returns data and calculate statistics."""
-        if self._returns_data is not None:
+        """
+        Prepare returns data and calculate statistics.
+        
+        Results are memoized and reused by every optimization method until
+        the date range or the asset list changes.
+        """
+        data_key = (self.start_date, self.end_date, tuple(asset.symbol for asset in self.assets))
+        if self._returns_data is not None and self._data_key == data_key:
             return
         
         returns_data = {}
@@ -55,13 +88,19 @@ class PortfolioOptimizer:
         
         self._returns_data = pd.DataFrame(returns_data).dropna()
         self._expected_returns = self._returns_data.mean() * 252  # Annualized
-        self._cov_matrix = self._returns_data.cov() * 252  # Annualized
+        # Ledoit-Wolf shrinkage keeps the covariance well conditioned (and PD)
+        # when the universe is large relative to the history
+        self._cov_matrix = ledoit_wolf_cov(self._returns_data) * 252  # Annualized
+        self._mu = np.ascontiguousarray(self._expected_returns.to_numpy(dtype=float))
+        self._cov = np.ascontiguousarray(self._cov_matrix.to_numpy(dtype=float))
+        self._data_key = data_key
     
     def mean_variance_optimization(self, 
                                  target_return: Optional[float] = None,
                                  risk_aversion: Optional[float] = None,
                                  weight_bounds: Tuple[float, float] = (0.0, 1.0),
-                                 constraints: Optional[List] = None) -> Dict:
+                                 constraints: Optional[List] = None,
+                                 initial_weights: Optional[np.ndarray] = None) -> Dict:
         """
         Perform mean-variance optimization.
         
@@ -70,12 +109,25 @@ class PortfolioOptimizer:
             risk_aversion: Risk aversion parameter (alternative to target_return)
             weight_bounds: Min and max weight for each asset
             constraints: Additional constraints
+            initial_weights: Starting point for SLSQP (defaults to equal weights)
             
         Returns:
             Dictionary with optimal weights and portfolio statistics
         """
         self._prepare_data()
         
+        # Custom constraints are arbitrary callables, so only plain problems are memoized
+        cache_key = None
+        if not constraints:
+            cache_key = _optimization_key(
+                self._mu, self._cov, tuple(asset.symbol for asset in self.assets),
+                target_return, risk_aversion, tuple(weight_bounds)
+            )
+            cached = _result_cache.get(cache_key)
+            if cached is not None:
+                _result_cache.move_to_end(cache_key)
+                return _copy_result(cached)
+        
         n_assets = len(self._expected_returns)
         
         # Bounds for each weight
@@ -95,52 +147,69 @@ class PortfolioOptimizer:
             # Minimize variance for target return
             return_constraint = {
                 'type': 'eq',
-                'fun': lambda weights: np.dot(weights, self._expected_returns) - target_return
+                'fun': lambda weights: np.dot(weights, self._mu) - target_return
             }
             all_constraints.append(return_constraint)
             
             def objective(weights):
-                return np.dot(weights.T, np.dot(self._cov_matrix, weights))
+                return np.dot(weights.T, np.dot(self._cov, weights))
             
         elif risk_aversion is not None:
             # Maximize utility: return - (risk_aversion/2) * variance
             def objective(weights):
-                portfolio_return = np.dot(weights, self._expected_returns)
-                portfolio_var = np.dot(weights.T, np.dot(self._cov_matrix, weights))
+                portfolio_return = np.dot(weights, self._mu)
+                portfolio_var = np.dot(weights.T, np.dot(self._cov, weights))
                 return -(portfolio_return - 0.5 * risk_aversion * portfolio_var)
         
         else:
             # Maximize Sharpe ratio (minimize negative Sharpe)
             def objective(weights):
-                portfolio_return = np.dot(weights, self._expected_returns)
-                portfolio_std = np.sqrt(np.dot(weights.T, np.dot(self._cov_matrix, weights)))
+                portfolio_return = np.dot(weights, self._mu)
+                portfolio_std = np.sqrt(np.dot(weights.T, np.dot(self._cov, weights)))
                 if portfolio_std == 0:
                     return -float('inf')
                 return -portfolio_return / portfolio_std
         
-        # Initial guess: equal weights
-        initial_guess = np.array([1.0 / n_assets] * n_assets)
-        
-        # Optimize
-        result = minimize(
-            objective,
-            initial_guess,
-            method='SLSQP',
-            bounds=bounds,
-            constraints=all_constraints,
-            options={'ftol': 1e-9, 'disp': False}
-        )
-        
-        if not result.success:
-            warnings.warn(f"Optimization did not converge: {result.message}")
-        
-        optimal_weights = result.x
+        # The unconstrained max-Sharpe problem has a closed form; use it whenever
+        # it already satisfies the weight bounds and no extra constraints apply
+        closed_form = None
+        if target_return is None and risk_aversion is None and not constraints:
+            closed_form = _tangency_weights(self._cov, self._mu)
+            if closed_form is not None and (closed_form.min() < weight_bounds[0] - 1e-10
+                                            or closed_form.max() > weight_bounds[1] + 1e-10):
+                closed_form = None
+        
+        if closed_form is not None:
+            optimal_weights = closed_form
+            optimization_success, optimization_message = True, 'Closed-form tangency solution'
+        else:
+            # Initial guess: the caller's warm start, else equal weights
+            if initial_weights is not None:
+                initial_guess = np.clip(np.asarray(initial_weights, dtype=float), *weight_bounds)
+            else:
+                initial_guess = np.array([1.0 / n_assets] * n_assets)
+            
+            # Optimize
+            result = minimize(
+                objective,
+                initial_guess,
+                method='SLSQP',
+                bounds=bounds,
+                constraints=all_constraints,
+                options={'ftol': 1e-9, 'disp': False}
+            )
+            
+            if not result.success:
+                warnings.warn(f"Optimization did not converge: {result.message}")
+            
+            optimal_weights = result.x
+            optimization_success, optimization_message = result.success, result.message
         
         # Calculate portfolio statistics
-        portfolio_return = np.dot(optimal_weights, self._expected_returns)
+        portfolio_return = np.dot(optimal_weights, self._mu)
         
         # Calculate portfolio variance step by step for clarity
-        cov_times_weights = np.dot(self._cov_matrix, optimal_weights)
+        cov_times_weights = np.dot(self._cov, optimal_weights)
         portfolio_var = np.dot(optimal_weights.T, cov_times_weights)
         
         # Ensure variance is positive (should always be for valid covariance matrix)
@@ -159,15 +228,22 @@ class PortfolioOptimizer:
             for asset, weight in zip(self.assets, optimal_weights)
         }
         
-        return {
+        result = {
             'weights': weights_dict,
             'expected_return': float(portfolio_return),
             'expected_volatility': float(portfolio_std),  # Fixed key name
             'expected_variance': float(portfolio_var),
             'expected_sharpe': float(sharpe_ratio),  # Fixed key name
-            'optimization_success': result.success,
-            'optimization_message': result.message
+            'optimization_success': optimization_success,
+            'optimization_message': optimization_message
         }
+        
+        if cache_key is not None:
+            _result_cache[cache_key] = _copy_result(result)
+            if len(_result_cache) > _RESULT_CACHE_SIZE:
+                _result_cache.popitem(last=False)
+        
+        return result
     
     def risk_parity_optimization(self, 
                                weight_bounds: Tuple[float, float] = (0.01, 1.0)) -> Dict:
@@ -193,13 +269,13 @@ class PortfolioOptimizer:
         
         def risk_parity_objective(weights):
             """Minimize sum of squared differences in risk contributions."""
-            portfolio_var = np.dot(weights.T, np.dot(self._cov_matrix, weights))
+            portfolio_var = np.dot(weights.T, np.dot(self._cov, weights))
             
             if portfolio_var == 0:
                 return 1e6
             
             # Calculate risk contributions
-            marginal_contrib = np.dot(self._cov_matrix, weights)
+            marginal_contrib = np.dot(self._cov, weights)
             risk_contrib = weights * marginal_contrib / portfolio_var
             
             # Target is equal risk contribution (1/n for each asset)
@@ -226,12 +302,12 @@ class PortfolioOptimizer:
         optimal_weights = result.x
         
         # Calculate portfolio statistics
-        portfolio_return = np.dot(optimal_weights, self._expected_returns)
-        portfolio_var = np.dot(optimal_weights.T, np.dot(self._cov_matrix, optimal_weights))
+        portfolio_return = np.dot(optimal_weights, self._mu)
+        portfolio_var = np.dot(optimal_weights.T, np.dot(self._cov, optimal_weights))
         portfolio_std = np.sqrt(portfolio_var)
         
         # Calculate actual risk contributions
-        marginal_contrib = np.dot(self._cov_matrix, optimal_weights)
+        marginal_contrib = np.dot(self._cov, optimal_weights)
         risk_contrib = optimal_weights * marginal_contrib / portfolio_var if portfolio_var > 0 else np.zeros(len(optimal_weights))
         
         weights_dict = {
@@ -274,21 +350,30 @@ class PortfolioOptimizer:
         
         target_returns = np.linspace(min_ret, max_ret, num_portfolios)
         
+        # Sweep the targets in ascending order, seeding each SLSQP solve with the
+        # previous frontier point; the first one starts from the max-Sharpe weights,
+        # which keeps SLSQP out of the local minima an equal-weight start can hit
+        symbols = [asset.symbol for asset in self.assets]
+        max_sharpe = self.mean_variance_optimization(weight_bounds=weight_bounds)
+        prev_weights = np.array([max_sharpe['weights'][symbol] for symbol in symbols])
+        
         frontier_portfolios = []
         
         for target_ret in target_returns:
             try:
                 result = self.mean_variance_optimization(
                     target_return=target_ret,
-                    weight_bounds=weight_bounds
+                    weight_bounds=weight_bounds,
+                    initial_weights=prev_weights
                 )
                 
                 if result['optimization_success']:
+                    prev_weights = np.array([result['weights'][symbol] for symbol in symbols])
                     portfolio_data = {
                         'target_return': target_ret,
                         'expected_return': result['expected_return'],
-                        'volatility': result['volatility'],
-                        'sharpe_ratio': result['sharpe_ratio']
+                        'volatility': result['expected_volatility'],
+                        'sharpe_ratio': result['expected_sharpe']
                     }
                     
                     # Add weights
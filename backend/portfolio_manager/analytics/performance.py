@@ -10,8 +10,15 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from scipy import stats
 
+# bottleneck is optional; pandas' own rolling mean/std are the fallback
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
 from ..core.portfolio import Portfolio
 from ..utils.cache import cached_analytics
+from .risk_metrics import percentiles, var_cvar_historic
 
 
 class PerformanceAnalytics:
@@ -32,6 +39,58 @@ class PerformanceAnalytics:
         self.portfolio = portfolio
         self._cache = {}
     
+    def _returns(self, start_date: Optional[date] = None,
+                 end_date: Optional[date] = None) -> pd.Series:
+        """
+        Portfolio returns for a period, computed once per portfolio state.
+        
+        Every metric starts from the same weighted return series, so it is
+        memoized on the date range plus the current weights and price data.
+        """
+        key = self._cache_key('returns', start_date, end_date)
+        if key not in self._cache:
+            self._cache[key] = self.portfolio.get_portfolio_returns(start_date, end_date)
+        return self._cache[key]
+    
+    def _drawdown(self, start_date: Optional[date] = None,
+                  end_date: Optional[date] = None) -> pd.DataFrame:
+        """
+        Wealth running peak and drawdown series for a period.
+        
+        Built once per portfolio state and shared by max_drawdown,
+        calmar_ratio and performance_summary.
+        """
+        key = self._cache_key('drawdown', start_date, end_date)
+        if key not in self._cache:
+            returns = self._returns(start_date, end_date)
+            cum_returns = np.cumprod(1 + returns.to_numpy(dtype=float))
+            running_max = np.maximum.accumulate(cum_returns)
+            self._cache[key] = pd.DataFrame({
+                "Peaks": running_max,
+                "Drawdown": (cum_returns - running_max) / running_max
+            }, index=returns.index)
+        return self._cache[key]
+    
+    def _log_growth(self, start_date: Optional[date] = None,
+                    end_date: Optional[date] = None) -> float:
+        """Sum of log1p returns for a period; total and annualized return both derive from it."""
+        key = self._cache_key('log_growth', start_date, end_date)
+        if key not in self._cache:
+            returns = self._returns(start_date, end_date)
+            self._cache[key] = float(np.log1p(returns.to_numpy(dtype=float)).sum())
+        return self._cache[key]
+    
+    def _cache_key(self, name: str, start_date: Optional[date],
+                   end_date: Optional[date]) -> tuple:
+        """Build a cache key and drop entries left over from an older portfolio state."""
+        state = tuple(
+            (symbol, self.portfolio.weights.get(symbol), id(asset.price_data))
+            for symbol, asset in self.portfolio.assets.items()
+        )
+        if self._cache and next(iter(self._cache))[3] != state:
+            self._cache = {}
+        return (name, start_date, end_date, state)
+    
     @cached_analytics('performance', ttl=1800)
     def total_return(self, start_date: Optional[date] = None, 
                     end_date: Optional[date] = None) -> float:
@@ -45,11 +104,11 @@ class PerformanceAnalytics:
         Returns:
             Total return as decimal (0.1 = 10%)
         """
-        returns = self.portfolio.get_portfolio_returns(start_date, end_date)
+        returns = self._returns(start_date, end_date)
         if returns.empty:
             return 0.0
         
-        return float((1 + returns).prod() - 1)
+        return float(np.expm1(self._log_growth(start_date, end_date)))
     
     def annualized_return(self, start_date: Optional[date] = None,
                          end_date: Optional[date] = None) -> float:
@@ -63,18 +122,17 @@ class PerformanceAnalytics:
         Returns:
             Annualized return as decimal
         """
-        returns = self.portfolio.get_portfolio_returns(start_date, end_date)
+        returns = self._returns(start_date, end_date)
         if returns.empty:
             return 0.0
         
-        total_ret = self.total_return(start_date, end_date)
         days = (returns.index[-1] - returns.index[0]).days
         years = days / 365.25
         
         if years <= 0:
             return 0.0
         
-        return float((1 + total_ret) ** (1 / years) - 1)
+        return float(np.expm1(self._log_growth(start_date, end_date) / years))
     
     def volatility(self, start_date: Optional[date] = None,
                   end_date: Optional[date] = None,
@@ -90,7 +148,7 @@ class PerformanceAnalytics:
         Returns:
             Portfolio volatility
         """
-        returns = self.portfolio.get_portfolio_returns(start_date, end_date)
+        returns = self._returns(start_date, end_date)
         if returns.empty:
             return 0.0
         
@@ -124,6 +182,46 @@ class PerformanceAnalytics:
         
         return (annual_return - risk_free_rate) / vol
     
+    def rolling_sharpe(self, window: int = 126,
+                       risk_free_rate: float = 0.02,
+                       start_date: Optional[date] = None,
+                       end_date: Optional[date] = None) -> pd.Series:
+        """
+        Calculate the annualized Sharpe ratio over a rolling window.
+        
+        Uses sliding-window mean/std kernels (bottleneck when installed,
+        otherwise pandas' built-in rolling aggregations) rather than
+        rolling().apply, so the cost is O(N) instead of O(N * window).
+        
+        Args:
+            window: Number of periods in each window
+            risk_free_rate: Annual risk-free rate
+            start_date: Start date for calculation
+            end_date: End date for calculation
+            
+        Returns:
+            Series of rolling Sharpe ratios (NaN until the window fills)
+        """
+        returns = self._returns(start_date, end_date)
+        if returns.empty:
+            return pd.Series(dtype=float)
+        
+        daily_rf = (1 + risk_free_rate) ** (1/252) - 1
+        
+        if bn is not None:
+            values = returns.to_numpy(dtype=float)
+            mean = bn.move_mean(values, window)
+            std = bn.move_std(values, window, ddof=1)
+        else:
+            rolling = returns.rolling(window)
+            mean = rolling.mean().to_numpy()
+            std = rolling.std().to_numpy()
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sharpe = (mean - daily_rf) / std * np.sqrt(252)
+        
+        return pd.Series(sharpe, index=returns.index, name="rolling_sharpe")
+    
     def sortino_ratio(self, risk_free_rate: float = 0.02,
                      start_date: Optional[date] = None,
                      end_date: Optional[date] = None) -> float:
@@ -138,7 +236,7 @@ class PerformanceAnalytics:
         Returns:
             Sortino ratio
         """
-        returns = self.portfolio.get_portfolio_returns(start_date, end_date)
+        returns = self._returns(start_date, end_date)
         if returns.empty:
             return 0.0
         
@@ -166,14 +264,13 @@ class PerformanceAnalytics:
         Returns:
             Dictionary with max drawdown, start date, end date, and recovery date
         """
-        returns = self.portfolio.get_portfolio_returns(start_date, end_date)
+        returns = self._returns(start_date, end_date)
         if returns.empty:
             return {"max_drawdown": 0.0, "start_date": None, "end_date": None, "recovery_date": None}
         
-        # Calculate cumulative returns
-        cum_returns = (1 + returns).cumprod()
-        running_max = cum_returns.expanding().max()
-        drawdown = (cum_returns - running_max) / running_max
+        drawdowns = self._drawdown(start_date, end_date)
+        running_max = drawdowns["Peaks"]
+        drawdown = drawdowns["Drawdown"]
         
         max_dd = drawdown.min()
         max_dd_date = drawdown.idxmin()
@@ -208,7 +305,8 @@ class PerformanceAnalytics:
             Calmar ratio
         """
         annual_return = self.annualized_return(start_date, end_date)
-        max_dd = abs(self.max_drawdown(start_date, end_date)["max_drawdown"])
+        drawdown = self._drawdown(start_date, end_date)["Drawdown"]
+        max_dd = abs(float(drawdown.min())) if not drawdown.empty else 0.0
         
         if max_dd == 0:
             return float('inf') if annual_return > 0 else 0.0
@@ -229,11 +327,11 @@ class PerformanceAnalytics:
         Returns:
             VaR as decimal (negative value)
         """
-        returns = self.portfolio.get_portfolio_returns(start_date, end_date)
+        returns = self._returns(start_date, end_date)
         if returns.empty:
             return 0.0
         
-        return float(np.percentile(returns, confidence_level * 100))
+        return float(percentiles(returns, [confidence_level * 100])[0])
     
     def conditional_var(self, confidence_level: float = 0.05,
                        start_date: Optional[date] = None,
@@ -249,7 +347,7 @@ class PerformanceAnalytics:
         Returns:
             CVaR as decimal (negative value)
         """
-        returns = self.portfolio.get_portfolio_returns(start_date, end_date)
+        returns = self._returns(start_date, end_date)
         if returns.empty:
             return 0.0
         
@@ -275,13 +373,18 @@ class PerformanceAnalytics:
         Returns:
             Dictionary with performance metrics
         """
-        returns = self.portfolio.get_portfolio_returns(start_date, end_date)
+        returns = self._returns(start_date, end_date)
         
         if returns.empty:
             return {"error": "No return data available"}
         
         max_dd_info = self.max_drawdown(start_date, end_date)
         
+        # Day-level stats in one aggregation and 5% VaR/CVaR from one partition
+        day_stats = returns.agg(['min', 'max'])
+        values = returns.to_numpy(dtype=float)
+        var_5, cvar_5 = var_cvar_historic(returns, levels=(5,))[5]
+        
         summary = {
             "period": {
                 "start_date": start_date or returns.index[0].date(),
@@ -292,10 +395,10 @@ class PerformanceAnalytics:
                 "total_return": self.total_return(start_date, end_date),
                 "annualized_return": self.annualized_return(start_date, end_date),
                 "volatility": self.volatility(start_date, end_date),
-                "best_day": float(returns.max()),
-                "worst_day": float(returns.min()),
-                "positive_days": int((returns > 0).sum()),
-                "negative_days": int((returns < 0).sum())
+                "best_day": float(day_stats['max']),
+                "worst_day": float(day_stats['min']),
+                "positive_days": int(np.count_nonzero(values > 0)),
+                "negative_days": int(np.count_nonzero(values < 0))
             },
             "risk_metrics": {
                 "sharpe_ratio": self.sharpe_ratio(risk_free_rate, start_date, end_date),
@@ -305,8 +408,8 @@ class PerformanceAnalytics:
                 "max_drawdown_start": max_dd_info["start_date"],
                 "max_drawdown_end": max_dd_info["end_date"],
                 "recovery_date": max_dd_info["recovery_date"],
-                "var_5pct": self.value_at_risk(0.05, start_date, end_date),
-                "cvar_5pct": self.conditional_var(0.05, start_date, end_date)
+                "var_5pct": float(-var_5),
+                "cvar_5pct": float(-cvar_5)
             }
         }
         
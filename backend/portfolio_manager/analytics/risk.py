@@ -54,7 +54,21 @@ class RiskAnalytics:
             return pd.DataFrame()
         
         returns_df = pd.DataFrame(returns_data)
-        return returns_df.corr()
+        values = returns_df.to_numpy(dtype=float)
+        
+        # pandas' pairwise-complete handling is only needed when dates are misaligned
+        if len(values) < 2 or np.isnan(values).any():
+            return returns_df.corr()
+        
+        # One centered cross-product (a single GEMM) instead of per-pair passes;
+        # float32 is ample for correlations and doubles the SIMD width of the GEMM
+        centered = (values - values.mean(axis=0)).astype(np.float32)
+        cov = (centered.T @ centered).astype(np.float64) / (len(values) - 1)
+        std = np.sqrt(np.diag(cov))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = cov / np.outer(std, std)
+        np.fill_diagonal(corr, np.where(std > 0, 1.0, np.nan))
+        return pd.DataFrame(corr, index=returns_df.columns, columns=returns_df.columns)
     
     def covariance_matrix(self, start_date: Optional[date] = None,
                          end_date: Optional[date] = None,
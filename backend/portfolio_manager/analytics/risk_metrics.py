@@ -11,9 +11,26 @@ import math
 from typing import Dict, Optional, Union, List, Tuple
 from scipy import stats
 from scipy.optimize import minimize
+from scipy.linalg import cho_solve
 import matplotlib.pyplot as plt
 from pathlib import Path
 
+# Numba is optional; the fused kernels fall back to vectorized numpy without it
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+# cvxpy is optional; when present the efficient frontier sweep solves one
+# parametrized QP instead of a fresh SLSQP problem per point
+try:
+    import cvxpy as cp
+    CVXPY_AVAILABLE = True
+except ImportError:
+    CVXPY_AVAILABLE = False
+
 # Update data path to be relative to package
 DATA_PATH = Path(__file__).parent.parent.parent.parent / "data"
 
@@ -148,9 +165,10 @@ def annualize_rets(r, periods_per_year):
     but that is currently left as an exercise
     to the reader :-)
     """
-    compounded_growth = (1+r).prod()
+    # Compound in log space: one log1p pass, no running product to under/overflow
+    log_growth = np.log1p(r).sum()
     n_periods = r.shape[0]
-    return compounded_growth**(periods_per_year/n_periods)-1
+    return np.expm1(log_growth*(periods_per_year/n_periods))
 
 
 def annualize_vol(r, periods_per_year):
@@ -203,6 +221,54 @@ def drawdown(return_series: pd.Series):
                          "Drawdown": drawdowns})
 
 
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _max_drawdown_kernel(r):
+        """
+        Streams r once, keeping the running wealth and peak in registers
+        """
+        wealth = 1.0
+        peak = -np.inf
+        max_dd = 0.0
+        for x in r:
+            wealth *= 1.0 + x
+            if wealth > peak:
+                peak = wealth
+            dd = (wealth - peak)/peak
+            if dd < max_dd:
+                max_dd = dd
+        return max_dd
+
+
+def max_drawdown(return_series: pd.Series):
+    """
+    Returns the maximum drawdown of a Series of returns as a (negative) float
+    Same value as drawdown(r)["Drawdown"].min() without materializing the
+    wealth, peak and drawdown Series (fused into one numba pass when available)
+    """
+    r = return_series.to_numpy(dtype=float)
+    r = r[~np.isnan(r)]
+    if r.size == 0:
+        return np.nan
+    if NUMBA_AVAILABLE:
+        return _max_drawdown_kernel(r)
+    wealth_index = np.cumprod(1 + r)
+    previous_peaks = np.maximum.accumulate(wealth_index)
+    return ((wealth_index - previous_peaks)/previous_peaks).min()
+
+
+def drawdown_from_wealth(wealth_index: pd.Series):
+    """Takes a time series of wealth (account values) rather than returns.
+       returns the same DataFrame as drawdown(), without re-compounding
+       a series that is already a wealth index (e.g. run_cppi's "Wealth")
+    """
+    previous_peaks = wealth_index.cummax()
+    drawdowns = (wealth_index - previous_peaks)/previous_peaks
+    return pd.DataFrame({"Wealth": wealth_index, 
+                         "Previous Peak": previous_peaks, 
+                         "Drawdown": drawdowns})
+
+
 def semideviation(r):
     """
     Returns the semideviation aka negative semideviation of r
@@ -217,6 +283,98 @@ def semideviation(r):
         raise TypeError("Expected r to be a Series or DataFrame")
 
 
+def _moments_numpy(x):
+    """
+    Skewness, kurtosis and semideviation of a 1-D array sharing one demeaned copy
+    """
+    d = x - x.mean()
+    d2 = d*d
+    m2 = d2.mean()
+    neg = x[x < 0]
+    semi_dev = neg.std() if neg.size else np.nan
+    return (d2*d).mean()/m2**1.5, (d2*d2).mean()/m2**2, semi_dev
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _moments_kernel(x):
+        """
+        Single Welford-style sweep accumulating M2, M3, M4 of x and the
+        running mean/M2 of its negative entries
+        """
+        n = 0
+        mean = 0.0
+        m2 = 0.0
+        m3 = 0.0
+        m4 = 0.0
+        n_neg = 0
+        mean_neg = 0.0
+        m2_neg = 0.0
+        for v in x:
+            n1 = n
+            n += 1
+            delta = v - mean
+            delta_n = delta/n
+            delta_n2 = delta_n*delta_n
+            term1 = delta*delta_n*n1
+            mean += delta_n
+            m4 += term1*delta_n2*(n*n - 3*n + 3) + 6*delta_n2*m2 - 4*delta_n*m3
+            m3 += term1*delta_n*(n - 2) - 3*delta_n*m2
+            m2 += term1
+            if v < 0:
+                n_neg += 1
+                delta_neg = v - mean_neg
+                mean_neg += delta_neg/n_neg
+                m2_neg += delta_neg*(v - mean_neg)
+        if m2 == 0.0:
+            skew = np.nan
+            kurt = np.nan
+        else:
+            skew = math.sqrt(n)*m3/m2**1.5
+            kurt = n*m4/(m2*m2)
+        semi_dev = math.sqrt(m2_neg/n_neg) if n_neg > 0 else np.nan
+        return skew, kurt, semi_dev
+
+
+def moments(r):
+    """
+    Computes skewness, kurtosis and semideviation of a Series in one go
+    Equivalent to (skewness(r), kurtosis(r), semideviation(r)) but reads the
+    returns once (numba) or shares a single demeaned copy (numpy fallback)
+    Returns a (skewness, kurtosis, semideviation) tuple of floats
+    """
+    if not isinstance(r, pd.Series):
+        raise TypeError("Expected r to be a Series")
+    x = r.to_numpy(dtype=float)
+    x = x[~np.isnan(x)]
+    if x.size == 0:
+        return np.nan, np.nan, np.nan
+    if NUMBA_AVAILABLE:
+        return _moments_kernel(x)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _moments_numpy(x)
+
+
+def percentiles(a, qs):
+    """
+    Returns np.percentile(a, q) (linear interpolation) for each q in qs, as a list
+    Selects just the neighbouring order statistics with one np.partition (O(N))
+    instead of sorting the whole array
+    """
+    values = np.asarray(a, dtype=float).ravel()
+    if values.size == 0 or np.isnan(values).any():
+        return [np.percentile(values, q) if values.size else np.nan for q in qs]
+    n = values.size
+    positions = [q/100*(n-1) for q in qs]
+    kth = sorted({int(math.floor(p)) for p in positions} | {int(math.ceil(p)) for p in positions})
+    partitioned = np.partition(values, kth)
+    out = []
+    for pos in positions:
+        lo, hi = int(math.floor(pos)), int(math.ceil(pos))
+        out.append(partitioned[lo] + (partitioned[hi] - partitioned[lo])*(pos - lo))
+    return out
+
+
 def var_historic(r, level=5):
     """
     Returns the historic Value at Risk at a specified level
@@ -226,7 +384,7 @@ def var_historic(r, level=5):
     if isinstance(r, pd.DataFrame):
         return r.aggregate(var_historic, level=level)
     elif isinstance(r, pd.Series):
-        return -np.percentile(r, level)
+        return -percentiles(r, [level])[0]
     else:
         raise TypeError("Expected r to be a Series or DataFrame")
 
@@ -244,6 +402,25 @@ def cvar_historic(r, level=5):
         raise TypeError("Expected r to be a Series or DataFrame")
 
 
+def var_cvar_historic(r, levels=(5, 1)):
+    """
+    Computes historic VaR and CVaR of a Series at several levels at once
+    Uses a single np.partition over all the required order statistics (O(N))
+    instead of one percentile call per level; values match var_historic and
+    cvar_historic, including np.percentile's linear interpolation
+    Returns a dict mapping each level to a (var, cvar) tuple
+    """
+    if not isinstance(r, pd.Series):
+        raise TypeError("Expected r to be a Series")
+    values = r.to_numpy(dtype=float)
+    if values.size == 0 or np.isnan(values).any():
+        return {level: (var_historic(r, level=level), cvar_historic(r, level=level)) for level in levels}
+
+    thresholds = percentiles(values, levels)
+    return {level: (-threshold, -values[values <= threshold].mean())
+            for level, threshold in zip(levels, thresholds)}
+
+
 def var_gaussian(r, level=5, modified=False):
     """
     Returns the Parametric Gaussian VaR of a Series or DataFrame
@@ -268,6 +445,39 @@ def var_gaussian(r, level=5, modified=False):
 # PORTFOLIO FUNCTIONS
 # ============================================================================
 
+def ledoit_wolf_cov(r):
+    """
+    Returns the Ledoit-Wolf shrunk covariance of a set of returns (periodic, not
+    annualized): (1-d)*S + d*(trace(S)/n)*I, where S is the unbiased sample
+    covariance and the intensity d is the Ledoit-Wolf (2004) estimate used by
+    sklearn's ledoit_wolf. Since sklearn shrinks the biased covariance, the result
+    is sklearn's scaled by n_obs/(n_obs - 1).
+    The result is positive definite whenever d > 0 and some asset varies, even
+    when assets outnumber observations; constant returns give an all-zero matrix.
+    r is a DataFrame (a DataFrame is returned) or a 2-D array with assets in columns
+    """
+    x = np.asarray(r, dtype=float)
+    n_obs, n_assets = x.shape
+    x = x - x.mean(axis=0)
+    sample_cov = x.T @ x/(n_obs - 1)
+    # Shrinkage intensity from the biased moments, exactly as in Ledoit-Wolf
+    x2 = x**2
+    emp_trace = x2.sum(axis=0)/n_obs
+    mu = emp_trace.sum()/n_assets
+    beta_ = (x2.T @ x2).sum()
+    delta_ = ((x.T @ x)**2).sum()/n_obs**2
+    beta = (beta_/n_obs - delta_)/(n_assets*n_obs)
+    delta = (delta_ - 2*mu*emp_trace.sum() + n_assets*mu**2)/n_assets
+    beta = min(beta, delta)
+    shrinkage = 0.0 if beta == 0 else beta/delta
+    target = np.trace(sample_cov)/n_assets
+    shrunk = (1 - shrinkage)*sample_cov
+    shrunk[np.diag_indices(n_assets)] += shrinkage*target
+    if isinstance(r, pd.DataFrame):
+        return pd.DataFrame(shrunk, index=r.columns, columns=r.columns)
+    return shrunk
+
+
 def portfolio_return(weights, returns):
     """
     Computes the return on a portfolio from constituent returns and weights
@@ -300,13 +510,15 @@ def plot_ef2(n_points, er, cov):
     return ef.plot.line(x="Volatility", y="Returns", style=".-")
 
 
-def minimize_vol(target_return, er, cov):
+def minimize_vol(target_return, er, cov, init_guess=None):
     """
     Returns the optimal weights that achieve the target return
     given a set of expected returns and a covariance matrix
+    init_guess optionally warm-starts SLSQP (defaults to equal weights)
     """
     n = er.shape[0]
-    init_guess = np.repeat(1/n, n)
+    if init_guess is None:
+        init_guess = np.repeat(1/n, n)
     bounds = ((0.0, 1.0),) * n # an N-tuple of 2-tuples!
     # construct the constraints
     weights_sum_to_1 = {'type': 'eq',
@@ -324,11 +536,58 @@ def minimize_vol(target_return, er, cov):
     return weights.x
 
 
-def msr(riskfree_rate, er, cov):
+def cov_cholesky(cov, ridge=None):
+    """
+    Returns the lower Cholesky factor L of cov + ridge*I, so that L @ L.T is the
+    (regularized) covariance. Factor once and pass it as cov_factor to msr, gmv
+    and optimal_weights; portfolio vols are then the row norms of W @ L.
+    The default ridge is 1e-8 * trace(cov)/n, enough to keep a PSD matrix PD.
+    """
+    cov = np.asarray(cov, dtype=float)
+    n = cov.shape[0]
+    if ridge is None:
+        ridge = 1e-8*np.trace(cov)/n
+    return np.linalg.cholesky(cov + ridge*np.eye(n))
+
+
+def _cov_solve(cov, b, cov_factor=None):
+    """
+    Solves cov @ x = b, with two triangular solves when a Cholesky factor is given
+    """
+    if cov_factor is not None:
+        return cho_solve((cov_factor, True), b)
+    return np.linalg.solve(np.asarray(cov, dtype=float), b)
+
+
+def _tangency_weights(cov, excess, cov_factor=None):
+    """
+    Closed-form tangency weights inv(cov) @ excess / (ones @ inv(cov) @ excess),
+    or None when they are not admissible under the long-only, fully-invested bounds
+    """
+    try:
+        w = _cov_solve(cov, np.asarray(excess, dtype=float), cov_factor)
+    except np.linalg.LinAlgError:
+        return None
+    total = w.sum()
+    # A non-positive denominator means the stationary point minimizes the Sharpe ratio
+    if total <= 1e-12:
+        return None
+    w = w/total
+    if w.min() < -1e-10:
+        return None  # bounds are active, fall back to the constrained solver
+    w = np.clip(w, 0.0, None)
+    return w/w.sum()
+
+
+def msr(riskfree_rate, er, cov, cov_factor=None):
     """
     Returns the weights of the portfolio that gives you the maximum sharpe ratio
     given the riskfree rate and expected returns and a covariance matrix
+    cov_factor optionally supplies cov_cholesky(cov) for the closed-form solve
     """
+    w = _tangency_weights(cov, np.asarray(er, dtype=float) - riskfree_rate, cov_factor)
+    if w is not None:
+        return w
     n = er.shape[0]
     init_guess = np.repeat(1/n, n)
     bounds = ((0.0, 1.0),) * n # an N-tuple of 2-tuples!
@@ -353,21 +612,90 @@ def msr(riskfree_rate, er, cov):
     return weights.x
 
 
-def gmv(cov):
+def gmv(cov, cov_factor=None):
     """
     Returns the weights of the Global Minimum Volatility portfolio
     given a covariance matrix
     """
     n = cov.shape[0]
-    return msr(0, np.repeat(1, n), cov)
+    return msr(0, np.repeat(1, n), cov, cov_factor=cov_factor)
 
 
-def optimal_weights(n_points, er, cov):
+def _frontier_qp(er, cov, cov_factor=None):
+    """
+    Builds the long-only minimum-variance QP once, with the target return as a
+    cvxpy Parameter, and returns solve(target_return) -> weights or None.
+    Only the parameter value changes between frontier points, so cvxpy skips
+    re-canonicalization and the solver warm-starts from the previous point.
+    """
+    if cov_factor is None:
+        cov_factor = cov_cholesky(cov)
+    n = er.shape[0]
+    w = cp.Variable(n, nonneg=True)
+    target = cp.Parameter()
+    # w' cov w == ||L' w||^2 keeps the objective DCP without a PSD check on cov
+    problem = cp.Problem(cp.Minimize(cp.sum_squares(cov_factor.T @ w)),
+                         [cp.sum(w) == 1, er @ w == target])
+    solver = cp.OSQP if cp.OSQP in cp.installed_solvers() else None
+
+    def solve(target_return):
+        target.value = float(target_return)
+        try:
+            problem.solve(solver=solver, warm_start=True)
+        except cp.error.SolverError:
+            return None
+        if problem.status not in (cp.OPTIMAL, cp.OPTIMAL_INACCURATE) or w.value is None:
+            return None
+        weights = np.clip(w.value, 0.0, None)
+        return weights/weights.sum()
+
+    return solve
+
+
+def optimal_weights(n_points, er, cov, cov_factor=None):
     """
     Returns a list of weights that represent a grid of n_points on the efficient frontier
+    cov_factor optionally supplies cov_cholesky(cov) for the closed-form solves
     """
     target_rs = np.linspace(er.min(), er.max(), n_points)
-    weights = [minimize_vol(target_return, er, cov) for target_return in target_rs]
+    er_arr = np.asarray(er, dtype=float)
+    cov_arr = np.asarray(cov, dtype=float)
+    ones = np.ones(er_arr.shape[0])
+    # Two-fund closed form of the frontier without the w >= 0 bounds:
+    # w(t) = inv(cov) @ (ones*(C - B*t) + er*(A*t - B)) / D
+    try:
+        inv_both = _cov_solve(cov_arr, np.column_stack([ones, er_arr]), cov_factor)
+        inv_ones, inv_er = inv_both[:, 0], inv_both[:, 1]
+        a, b, c = ones @ inv_ones, ones @ inv_er, er_arr @ inv_er
+        d = a*c - b*b
+    except np.linalg.LinAlgError:
+        d = 0.0
+
+    weights = []
+    prev = None
+    qp_solve = None
+    for target_return in target_rs:
+        w = None
+        if d > 1e-12:
+            w = (inv_ones*(c - b*target_return) + inv_er*(a*target_return - b))/d
+            if w.min() < -1e-10:
+                w = None  # bounds are active, the closed form is not admissible
+            else:
+                w = np.clip(w, 0.0, None)
+                w = w/w.sum()
+        if w is None and CVXPY_AVAILABLE:
+            # Box-constrained point: re-solve the parametrized QP (built on first use)
+            if qp_solve is None:
+                try:
+                    qp_solve = _frontier_qp(er_arr, cov_arr, cov_factor)
+                except (np.linalg.LinAlgError, cp.error.DCPError):
+                    qp_solve = lambda _target: None  # SLSQP handles every point
+            w = qp_solve(target_return)
+        if w is None:
+            # Box-constrained point: warm-start SLSQP from the previous frontier point
+            w = minimize_vol(target_return, er, cov, init_guess=prev)
+        weights.append(w)
+        prev = w
     return weights
 
 
@@ -414,63 +742,76 @@ def plot_ef(n_points, er, cov, style='.-', legend=False, show_cml=False, riskfre
 # CPPI AND DYNAMIC STRATEGIES
 # ============================================================================
 
+def _cppi_steps(risky, safe, m, start, floor, drawdown, use_drawdown,
+                account, risky_w, cushion, floorval, peaks):
+    """
+    Step-wise CPPI rebalance over (n_steps, n_cols) return arrays, writing the
+    histories into the preallocated output arrays. Columns are independent
+    backtests, so with numba installed they are compiled and run in parallel.
+    """
+    n_steps, n_cols = risky.shape
+    for j in prange(n_cols):
+        account_value = start
+        floor_value = start*floor
+        peak = start
+        for step in range(n_steps):
+            if use_drawdown:
+                peak = max(peak, account_value)
+                floor_value = peak*(1 - drawdown)
+            c = (account_value - floor_value)/account_value
+            w = min(max(m*c, 0.0), 1.0)
+            # recompute the new account value at the end of this step
+            account_value = account_value*w*(1 + risky[step, j]) + account_value*(1 - w)*(1 + safe[step, j])
+            cushion[step, j] = c
+            risky_w[step, j] = w
+            account[step, j] = account_value
+            floorval[step, j] = floor_value
+            peaks[step, j] = peak
+
+
+if NUMBA_AVAILABLE:
+    # no fastmath: the recurrence must reproduce the reference backtest exactly
+    _cppi_steps = njit(cache=True, parallel=True)(_cppi_steps)
+
+
 def run_cppi(risky_r, safe_r=None, m=3, start=1000, floor=0.8, riskfree_rate=0.03, drawdown=None):
     """
     Run a backtest of the CPPI strategy, given a set of returns for the risky asset
     Returns a dictionary containing: Asset Value History, Risk Budget History, Risky Weight History
     """
-    # set up the CPPI parameters
-    dates = risky_r.index
-    n_steps = len(dates)
-    account_value = start
-    floor_value = start*floor
-    peak = account_value
     if isinstance(risky_r, pd.Series): 
         risky_r = pd.DataFrame(risky_r, columns=["R"])
 
     if safe_r is None:
         safe_r = pd.DataFrame().reindex_like(risky_r)
         safe_r.iloc[:, :] = riskfree_rate/12 # pandas 3.0 CoW: use iloc not .values[:]
-    # set up some DataFrames for saving intermediate values
-    account_history = pd.DataFrame().reindex_like(risky_r)
-    risky_w_history = pd.DataFrame().reindex_like(risky_r)
-    cushion_history = pd.DataFrame().reindex_like(risky_r)
-    floorval_history = pd.DataFrame().reindex_like(risky_r)
-    peak_history = pd.DataFrame().reindex_like(risky_r)
+    # The rebalance is sequential in time, so it runs on plain arrays rather
+    # than writing one pandas row per step
+    risky = np.ascontiguousarray(risky_r.to_numpy(dtype=float))
+    safe = np.asarray(safe_r, dtype=float)
+    safe = np.ascontiguousarray(np.broadcast_to(safe.reshape(safe.shape[0], -1), risky.shape))
+    account, risky_w, cushion, floorval, peaks = (np.empty_like(risky) for _ in range(5))
+    _cppi_steps(risky, safe, float(m), float(start), float(floor),
+                0.0 if drawdown is None else float(drawdown), drawdown is not None,
+                account, risky_w, cushion, floorval, peaks)
+
+    def history(values):
+        return pd.DataFrame(values, index=risky_r.index, columns=risky_r.columns)
 
-    for step in range(n_steps):
-        if drawdown is not None:
-            peak = np.maximum(peak, account_value)
-            floor_value = peak*(1-drawdown)
-        cushion = (account_value - floor_value)/account_value
-        risky_w = m*cushion
-        risky_w = np.minimum(risky_w, 1)
-        risky_w = np.maximum(risky_w, 0)
-        safe_w = 1-risky_w
-        risky_alloc = account_value*risky_w
-        safe_alloc = account_value*safe_w
-        # recompute the new account value at the end of this step
-        account_value = risky_alloc*(1+risky_r.iloc[step]) + safe_alloc*(1+safe_r.iloc[step])
-        # save the histories for analysis and plotting
-        cushion_history.iloc[step] = cushion
-        risky_w_history.iloc[step] = risky_w
-        account_history.iloc[step] = account_value
-        floorval_history.iloc[step] = floor_value
-        peak_history.iloc[step] = peak
     risky_wealth = start*(1+risky_r).cumprod()
     backtest_result = {
-        "Wealth": account_history,
+        "Wealth": history(account),
         "Risky Wealth": risky_wealth, 
-        "Risk Budget": cushion_history,
-        "Risky Allocation": risky_w_history,
+        "Risk Budget": history(cushion),
+        "Risky Allocation": history(risky_w),
         "m": m,
         "start": start,
         "floor": floor,
         "risky_r": risky_r,
         "safe_r": safe_r,
         "drawdown": drawdown,
-        "peak": peak_history,
-        "floor": floorval_history
+        "peak": history(peaks),
+        "floor": history(floorval)
     }
     return backtest_result
 
@@ -503,7 +844,8 @@ def summary_stats(r, riskfree_rate=0.03):
 # MONTE CARLO SIMULATION
 # ============================================================================
 
-def gbm(n_years=10, n_scenarios=1000, mu=0.07, sigma=0.15, steps_per_year=12, s_0=100.0, prices=True):
+def gbm(n_years=10, n_scenarios=1000, mu=0.07, sigma=0.15, steps_per_year=12, s_0=100.0, prices=True,
+        dtype=np.float64, rng=None):
     """
     Evolution of Geometric Brownian Motion trajectories, such as for Stock Prices through Monte Carlo
     :param n_years:  The number of years to generate data for
@@ -512,18 +854,64 @@ def gbm(n_years=10, n_scenarios=1000, mu=0.07, sigma=0.15, steps_per_year=12, s_
     :param sigma: Annualized Volatility
     :param steps_per_year: granularity of the simulation
     :param s_0: initial value
+    :param dtype: float dtype of the generated draws; np.float32 halves memory for plotting-only use
+    :param rng: optional np.random.Generator; the global numpy RNG is used for float64 when omitted
     :return: a numpy array of n_paths columns and n_years*steps_per_year rows
     """
     # Derive per-step Model Parameters from User Specifications
     dt = 1/steps_per_year
     n_steps = int(n_years*steps_per_year) + 1
+    loc = (1+mu)**dt
+    scale = sigma*np.sqrt(dt)
     # the standard way ...
     # rets_plus_1 = np.random.normal(loc=mu*dt+1, scale=sigma*np.sqrt(dt), size=(n_steps, n_scenarios))
     # without discretization error ...
-    rets_plus_1 = np.random.normal(loc=(1+mu)**dt, scale=(sigma*np.sqrt(dt)), size=(n_steps, n_scenarios))
+    if rng is None and np.dtype(dtype) == np.float64:
+        rets_plus_1 = np.random.normal(loc=loc, scale=scale, size=(n_steps, n_scenarios))
+    else:
+        rng = rng if rng is not None else np.random.default_rng()
+        rets_plus_1 = rng.standard_normal((n_steps, n_scenarios), dtype=dtype)
+        rets_plus_1 *= scale
+        rets_plus_1 += loc
     rets_plus_1[0] = 1
-    ret_val = s_0*pd.DataFrame(rets_plus_1).cumprod() if prices else rets_plus_1-1
-    return ret_val
+    if not prices:
+        return rets_plus_1-1
+    # compound the paths in place with one ufunc pass rather than DataFrame.cumprod
+    np.cumprod(rets_plus_1, axis=0, out=rets_plus_1)
+    rets_plus_1 *= s_0
+    return pd.DataFrame(rets_plus_1)
+
+
+def gbm_correlated(mu, cov, n_years=10, n_scenarios=1000, steps_per_year=12, s_0=100.0, weights=None,
+                   dtype=np.float64, rng=None):
+    """
+    Correlated multi-asset Geometric Brownian Motion, fully vectorized over steps, scenarios and assets
+    :param mu: annualized drift per asset, shape (n_assets,)
+    :param cov: annualized covariance matrix, shape (n_assets, n_assets)
+    :param s_0: initial price (scalar or per asset); the initial portfolio value when weights are given
+    :param weights: optional buy-and-hold portfolio weights; portfolio values are returned instead of prices
+    :param dtype: float dtype of the draws and paths
+    :param rng: optional np.random.Generator (a fresh PCG64 generator is used when omitted)
+    :return: array of shape (n_steps, n_scenarios, n_assets) of prices, or (n_steps, n_scenarios) of
+             portfolio values when weights are given; row 0 holds the initial values
+    """
+    mu = np.asarray(mu, dtype=float)
+    n_assets = mu.shape[0]
+    dt = 1/steps_per_year
+    n_steps = int(n_years*steps_per_year) + 1
+    rng = rng if rng is not None else np.random.default_rng()
+    # Correlate all the draws with one GEMM against the scaled Cholesky factor
+    scale = (cov_cholesky(cov).T*np.sqrt(dt)).astype(dtype)
+    z = rng.standard_normal((n_steps*n_scenarios, n_assets), dtype=dtype)
+    rets_plus_1 = (z @ scale).reshape(n_steps, n_scenarios, n_assets)
+    # same drift convention as gbm: no discretization error in the mean
+    rets_plus_1 += ((1+mu)**dt).astype(dtype)
+    rets_plus_1[0] = 1
+    np.cumprod(rets_plus_1, axis=0, out=rets_plus_1)
+    if weights is None:
+        rets_plus_1 *= np.asarray(s_0, dtype=dtype)
+        return rets_plus_1
+    return s_0*(rets_plus_1 @ np.asarray(weights, dtype=dtype))
 
 
 # ============================================================================
@@ -574,40 +962,38 @@ def ann_to_inst(r):
     return np.log1p(r)
 
 
-def cir(n_years=10, n_scenarios=1, a=0.05, b=0.03, sigma=0.05, steps_per_year=12, r_0=None):
+def cir(n_years=10, n_scenarios=1, a=0.05, b=0.03, sigma=0.05, steps_per_year=12, r_0=None, rng=None):
     """
     Generate random interest rate evolution over time using the CIR model
     b and r_0 are assumed to be the annualized rates, not the short rate
     and the returned values are the annualized rates as well
+    rng optionally supplies a np.random.Generator; the global numpy RNG is used when omitted
     """
     if r_0 is None: r_0 = b 
     r_0 = ann_to_inst(r_0)
     dt = 1/steps_per_year
     num_steps = int(n_years*steps_per_year) + 1 # because n_years might be a float
     
-    shock = np.random.normal(0, scale=np.sqrt(dt), size=(num_steps, n_scenarios))
+    if rng is None:
+        shock = np.random.normal(0, scale=np.sqrt(dt), size=(num_steps, n_scenarios))
+    else:
+        shock = rng.standard_normal((num_steps, n_scenarios))*np.sqrt(dt)
     rates = np.empty_like(shock)
     rates[0] = r_0
 
-    ## For Price Generation
-    h = math.sqrt(a**2 + 2*sigma**2)
-    prices = np.empty_like(shock)
-    ####
-
-    def price(ttm, r):
-        _A = ((2*h*math.exp((h+a)*ttm/2))/(2*h+(h+a)*(math.exp(h*ttm)-1)))**(2*a*b/sigma**2)
-        _B = (2*(math.exp(h*ttm)-1))/(2*h + (h+a)*(math.exp(h*ttm)-1))
-        _P = _A*np.exp(-_B*r)
-        return _P
-    prices[0] = price(n_years, r_0)
-    ####
-    
+    # the rate recursion is path-dependent, so only it stays in the step loop
     for step in range(1, num_steps):
         r_t = rates[step-1]
         d_r_t = a*(b-r_t)*dt + sigma*np.sqrt(r_t)*shock[step]
         rates[step] = abs(r_t + d_r_t)
-        # generate prices at time t as well ...
-        prices[step] = price(n_years-step*dt, rates[step])
+
+    ## For Price Generation: bond prices for every (step, scenario) at once
+    h = math.sqrt(a**2 + 2*sigma**2)
+    ttm = (n_years - np.arange(num_steps)*dt)[:, None]
+    exp_h = np.exp(h*ttm)
+    _A = ((2*h*np.exp((h+a)*ttm/2))/(2*h+(h+a)*(exp_h-1)))**(2*a*b/sigma**2)
+    _B = (2*(exp_h-1))/(2*h + (h+a)*(exp_h-1))
+    prices = _A*np.exp(-_B*rates)
 
     rates = pd.DataFrame(data=inst_to_ann(rates), index=range(num_steps))
     ### for prices
@@ -777,20 +1163,22 @@ def floor_allocator(psp_r, ghp_r, floor, zc_prices, m=3):
     if zc_prices.shape != psp_r.shape:
         raise ValueError("PSP and ZC Prices must have the same shape")
     n_steps, n_scenarios = psp_r.shape
+    # Pull the arrays out once; per-step .iloc would build a Series each time
+    psp, ghp, zc = (np.asarray(x, dtype=float) for x in (psp_r, ghp_r, zc_prices))
     account_value = np.repeat(1, n_scenarios)
     floor_value = np.repeat(1, n_scenarios)
-    w_history = pd.DataFrame(index=psp_r.index, columns=psp_r.columns)
+    w_history = np.empty((n_steps, n_scenarios))
     for step in range(n_steps):
-        floor_value = floor*zc_prices.iloc[step] ## PV of Floor assuming today's rates and flat YC
+        floor_value = floor*zc[step] ## PV of Floor assuming today's rates and flat YC
         cushion = (account_value - floor_value)/account_value
         psp_w = (m*cushion).clip(0, 1) # same as applying min and max
         ghp_w = 1-psp_w
         psp_alloc = account_value*psp_w
         ghp_alloc = account_value*ghp_w
         # recompute the new account value at the end of this step
-        account_value = psp_alloc*(1+psp_r.iloc[step]) + ghp_alloc*(1+ghp_r.iloc[step])
-        w_history.iloc[step] = psp_w
-    return w_history
+        account_value = psp_alloc*(1+psp[step]) + ghp_alloc*(1+ghp[step])
+        w_history[step] = psp_w
+    return pd.DataFrame(w_history, index=psp_r.index, columns=psp_r.columns)
 
 
 def drawdown_allocator(psp_r, ghp_r, maxdd, m=3):
@@ -802,10 +1190,12 @@ def drawdown_allocator(psp_r, ghp_r, maxdd, m=3):
     Returns a DataFrame with the same shape as the psp/ghp representing the weights in the PSP
     """
     n_steps, n_scenarios = psp_r.shape
+    # Pull the arrays out once; per-step .iloc would build a Series each time
+    psp, ghp = (np.asarray(x, dtype=float) for x in (psp_r, ghp_r))
     account_value = np.repeat(1, n_scenarios)
     floor_value = np.repeat(1, n_scenarios)
     peak_value = np.repeat(1, n_scenarios)
-    w_history = pd.DataFrame(index=psp_r.index, columns=psp_r.columns)
+    w_history = np.empty((n_steps, n_scenarios))
     for step in range(n_steps):
         floor_value = (1-maxdd)*peak_value ### Floor is based on Prev Peak
         cushion = (account_value - floor_value)/account_value
@@ -814,7 +1204,7 @@ def drawdown_allocator(psp_r, ghp_r, maxdd, m=3):
         psp_alloc = account_value*psp_w
         ghp_alloc = account_value*ghp_w
         # recompute the new account value and prev peak at the end of this step
-        account_value = psp_alloc*(1+psp_r.iloc[step]) + ghp_alloc*(1+ghp_r.iloc[step])
+        account_value = psp_alloc*(1+psp[step]) + ghp_alloc*(1+ghp[step])
         peak_value = np.maximum(peak_value, account_value)
-        w_history.iloc[step] = psp_w
-    return w_history
+        w_history[step] = psp_w
+    return pd.DataFrame(w_history, index=psp_r.index, columns=psp_r.columns)
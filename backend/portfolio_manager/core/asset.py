@@ -6,7 +6,7 @@ from typing import Dict, List, Optional, Union
 from datetime import datetime, date
 import pandas as pd
 import numpy as np
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, field_validator, ConfigDict, PrivateAttr
 from enum import Enum
 
 
@@ -49,6 +49,9 @@ class Asset(BaseModel):
     
     model_config = ConfigDict(arbitrary_types_allowed=True)
     
+    # Memoized get_returns results, keyed by price frame identity and arguments
+    _returns_cache: Dict = PrivateAttr(default_factory=dict)
+    
     @field_validator('symbol')
     @classmethod
     def symbol_must_not_be_empty(cls, v):
@@ -72,6 +75,7 @@ class Asset(BaseModel):
             raise ValueError(f"Price data must contain columns: {required_columns}")
         
         self.price_data = data.copy()
+        self._returns_cache.clear()
     
     def get_current_price(self) -> Optional[float]:
         """
@@ -126,6 +130,11 @@ class Asset(BaseModel):
         if self.price_data is None or self.price_data.empty:
             return pd.Series(dtype=float)
         
+        cache_key = (id(self.price_data), start_date, end_date, frequency)
+        cached = self._returns_cache.get(cache_key)
+        if cached is not None and cached[0] is self.price_data:
+            return cached[1].copy()
+        
         prices = self.price_data['Close'].copy()
         
         # Filter by date range if provided
@@ -146,7 +155,9 @@ class Asset(BaseModel):
         elif frequency == 'monthly':
             returns = returns.resample('M').apply(lambda x: (1 + x).prod() - 1)
         
-        return returns
+        # Keep a reference to the frame so its id cannot be reused while cached
+        self._returns_cache[cache_key] = (self.price_data, returns)
+        return returns.copy()
     
     def get_volatility(self, window: int = 252, 
                       start_date: Optional[date] = None,
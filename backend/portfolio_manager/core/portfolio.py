@@ -177,13 +177,15 @@ class Portfolio(BaseModel):
         except Exception as e:
             raise ValueError(f"Error combining asset returns: {str(e)}")
         
-        # Calculate weighted portfolio returns
+        # Calculate weighted portfolio returns with a single matrix-vector product.
+        # Dates where any weighted asset lacks a return would come out NaN anyway,
+        # so drop them first and run the product on the aligned block only.
         try:
-            portfolio_returns = pd.Series(0.0, index=returns_df.index)
-            for symbol in returns_df.columns:
-                if symbol in self.weights:
-                    portfolio_returns += self.weights[symbol] * returns_df[symbol]
-            return portfolio_returns
+            weighted_symbols = [symbol for symbol in returns_df.columns if symbol in self.weights]
+            weight_vector = np.array([self.weights[symbol] for symbol in weighted_symbols], dtype=float)
+            aligned = returns_df[weighted_symbols].dropna(how='any')
+            values = aligned.to_numpy(dtype=float)
+            return pd.Series(values @ weight_vector, index=aligned.index)
         except Exception as e:
             raise ValueError(f"Error calculating weighted returns: {str(e)}")
     
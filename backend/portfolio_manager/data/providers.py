@@ -3,6 +3,7 @@ Data providers for fetching financial market data.
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Union
 from datetime import datetime, date, timedelta
 import pandas as pd
@@ -12,7 +13,7 @@ import requests
 from pydantic import BaseModel, Field
 
 from ..core.asset import Asset, AssetType
-from ..utils.cache import cached_price_fetcher
+from ..utils.cache import cached_price_fetcher, get_cached_price_data, set_cached_price_data
 
 
 class DataProvider(ABC):
@@ -121,6 +122,94 @@ class YFinanceProvider(DataProvider):
         except Exception as e:
             raise ValueError(f"Failed to fetch data for {symbol}: {str(e)}")
     
+    def get_price_data_batch(self, symbols: List[str],
+                             start_date: Optional[date] = None,
+                             end_date: Optional[date] = None,
+                             interval: str = '1d') -> Dict[str, pd.DataFrame]:
+        """
+        Get historical price data for several symbols in one Yahoo Finance request.
+        
+        Symbols already in the price cache are served from it; the rest are
+        fetched together with a single yf.download call and then cached
+        individually, so later get_price_data calls hit the cache too.
+        Symbols are matched case-insensitively, and any symbol the download
+        misses is fetched with get_price_data instead.
+        
+        Args:
+            symbols: Asset symbols/tickers
+            start_date: Start date for data
+            end_date: End date for data
+            interval: Data interval
+            
+        Returns:
+            Dictionary mapping each symbol with data to its OHLCV DataFrame
+        """
+        required_columns = ['Open', 'High', 'Low', 'Close', 'Volume']
+        results = {}
+        # Yahoo returns upper-cased tickers, so group the caller's spellings
+        # under the normalized symbol that is downloaded and looked up
+        missing: Dict[str, List[str]] = {}
+        for symbol in symbols:
+            cached_data = get_cached_price_data(symbol, start_date, end_date, interval)
+            if cached_data is not None:
+                results[symbol] = cached_data
+            else:
+                missing.setdefault(symbol.strip().upper(), []).append(symbol)
+        
+        if not missing:
+            return results
+        
+        # Same defaults as get_price_data
+        fetch_end = end_date if end_date is not None else date.today()
+        fetch_start = start_date if start_date is not None else fetch_end - timedelta(days=365)
+        
+        frames = {}
+        try:
+            data = yf.download(
+                list(missing),
+                start=fetch_start,
+                end=fetch_end,
+                interval=interval,
+                group_by='ticker',
+                auto_adjust=True,
+                prepost=True,
+                ignore_tz=False,
+                threads=True,
+                progress=False
+            )
+        except Exception as e:
+            print(f"Warning: Batch price download failed: {str(e)}")
+            data = None
+        
+        if data is not None and not data.empty:
+            if isinstance(data.columns, pd.MultiIndex):
+                for ticker in data.columns.get_level_values(0).unique():
+                    frames[str(ticker).strip().upper()] = data[ticker]
+            elif len(missing) == 1:
+                # Older yfinance releases return flat columns for a single ticker
+                frames[next(iter(missing))] = data
+        
+        for normalized, spellings in missing.items():
+            frame = frames.get(normalized)
+            if frame is not None:
+                frame = frame.dropna(how='all')
+            if frame is None or frame.empty or not set(required_columns).issubset(frame.columns):
+                # Whatever the batch missed goes through the per-symbol path,
+                # which caches its result and raises when Yahoo has no data
+                try:
+                    frame = self.get_price_data(spellings[0], start_date, end_date, interval)
+                except ValueError as e:
+                    print(f"Warning: {str(e)}")
+                    continue
+            else:
+                frame = frame[required_columns]
+                for symbol in spellings:
+                    set_cached_price_data(symbol, start_date, end_date, interval, frame)
+            for symbol in spellings:
+                results[symbol] = frame
+        
+        return results
+    
     def get_asset_info(self, symbol: str) -> Dict:
         """
         Get asset information from Yahoo Finance.
@@ -195,12 +284,16 @@ class YFinanceProvider(DataProvider):
         Returns:
             Asset object with price data
         """
-        # Get asset information
-        info = self.get_asset_info(symbol)
-        
         # Get price data
         price_data = self.get_price_data(symbol, start_date, end_date)
         
+        return self._build_asset(symbol, price_data)
+    
+    def _build_asset(self, symbol: str, price_data: pd.DataFrame) -> Asset:
+        """Create an Asset from Yahoo Finance info and already-fetched price data."""
+        # Get asset information
+        info = self.get_asset_info(symbol)
+        
         # Create Asset object
         asset = Asset(
             symbol=info['symbol'],
@@ -232,10 +325,23 @@ class YFinanceProvider(DataProvider):
         """
         assets = []
         
+        # One download for all price histories instead of one request per
+        # symbol; symbols the batch misses are fetched one by one
+        price_frames = self.get_price_data_batch(symbols, start_date, end_date)
+        
+        # Asset info is one blocking HTTPS request per symbol; overlap them on threads
+        futures = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(16, len(symbols)))) as executor:
+            for symbol in symbols:
+                price_data = price_frames.get(symbol)
+                if price_data is not None:
+                    futures[symbol] = executor.submit(self._build_asset, symbol, price_data)
+        
         for symbol in symbols:
             try:
-                asset = self.create_asset(symbol, start_date, end_date)
-                assets.append(asset)
+                if symbol not in futures:
+                    raise ValueError(f"No data found for symbol {symbol}")
+                assets.append(futures[symbol].result())
             except Exception as e:
                 print(f"Warning: Failed to create asset for {symbol}: {str(e)}")
                 continue
@@ -7,6 +7,8 @@ from .cache import (
     cached,
     cached_analytics,
     cached_price_fetcher,
+    get_cached_price_data,
+    set_cached_price_data,
     get_cache_stats,
     clear_cache,
     clear_expired_cache
@@ -17,6 +19,8 @@ __all__ = [
     "cached",
     "cached_analytics",
     "cached_price_fetcher",
+    "get_cached_price_data",
+    "set_cached_price_data",
     "get_cache_stats",
     "clear_cache",
     "clear_expired_cache"
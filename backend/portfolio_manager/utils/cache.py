@@ -197,11 +197,8 @@ def cached_price_fetcher(fetch_func):
     """
     @wraps(fetch_func)
     def wrapper(self, symbol, start_date=None, end_date=None, interval='1d'):
-        # Create cache key
-        cache_key = f"price_data|{symbol}|{start_date}|{end_date}|{interval}"
-        
         # Try cache first
-        cached_data = _global_cache.get(cache_key, 3600)  # 1 hour TTL
+        cached_data = get_cached_price_data(symbol, start_date, end_date, interval)
         if cached_data is not None:
             return cached_data
         
@@ -209,14 +206,35 @@ def cached_price_fetcher(fetch_func):
         data = fetch_func(self, symbol, start_date, end_date, interval)
         
         # Cache the result
-        if data is not None and not data.empty:
-            _global_cache.set(cache_key, data)
+        set_cached_price_data(symbol, start_date, end_date, interval, data)
         
         return data
     
     return wrapper
 
 
+def _price_cache_key(symbol, start_date, end_date, interval) -> str:
+    return f"price_data|{symbol}|{start_date}|{end_date}|{interval}"
+
+
+def get_cached_price_data(symbol, start_date=None, end_date=None, interval='1d',
+                          ttl: int = 3600) -> Optional[pd.DataFrame]:
+    """
+    Look up price data stored by cached_price_fetcher or a batch fetch.
+    
+    Returns:
+        Cached DataFrame or None if not found/expired
+    """
+    return _global_cache.get(_price_cache_key(symbol, start_date, end_date, interval), ttl)
+
+
+def set_cached_price_data(symbol, start_date, end_date, interval,
+                          data: Optional[pd.DataFrame]) -> None:
+    """Store non-empty price data under the same key cached_price_fetcher uses."""
+    if data is not None and not data.empty:
+        _global_cache.set(_price_cache_key(symbol, start_date, end_date, interval), data)
+
+
 # Utility functions for cache management
 def get_cache_stats() -> Dict[str, Union[int, str]]:
     """Get statistics about the global cache."""
@@ -4,11 +4,28 @@ import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.database import Base, get_db
-from app.core.security import create_access_token
+from app.core import redis_client as redis_module
+from app.core.security import create_access_token, create_refresh_token
+from app.crud import deactivate_user
 from app.models import Portfolio, User
 from main import create_application
 
 
+class InMemoryRedis:
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.values[key] = value
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+
 @pytest_asyncio.fixture
 async def bootstrap_client(tmp_path):
     database_path = tmp_path / "auth-bootstrap.db"
@@ -104,3 +121,22 @@ async def test_auth_bootstrap_requires_authentication(bootstrap_client) -> None:
     response = await client.get("/api/v1/auth/bootstrap")
 
     assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_refresh_rejects_user_deactivated_after_cached_refresh(bootstrap_client, monkeypatch) -> None:
+    client, session_factory = bootstrap_client
+    fake_redis = InMemoryRedis()
+    monkeypatch.setattr(redis_module, "_redis_client", fake_redis)
+    user, _ = await create_test_user(session_factory, with_portfolio=False)
+    refresh_token = create_refresh_token({"sub": user.username})
+
+    response = await client.post("/api/v1/auth/refresh", json={"refresh_token": refresh_token})
+    assert response.status_code == 200
+    assert fake_redis.values
+
+    async with session_factory() as session:
+        assert await deactivate_user(session, user.id) is True
+
+    response = await client.post("/api/v1/auth/refresh", json={"refresh_token": refresh_token})
+    assert response.status_code == 401
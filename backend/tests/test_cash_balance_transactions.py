@@ -1,10 +1,15 @@
+import json
+from types import SimpleNamespace
+
 import pytest
 import pytest_asyncio
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from app.api.v1 import assets as assets_api
 from app.core.database import Base
-from app.models import Asset, Portfolio, Transaction, User
+from app.mcp import handlers as mcp_handlers
+from app.models import Asset, Holding, Portfolio, Transaction, User
 from app.models.transaction import TransactionType
 from app.schemas.holding_extended import AssetSellRequest
 
@@ -18,6 +23,9 @@ class JsonRequest:
     async def json(self):
         return self._payload
 
+    async def body(self):
+        return json.dumps(self._payload).encode()
+
 
 class ExchangeService:
     async def get_exchange_rate(self, source, target):
@@ -108,7 +116,8 @@ async def test_onboarding_snapshot_does_not_mutate_cash(db_session, user_with_po
     )
 
     await db_session.refresh(portfolio)
-    assert response["assets"][0]["cash_affected"] is False
+    assert response.status_code == 201
+    assert json.loads(response.body)["assets"][0]["cash_affected"] is False
     assert portfolio.cash_balance == 1000.0
 
 
@@ -138,10 +147,116 @@ async def test_buy_mode_debits_cash_and_allows_negative_balance(
     )
 
     await db_session.refresh(portfolio)
-    assert response["assets"][0]["cash_affected"] is True
+    assert json.loads(response.body)["assets"][0]["cash_affected"] is True
     assert portfolio.cash_balance == -500.0
 
 
+@pytest.mark.asyncio
+async def test_onboarding_merges_repeated_and_existing_holdings(
+    db_session,
+    user_with_portfolio,
+    monkeypatch,
+):
+    monkeypatch.setattr(assets_api, "invalidate_portfolio_transaction_caches", noop_cache_invalidation)
+    user, portfolio = user_with_portfolio
+
+    first = await assets_api.onboard_asset(
+        JsonRequest([
+            {"ticker": "AAPL", "quantity": 2, "average_cost": 100, "asset_type": "stock", "currency": "USD"},
+            {"ticker": "AAPL", "quantity": 2, "average_cost": 200, "asset_type": "stock", "currency": "USD"},
+        ]),
+        affect_cash=False,
+        current_user=user,
+        db=db_session,
+    )
+    second = await assets_api.onboard_asset(
+        JsonRequest([
+            {"ticker": "AAPL", "quantity": 4, "average_cost": 300, "asset_type": "stock", "currency": "USD"},
+        ]),
+        affect_cash=False,
+        current_user=user,
+        db=db_session,
+    )
+
+    holdings = (
+        await db_session.scalars(select(Holding).where(Holding.portfolio_id == portfolio.id))
+    ).all()
+    assert len(holdings) == 1
+    holding = holdings[0]
+    assert holding.quantity == 8
+    assert holding.average_cost == pytest.approx(225.0)
+    assert holding.cost_basis == pytest.approx(1800.0)
+
+    entries = json.loads(first.body)["assets"] + json.loads(second.body)["assets"]
+    assert [entry["holding_id"] for entry in entries] == [holding.id] * 3
+
+    transactions = (
+        await db_session.scalars(select(Transaction).order_by(Transaction.id))
+    ).all()
+    assert [entry["transaction_id"] for entry in entries] == [txn.id for txn in transactions]
+    assert [(txn.quantity, txn.price) for txn in transactions] == [(2, 100), (2, 200), (4, 300)]
+    assert all(txn.transaction_type == TransactionType.BUY for txn in transactions)
+
+
+@pytest.mark.asyncio
+async def test_mcp_onboarding_merges_holdings_and_reports_item_errors(
+    db_session,
+    user_with_portfolio,
+    monkeypatch,
+):
+    async def noop_notify(uri):
+        return None
+
+    real_asset_info = assets_api.FinanceService.get_asset_info
+
+    async def asset_info_or_none(ticker, asset_type="stock"):
+        if ticker.upper() == "BAD":
+            return None
+        return await real_asset_info(ticker, asset_type)
+
+    monkeypatch.setattr(mcp_handlers, "notify_resource_updated", noop_notify)
+    monkeypatch.setattr(assets_api.FinanceService, "get_asset_info", asset_info_or_none)
+    user, portfolio = user_with_portfolio
+    ctx = mcp_handlers.HandlerContext(
+        db=db_session,
+        auth=SimpleNamespace(username=user.username),
+        request_id="request-1",
+        rpc_method="tools/call",
+    )
+
+    first = await mcp_handlers._onboard_assets(ctx, [
+        {"ticker": "AAPL", "quantity": 2, "average_cost": 100},
+        {"ticker": "AAPL", "quantity": 2, "average_cost": 200},
+    ])
+    # The second ZERO row divides by a zero merged quantity; only that item fails
+    second = await mcp_handlers._onboard_assets(ctx, [
+        {"ticker": "AAPL", "quantity": 4, "average_cost": 300},
+        {"ticker": "BAD", "quantity": 1, "average_cost": 1},
+        {"ticker": "ZERO", "quantity": 0, "average_cost": 10},
+        {"ticker": "ZERO", "quantity": 0, "average_cost": 20},
+    ])
+
+    assert first["errors"] == []
+    assert second["errors"][0] == "Could not fetch data for ticker: BAD"
+    assert second["errors"][1].startswith("Error processing ZERO:")
+    assert len(second["errors"]) == 2
+
+    holding = await db_session.scalar(
+        select(Holding).where(Holding.portfolio_id == portfolio.id, Holding.ticker == "AAPL")
+    )
+    assert holding.quantity == 8
+    assert holding.average_cost == pytest.approx(225.0)
+    assert holding.cost_basis == pytest.approx(1800.0)
+
+    entries = first["assets"] + second["assets"]
+    assert [entry["ticker"] for entry in entries] == ["AAPL", "AAPL", "AAPL", "ZERO"]
+    transactions = (
+        await db_session.scalars(select(Transaction).order_by(Transaction.id))
+    ).all()
+    assert [entry["transaction_id"] for entry in entries] == [txn.id for txn in transactions]
+    assert [(txn.quantity, txn.price) for txn in transactions] == [(2, 100), (2, 200), (4, 300), (0, 10)]
+
+
 @pytest.mark.asyncio
 async def test_buy_and_sell_apply_currency_conversion(
     db_session,
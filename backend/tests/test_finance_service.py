@@ -1,3 +1,4 @@
+import asyncio
 from datetime import date, datetime
 from urllib.parse import quote
 
@@ -372,3 +373,44 @@ async def test_calculate_ticker_performance_uses_barchart_history_for_mutual_fun
     assert result["one_month_return"] == 9.09
     assert result["three_month_return"] == 14.29
     assert result["one_year_return"] == 50.0
+
+
+@pytest.mark.asyncio
+async def test_get_asset_info_shares_fetches_and_caches_only_successes(monkeypatch) -> None:
+    monkeypatch.setattr(FinanceService, "_asset_info_cache", {})
+    monkeypatch.setattr(FinanceService, "_asset_info_inflight", {})
+    calls = []
+
+    async def fake_stock_info(ticker, asset_type=None):
+        calls.append(ticker.upper())
+        await asyncio.sleep(0)
+        if ticker.upper() == "MISSING":
+            return None
+        return {"ticker": ticker.upper(), "current_price": 10.0}
+
+    monkeypatch.setattr(FinanceService, "_get_stock_info", staticmethod(fake_stock_info))
+
+    # Concurrent misses share one upstream fetch
+    first, second = await asyncio.gather(
+        FinanceService.get_asset_info("AAPL"),
+        FinanceService.get_asset_info("aapl"),
+    )
+    assert calls == ["AAPL"]
+    assert first == second == {"ticker": "AAPL", "current_price": 10.0}
+    assert FinanceService._asset_info_inflight == {}
+
+    # Every caller gets its own copy
+    assert first is not second
+    first["currency"] = "CAD"
+    cached = await FinanceService.get_asset_info("AAPL")
+    assert calls == ["AAPL"]
+    assert "currency" not in cached
+
+    # Failed lookups are retried rather than cached
+    assert await FinanceService.get_asset_info("MISSING") is None
+    assert await FinanceService.get_asset_info("MISSING") is None
+    assert calls == ["AAPL", "MISSING", "MISSING"]
+
+    FinanceService.invalidate_asset_info("aapl")
+    await FinanceService.get_asset_info("AAPL")
+    assert calls == ["AAPL", "MISSING", "MISSING", "AAPL"]
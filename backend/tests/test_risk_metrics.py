@@ -0,0 +1,196 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.optimize import minimize
+from sklearn.covariance import ledoit_wolf
+
+from portfolio_manager.analytics import risk_metrics
+from portfolio_manager.analytics.optimization import PortfolioOptimizer
+
+
+def _returns(n_obs, n_assets, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(0.001, 0.02, size=(n_obs, n_assets))
+
+
+@pytest.mark.parametrize("n_obs, n_assets", [(250, 4), (8, 12)])
+def test_ledoit_wolf_cov_matches_sklearn_rescaled_to_unbiased(n_obs, n_assets):
+    x = _returns(n_obs, n_assets)
+
+    shrunk = risk_metrics.ledoit_wolf_cov(x)
+
+    reference, _ = ledoit_wolf(x)
+    np.testing.assert_allclose(shrunk, reference*n_obs/(n_obs - 1), rtol=1e-10)
+    assert np.linalg.eigvalsh(shrunk).min() > 0
+
+
+def test_ledoit_wolf_cov_keeps_dataframe_labels():
+    r = pd.DataFrame(_returns(60, 3), columns=["A", "B", "C"])
+
+    shrunk = risk_metrics.ledoit_wolf_cov(r)
+
+    assert list(shrunk.index) == list(shrunk.columns) == ["A", "B", "C"]
+
+
+def test_ledoit_wolf_cov_of_constant_returns_is_zero():
+    x = np.full((30, 3), 0.01)
+
+    shrunk = risk_metrics.ledoit_wolf_cov(x)
+
+    assert np.isfinite(shrunk).all()
+    np.testing.assert_allclose(shrunk, np.zeros((3, 3)), atol=1e-20)
+
+
+# Three assets whose unconstrained tangency and minimum-variance portfolios are
+# long-only, so the closed forms apply
+VOLS = np.array([0.15, 0.20, 0.25])
+CORR = np.array([[1.0, 0.3, 0.2], [0.3, 1.0, 0.4], [0.2, 0.4, 1.0]])
+COV = np.outer(VOLS, VOLS)*CORR
+ER = np.array([0.08, 0.10, 0.12])
+
+
+def _slsqp_msr(riskfree_rate, er, cov):
+    n = er.shape[0]
+    result = minimize(
+        lambda w: -(w @ er - riskfree_rate)/np.sqrt(w @ cov @ w),
+        np.repeat(1/n, n),
+        method="SLSQP",
+        bounds=((0.0, 1.0),)*n,
+        constraints=({"type": "eq", "fun": lambda w: w.sum() - 1},),
+        options={"ftol": 1e-12},
+    )
+    return result.x
+
+
+def _sharpe(w, riskfree_rate, er, cov):
+    return (w @ er - riskfree_rate)/np.sqrt(w @ cov @ w)
+
+
+@pytest.mark.parametrize("use_factor", [False, True])
+def test_msr_closed_form_matches_slsqp(use_factor):
+    cov_factor = risk_metrics.cov_cholesky(COV) if use_factor else None
+
+    weights = risk_metrics.msr(0.02, ER, COV, cov_factor=cov_factor)
+
+    np.testing.assert_allclose(weights, _slsqp_msr(0.02, ER, COV), atol=1e-4)
+    assert weights.sum() == pytest.approx(1.0)
+
+
+def test_gmv_closed_form_matches_slsqp():
+    weights = risk_metrics.gmv(COV)
+
+    reference = minimize(
+        lambda w: w @ COV @ w,
+        np.repeat(1/3, 3),
+        method="SLSQP",
+        bounds=((0.0, 1.0),)*3,
+        constraints=({"type": "eq", "fun": lambda w: w.sum() - 1},),
+        options={"ftol": 1e-14},
+    ).x
+    np.testing.assert_allclose(weights, reference, atol=1e-4)
+
+
+def test_msr_falls_back_to_slsqp_when_bounds_are_active():
+    # A low-return asset gets a negative unconstrained tangency weight
+    er = np.array([0.08, 0.03, 0.12])
+    assert risk_metrics._tangency_weights(COV, er - 0.02) is None
+
+    weights = risk_metrics.msr(0.02, er, COV)
+
+    assert weights.min() >= 0
+    assert weights.sum() == pytest.approx(1.0)
+    assert _sharpe(weights, 0.02, er, COV) == pytest.approx(_sharpe(_slsqp_msr(0.02, er, COV), 0.02, er, COV), rel=1e-6)
+
+
+def test_msr_falls_back_to_slsqp_when_denominator_is_not_positive():
+    # Every excess return is negative, so the stationary point minimizes the Sharpe ratio
+    assert risk_metrics._tangency_weights(COV, ER - 0.20) is None
+
+    weights = risk_metrics.msr(0.20, ER, COV)
+
+    assert weights.min() >= 0
+    assert weights.sum() == pytest.approx(1.0)
+    assert _sharpe(weights, 0.20, ER, COV) == pytest.approx(_sharpe(_slsqp_msr(0.20, ER, COV), 0.20, ER, COV), rel=1e-6)
+
+
+def test_optimal_weights_two_fund_points_match_slsqp(monkeypatch):
+    slsqp_targets = []
+    minimize_vol = risk_metrics.minimize_vol
+
+    def counting_minimize_vol(target_return, er, cov, init_guess=None):
+        slsqp_targets.append(target_return)
+        return minimize_vol(target_return, er, cov, init_guess=init_guess)
+
+    monkeypatch.setattr(risk_metrics, "CVXPY_AVAILABLE", False)
+    monkeypatch.setattr(risk_metrics, "minimize_vol", counting_minimize_vol)
+
+    weights = risk_metrics.optimal_weights(9, ER, COV)
+
+    # The end points sit on the bounds; the interior ones come from the closed form
+    assert 0 < len(slsqp_targets) < 9
+    for target_return, w in zip(np.linspace(ER.min(), ER.max(), 9), weights):
+        assert w.min() >= 0
+        assert w.sum() == pytest.approx(1.0)
+        assert w @ ER == pytest.approx(target_return, abs=1e-6)
+        reference = minimize_vol(target_return, ER, COV)
+        assert risk_metrics.portfolio_vol(w, COV) == pytest.approx(
+            risk_metrics.portfolio_vol(reference, COV), rel=1e-4
+        )
+
+
+class _ReturnsAsset:
+    def __init__(self, symbol, returns):
+        self.symbol = symbol
+        self._returns = returns
+
+    def get_returns(self, start_date=None, end_date=None):
+        return self._returns
+
+
+def test_portfolio_optimizer_max_sharpe_closed_form_matches_slsqp():
+    rng = np.random.default_rng(7)
+    index = pd.date_range("2024-01-01", periods=500, freq="B")
+    chol = np.linalg.cholesky(COV/252)
+    daily = ER/252 + rng.standard_normal((500, 3)) @ chol.T
+    # Pin the sample means to ER so the tangency portfolio stays long-only
+    daily = daily - daily.mean(axis=0) + ER/252
+    assets = [_ReturnsAsset(symbol, pd.Series(daily[:, i], index=index)) for i, symbol in enumerate("ABC")]
+
+    closed = PortfolioOptimizer(assets).mean_variance_optimization()
+    # Any extra constraint disables the closed form and forces SLSQP
+    solved = PortfolioOptimizer(assets).mean_variance_optimization(
+        constraints=[{"type": "ineq", "fun": lambda w: 1.0}]
+    )
+
+    assert closed["optimization_message"] == "Closed-form tangency solution"
+    assert solved["optimization_message"] != "Closed-form tangency solution"
+    for symbol in "ABC":
+        assert closed["weights"][symbol] == pytest.approx(solved["weights"][symbol], abs=1e-3)
+    assert closed["expected_sharpe"] >= solved["expected_sharpe"] - 1e-6
+
+
+def test_gbm_correlated_step_returns_match_drift_and_covariance():
+    mu = np.array([0.06, 0.09, 0.12])
+    prices = risk_metrics.gbm_correlated(
+        mu, COV, n_years=2, n_scenarios=20000, steps_per_year=12, s_0=[10.0, 20.0, 30.0],
+        rng=np.random.default_rng(42),
+    )
+
+    assert prices.shape == (25, 20000, 3)
+    np.testing.assert_array_equal(prices[0], np.tile([10.0, 20.0, 30.0], (20000, 1)))
+    step_returns = (prices[1:]/prices[:-1] - 1).reshape(-1, 3)
+    np.testing.assert_allclose(step_returns.mean(axis=0), (1 + mu)**(1/12) - 1, atol=3e-4)
+    np.testing.assert_allclose(np.cov(step_returns, rowvar=False), COV/12, rtol=0.02, atol=2e-5)
+
+
+def test_gbm_correlated_weights_give_buy_and_hold_portfolio_values():
+    weights = np.array([0.5, 0.3, 0.2])
+    prices = risk_metrics.gbm_correlated(ER, COV, n_years=1, n_scenarios=50, s_0=1.0,
+                                         rng=np.random.default_rng(3))
+
+    values = risk_metrics.gbm_correlated(ER, COV, n_years=1, n_scenarios=50, s_0=1000.0, weights=weights,
+                                         rng=np.random.default_rng(3))
+
+    assert values.shape == (13, 50)
+    np.testing.assert_allclose(values, 1000.0*(prices @ weights))
+    np.testing.assert_allclose(values[0], 1000.0)